@@ -0,0 +1,213 @@
+import mimetypes
+import os
+import re
+from pathlib import Path
+from typing import Iterator, Tuple
+
+from django.conf import settings
+from django.http import (
+    FileResponse,
+    Http404,
+    HttpResponse,
+    StreamingHttpResponse,
+)
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe
+
+
+# ============================================================
+# CONSTANTS
+# ============================================================
+
+# Read size when Python streams a byte range
+STREAM_BLOCK_SIZE = 256 * 1024
+
+# Browser cache lifetime; afterwards the ETag makes revalidation a 304
+MEDIA_MAX_AGE = 3600
+
+BYTE_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+# ============================================================
+# DOMAIN: byte ranges (pure)
+# ============================================================
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def parse_byte_range(header: str, size: int) -> Tuple[int, int] | None:
+    """
+    (first, last) byte of a single-range Range header, inclusive.
+
+    None means "serve the whole file": no header, or a form that is
+    invalid (first > last) or not supported (multiple ranges), which
+    RFC 9110 allows a server to ignore. An empty file has no
+    satisfiable range.
+    """
+
+    match = BYTE_RANGE.match(header.strip()) if header else None
+    if match is None:
+        return None
+
+    first, last = match.groups()
+    if not first and not last:
+        return None
+
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0 or size == 0:
+            raise RangeNotSatisfiable()
+        return max(0, size - length), size - 1
+
+    first = int(first)
+    if last and int(last) < first:
+        return None
+
+    if first >= size:
+        raise RangeNotSatisfiable()
+    last = min(int(last), size - 1) if last else size - 1
+    return first, last
+
+
+def file_etag(stat: os.stat_result) -> str:
+    return f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+
+
+def iter_file_range(
+    path: Path,
+    first: int,
+    length: int,
+    block_size: int = STREAM_BLOCK_SIZE,
+) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        f.seek(first)
+        remaining = length
+        while remaining > 0:
+            block = f.read(min(block_size, remaining))
+            if not block:
+                break
+            remaining -= len(block)
+            yield block
+
+
+# ============================================================
+# INFRASTRUCTURE (HTTP responses)
+# ============================================================
+
+def sendfile_response(path: Path) -> HttpResponse | None:
+    """
+    Hand the file to the front server when MEDIA_SENDFILE is configured.
+
+    settings.MEDIA_SENDFILE = {"HEADER": "X-Accel-Redirect",
+    "URL_PREFIX": "/protected-media/"} for nginx (internal location
+    aliased to MEDIA_ROOT), or {"HEADER": "X-Sendfile"} for Apache /
+    lighttpd. The server then handles Range requests and zero-copy I/O.
+    """
+
+    config = getattr(settings, "MEDIA_SENDFILE", None)
+    if not config:
+        return None
+
+    header = config["HEADER"]
+    if header == "X-Accel-Redirect":
+        try:
+            relative = path.resolve().relative_to(
+                Path(settings.MEDIA_ROOT).resolve()
+            )
+        except ValueError:
+            # Outside MEDIA_ROOT: nginx cannot map it, stream it ourselves
+            return None
+        prefix = config.get("URL_PREFIX", "/protected-media/")
+        value = prefix + relative.as_posix()
+    else:
+        value = str(path)
+
+    response = HttpResponse()
+    response[header] = value
+    # Let the front server detect the type
+    del response["Content-Type"]
+    return response
+
+
+def media_file_response(request, path: str | Path) -> HttpResponse:
+    """
+    Serve a media file with conditional GET and single byte ranges.
+
+    Whole files go through FileResponse, which uses wsgi.file_wrapper
+    (sendfile under gunicorn / uWSGI). Ranges stream only the requested
+    slice, so seeking in a clip never reads the whole file in Python.
+    """
+
+    path = Path(path)
+    try:
+        stat = path.stat()
+    except OSError:
+        raise Http404("Файл не найден.")
+
+    etag = file_etag(stat)
+    last_modified = int(stat.st_mtime)
+
+    not_modified = get_conditional_response(
+        request, etag=etag, last_modified=last_modified
+    )
+    if not_modified is not None:
+        return not_modified
+
+    response = sendfile_response(path)
+    if response is None:
+        response = streamed_file_response(request, path, stat.st_size, etag)
+
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    response["Cache-Control"] = f"private, max-age={MEDIA_MAX_AGE}"
+    response["Accept-Ranges"] = "bytes"
+    return response
+
+
+def streamed_file_response(
+    request,
+    path: Path,
+    size: int,
+    etag: str,
+) -> HttpResponse:
+    content_type = mimetypes.guess_type(path.name)[0]
+    content_type = content_type or "application/octet-stream"
+
+    range_header = request.headers.get("Range")
+    if_range = request.headers.get("If-Range")
+    if range_header and if_range and not if_range_matches(
+        if_range, etag, path
+    ):
+        # The client's cached copy is stale: send the whole file
+        range_header = None
+
+    try:
+        byte_range = parse_byte_range(range_header, size)
+    except RangeNotSatisfiable:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+        return response
+
+    if byte_range is None:
+        return FileResponse(open(path, "rb"), content_type=content_type)
+
+    first, last = byte_range
+    length = last - first + 1
+
+    response = StreamingHttpResponse(
+        iter_file_range(path, first, length),
+        status=206,
+        content_type=content_type,
+    )
+    response["Content-Length"] = str(length)
+    response["Content-Range"] = f"bytes {first}-{last}/{size}"
+    return response
+
+
+def if_range_matches(if_range: str, etag: str, path: Path) -> bool:
+    if if_range.startswith(('"', 'W/"')):
+        return if_range == etag
+    modified = parse_http_date_safe(if_range)
+    return modified is not None and int(path.stat().st_mtime) <= modified
@@ -0,0 +1,126 @@
+from typing import List, Tuple
+from uuid import UUID
+
+from django.shortcuts import get_object_or_404
+
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.exceptions import NotFound, ValidationError
+
+from apps.competitions.models import Match
+
+from apps.analytics.services.heatmaps import (
+    DEFAULT_GRID,
+    MAX_GRID_BINS,
+    build_heatmap,
+)
+
+
+def parse_uuid(value: str | None, name: str) -> UUID | None:
+    if not value:
+        return None
+    try:
+        return UUID(value)
+    except ValueError:
+        raise ValidationError(f"Invalid UUID format for {name}: {value}")
+
+
+def parse_grid(value: str | None) -> Tuple[int, int]:
+    if not value:
+        return DEFAULT_GRID
+    try:
+        x_bins, y_bins = (int(v) for v in value.lower().split("x"))
+    except ValueError:
+        raise ValidationError("grid must look like 12x8")
+
+    if not (0 < x_bins <= MAX_GRID_BINS and 0 < y_bins <= MAX_GRID_BINS):
+        raise ValidationError(f"grid bins must be between 1 and {MAX_GRID_BINS}")
+
+    return x_bins, y_bins
+
+
+def heatmap_response(request, match_ids: List[UUID]) -> Response:
+    params = request.query_params
+
+    grid = parse_grid(params.get("grid"))
+    event_types = params.get("event_types")
+    period = params.get("period")
+
+    if period is not None:
+        try:
+            period = int(period)
+        except ValueError:
+            raise ValidationError("period must be an integer")
+
+    cells = build_heatmap(
+        match_ids,
+        grid=grid,
+        team_id=parse_uuid(params.get("team_id"), "team_id"),
+        player_id=parse_uuid(params.get("player_id"), "player_id"),
+        event_types=event_types.split(",") if event_types else None,
+        period=period,
+    )
+
+    return Response({
+        "grid": {"x_bins": grid[0], "y_bins": grid[1]},
+        "matches_count": len(match_ids),
+        "total": int(cells.sum()),
+        "max": int(cells.max()) if cells.size else 0,
+        # cells[x_bin][y_bin], x along pitch length
+        "cells": cells.tolist(),
+    })
+
+
+class MatchHeatmapAPIView(APIView):
+    """
+    GET /api/analytics/matches/<match_id>/heatmap/
+        ?team_id=&player_id=&event_types=pass,shot&period=&grid=12x8
+    """
+
+    permission_classes = []
+
+    def get(self, request, match_id: UUID):
+        match = get_object_or_404(Match, id=match_id)
+        return heatmap_response(request, [match.id])
+
+
+class HeatmapAPIView(APIView):
+    """
+    GET /api/analytics/heatmaps/?season_id= | ?match_ids=
+        &team_id=&player_id=&event_types=&period=&grid=
+
+    Multi-match (season) heatmap: per-match grids summed together.
+    """
+
+    permission_classes = []
+
+    def get(self, request):
+        season_id = parse_uuid(request.query_params.get("season_id"), "season_id")
+        match_ids = [
+            parse_uuid(mid, "match_ids")
+            for mid in request.query_params.getlist("match_ids")
+            if mid and mid.strip()
+        ]
+
+        if season_id:
+            match_ids = list(
+                Match.objects
+                .filter(season_id=season_id)
+                .values_list("id", flat=True)
+            )
+        elif not match_ids:
+            raise ValidationError("season_id or match_ids[] is required")
+        else:
+            # Unknown ids would get columnar files built on disk
+            known = set(
+                Match.objects
+                .filter(id__in=match_ids)
+                .values_list("id", flat=True)
+            )
+            unknown = [mid for mid in match_ids if mid not in known]
+            if unknown:
+                raise NotFound(
+                    "Matches not found: " + ", ".join(map(str, unknown))
+                )
+
+        return heatmap_response(request, match_ids)
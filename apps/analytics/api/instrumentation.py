@@ -0,0 +1,47 @@
+from django.conf import settings
+
+from rest_framework.permissions import BasePermission
+from rest_framework.views import APIView
+from rest_framework.response import Response
+
+from apps.analytics.instrumentation import (
+    get_rolling_stats,
+    instrumentation_settings,
+)
+
+
+class IsStaffOrDebug(BasePermission):
+    """
+    Stats expose SQL text: staff only, except in DEBUG.
+    """
+
+    def has_permission(self, request, view):
+        return settings.DEBUG or bool(
+            request.user and request.user.is_staff
+        )
+
+
+class InstrumentationStatsAPIView(APIView):
+    """
+    GET /api/analytics/instrumentation/stats/
+    DELETE resets the rolling window.
+
+    Rolling per-route timings of this process only.
+    """
+
+    permission_classes = [IsStaffOrDebug]
+
+    def get(self, request):
+        config = instrumentation_settings()
+        if not config["ENABLED"]:
+            return Response({"enabled": False, "routes": {}})
+
+        return Response({
+            "enabled": True,
+            "window": config["WINDOW"],
+            "routes": get_rolling_stats().snapshot(),
+        })
+
+    def delete(self, request):
+        get_rolling_stats().clear()
+        return Response(status=204)
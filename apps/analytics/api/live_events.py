@@ -0,0 +1,46 @@
+from uuid import UUID
+
+from django.shortcuts import get_object_or_404
+
+from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.exceptions import ValidationError
+
+from apps.competitions.models import Match
+from config.permissions import IsAnalyst
+
+from apps.analytics.serializers.live_events import LiveEventBatchSerializer
+from apps.analytics.services.live_match import ingest_live_events
+
+
+class LiveEventsAPIView(APIView):
+    """
+    POST /api/analytics/matches/<match_id>/live/events/
+        {"events": [{"team_id", "event_type", "period", "timestamp_ms",
+                     "x", "y", ...}, ...]}
+
+    Appends a batch of events to a match in progress and returns the
+    updated running aggregates. Analysts only: the events feed every
+    derived table and the live stream.
+    """
+
+    permission_classes = [IsAnalyst]
+
+    def post(self, request, match_id: UUID):
+        match = get_object_or_404(Match, id=match_id)
+
+        if match.status != Match.Status.IN_PROGRESS:
+            raise ValidationError("Матч не находится в статусе «в игре».")
+
+        serializer = LiveEventBatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            result = ingest_live_events(
+                match.id, serializer.validated_data["events"]
+            )
+        except ValueError as exc:
+            raise ValidationError(str(exc))
+
+        return Response(result, status=status.HTTP_201_CREATED)
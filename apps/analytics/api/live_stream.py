@@ -0,0 +1,70 @@
+import asyncio
+import json
+from uuid import UUID
+
+from asgiref.sync import sync_to_async
+from django.http import Http404, StreamingHttpResponse
+
+from apps.competitions.models import Match
+
+from apps.analytics.services.live_broadcast import live_broadcaster
+from apps.analytics.services.live_match import current_live_overview
+
+
+# Comment line sent when nothing changed, keeps proxies from timing out
+KEEPALIVE_SECONDS = 15
+
+
+def sse_message(event: str, payload) -> str:
+    return f"event: {event}\ndata: {json.dumps(payload, default=str)}\n\n"
+
+
+async def live_overview_events(match_id: UUID):
+    """
+    Full snapshot first, then only changed overview values.
+    """
+
+    subscriber = live_broadcaster.subscribe(match_id)
+
+    try:
+        snapshot = await sync_to_async(current_live_overview)(match_id)
+        yield "retry: 3000\n\n"
+        yield sse_message("snapshot", snapshot)
+
+        while True:
+            try:
+                message = await asyncio.wait_for(
+                    subscriber.queue.get(), KEEPALIVE_SECONDS
+                )
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+
+            if "snapshot" in message:
+                yield sse_message("snapshot", message["snapshot"])
+            else:
+                yield sse_message("delta", message["delta"])
+    finally:
+        live_broadcaster.unsubscribe(match_id, subscriber)
+
+
+async def live_match_stream(request, match_id: UUID):
+    """
+    GET /api/analytics/matches/<match_id>/live/stream/
+
+    Server-sent events of a match in progress (served through ASGI).
+    Events: "snapshot" (full live overview) and "delta" (changed values:
+    possession, turnovers, tempo, EPI averages, xT, ...).
+    """
+
+    match = await Match.objects.filter(id=match_id).afirst()
+    if match is None or match.status != Match.Status.IN_PROGRESS:
+        raise Http404("Матч не найден или не находится в игре.")
+
+    response = StreamingHttpResponse(
+        live_overview_events(match.id),
+        content_type="text/event-stream",
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
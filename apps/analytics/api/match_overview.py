@@ -76,6 +76,9 @@ class MatchOverviewAPIView(APIView):
                     "epi_avg": analytics["teams"]
                     .get(side, {})
                     .get("epi_avg"),
+                    "xt": analytics["teams"]
+                    .get(side, {})
+                    .get("xt", 0.0),
                     "tempo": analytics["tempo"],
                 },
                 "confidence": "high",
@@ -94,6 +97,7 @@ class MatchOverviewAPIView(APIView):
                 "away": 0,
             },
             "teams": teams_block,
+            "momentum": analytics["momentum"],
             "key_insights": [],  # подключим позже из services
             "top_players": [],
             "limitations": [
@@ -0,0 +1,74 @@
+from uuid import UUID
+
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.exceptions import NotFound, ValidationError
+
+from apps.competitions.models import Match, MatchTeam
+from apps.players.models import Player
+
+from apps.analytics.services.pass_network import build_pass_network
+
+
+class TeamPassNetworkAPIView(APIView):
+    """
+    GET /api/analytics/teams/<team_id>/pass-network/?match_ids=&min_passes=
+    """
+
+    permission_classes = []
+
+    def get(self, request, team_id: UUID):
+        match_ids = [
+            mid for mid in request.query_params.getlist("match_ids")
+            if mid and mid.strip()
+        ]
+
+        if not match_ids:
+            raise ValidationError("match_ids[] is required (at least one match_id)")
+
+        try:
+            match_uuids = [UUID(mid) for mid in match_ids]
+            min_passes = int(request.query_params.get("min_passes", 1))
+        except ValueError as e:
+            raise ValidationError(f"Invalid parameter: {str(e)}")
+
+        # Unknown ids would get columnar files built on disk
+        known = set(
+            Match.objects
+            .filter(id__in=match_uuids)
+            .values_list("id", flat=True)
+        )
+        unknown = [mid for mid in match_uuids if mid not in known]
+        if unknown:
+            raise NotFound(
+                "Matches not found: " + ", ".join(map(str, unknown))
+            )
+
+        played = set(
+            MatchTeam.objects
+            .filter(team_id=team_id, match_id__in=match_uuids)
+            .values_list("match_id", flat=True)
+        )
+        missing = [mid for mid in match_uuids if mid not in played]
+        if missing:
+            raise NotFound(
+                f"Team {team_id} did not play in: "
+                + ", ".join(map(str, missing))
+            )
+
+        network = build_pass_network(
+            team_id=team_id,
+            match_ids=match_uuids,
+            min_passes=min_passes,
+        )
+
+        names = {
+            str(p["id"]): f"{p['first_name']} {p['last_name']}"
+            for p in Player.objects
+            .filter(id__in=[n["player_id"] for n in network["players"]])
+            .values("id", "first_name", "last_name")
+        }
+        for node in network["players"]:
+            node["full_name"] = names.get(node["player_id"])
+
+        return Response(network)
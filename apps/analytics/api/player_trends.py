@@ -0,0 +1,93 @@
+from datetime import date
+from uuid import UUID
+
+from django.shortcuts import get_object_or_404
+
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.exceptions import ValidationError
+
+from apps.players.models import Player
+
+from apps.analytics.services.player_trends import (
+    DEFAULT_MAX_POINTS,
+    TREND_METRICS,
+    build_player_trends,
+)
+
+
+MAX_POINTS_LIMIT = 500
+
+
+def parse_date(value: str | None, name: str) -> date | None:
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise ValidationError(f"{name} must be a date (YYYY-MM-DD)")
+
+
+def parse_metrics(value: str | None):
+    if not value:
+        return None
+
+    metrics = [m.strip() for m in value.split(",") if m.strip()]
+    unknown = [m for m in metrics if m not in TREND_METRICS]
+    if unknown:
+        raise ValidationError(
+            f"Unknown metrics: {', '.join(unknown)}. "
+            f"Available: {', '.join(TREND_METRICS)}"
+        )
+    return metrics
+
+
+def parse_max_points(value: str | None) -> int:
+    if not value:
+        return DEFAULT_MAX_POINTS
+    try:
+        max_points = int(value)
+    except ValueError:
+        raise ValidationError("max_points must be an integer")
+
+    if not 1 <= max_points <= MAX_POINTS_LIMIT:
+        raise ValidationError(
+            f"max_points must be between 1 and {MAX_POINTS_LIMIT}"
+        )
+    return max_points
+
+
+class PlayerTrendsAPIView(APIView):
+    """
+    GET /api/analytics/players/<player_id>/trends/
+        ?from=2024-01-01&to=2024-06-30&metrics=passes,xt&max_points=50
+
+    Reads pre-aggregated PlayerMatchMetric rows; long ranges are
+    downsampled to bucket means.
+    """
+
+    permission_classes = []
+
+    def get(self, request, player_id: UUID):
+        player = get_object_or_404(Player, id=player_id)
+        params = request.query_params
+
+        date_from = parse_date(params.get("from"), "from")
+        date_to = parse_date(params.get("to"), "to")
+        if date_from and date_to and date_from > date_to:
+            raise ValidationError("from must not be after to")
+
+        trends = build_player_trends(
+            player.id,
+            metrics=parse_metrics(params.get("metrics")),
+            date_from=date_from,
+            date_to=date_to,
+            max_points=parse_max_points(params.get("max_points")),
+        )
+
+        return Response({
+            "player_id": str(player.id),
+            "from": date_from.isoformat() if date_from else None,
+            "to": date_to.isoformat() if date_to else None,
+            "trends": trends,
+        })
@@ -0,0 +1,174 @@
+from uuid import UUID
+
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.exceptions import ValidationError
+
+from apps.analytics.api.file_responses import media_file_response
+from apps.analytics.models import VideoClip, VideoUpload
+from apps.analytics.services.clip_index import get_match_clip_index
+
+
+CLIP_LIST_FIELDS = [
+    "id",
+    "event_id",
+    "clip_type",
+    "title",
+    "description",
+    "duration_seconds",
+    "start_time_seconds",
+    "end_time_seconds",
+    "timestamp_ms",
+    "confidence",
+    "file_size",
+]
+
+
+# Fields of a clip as held by the match clip index
+CLIP_INDEX_FIELDS = [
+    "id",
+    "event_id",
+    "clip_type",
+    "title",
+    "duration_seconds",
+    "start_time_seconds",
+    "end_time_seconds",
+    "timestamp_ms",
+    "confidence",
+    "period",
+    "start_ms",
+    "end_ms",
+]
+
+
+def clip_payload(request, clip: dict) -> dict:
+    return {
+        **clip,
+        "video_url": request.build_absolute_uri(
+            reverse("clip-video", args=[clip["id"]])
+        ),
+        "thumbnail_url": request.build_absolute_uri(
+            reverse("clip-thumbnail", args=[clip["id"]])
+        ),
+    }
+
+
+class VideoClipsListAPIView(APIView):
+    """
+    GET /api/analytics/videos/<video_id>/clips/
+    """
+
+    permission_classes = []
+
+    def get(self, request, video_id: UUID):
+        upload = get_object_or_404(VideoUpload, id=video_id)
+
+        clips = (
+            VideoClip.objects
+            .filter(video_upload_id=upload.id)
+            .order_by("start_time_seconds")
+            .values(*CLIP_LIST_FIELDS)
+        )
+
+        return Response({
+            "video_id": str(upload.id),
+            "clips": [clip_payload(request, clip) for clip in clips],
+        })
+
+
+def parse_int(value: str | None, name: str) -> int | None:
+    if value in (None, ""):
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise ValidationError(f"{name} must be an integer")
+
+
+class VideoClipsByTypeAPIView(APIView):
+    """
+    GET /api/analytics/videos/<video_id>/clips/by-type/
+        ?types=goal,shot&period=2&from_ms=3600000&to_ms=3900000
+
+    Clips grouped by type, optionally limited to those overlapping a
+    match-time window (answered by the match clip interval index).
+    """
+
+    permission_classes = []
+
+    def get(self, request, video_id: UUID):
+        upload = get_object_or_404(VideoUpload, id=video_id)
+        params = request.query_params
+
+        types = params.get("types")
+        types = [t for t in types.split(",") if t] if types else None
+        unknown = set(types or []) - set(VideoClip.ClipType.values)
+        if unknown:
+            raise ValidationError(
+                f"Unknown clip types: {', '.join(sorted(unknown))}"
+            )
+
+        from_ms = parse_int(params.get("from_ms"), "from_ms")
+        to_ms = parse_int(params.get("to_ms"), "to_ms")
+        if from_ms is not None and to_ms is not None and from_ms > to_ms:
+            raise ValidationError("from_ms must not exceed to_ms")
+
+        clips = []
+        if upload.match_id is not None:
+            clips = get_match_clip_index(upload.match_id).find(
+                period=parse_int(params.get("period"), "period"),
+                from_ms=from_ms,
+                to_ms=to_ms,
+                clip_types=types,
+                upload_id=upload.id,
+            )
+
+        grouped = {clip_type: [] for clip_type in types or []}
+        for clip in clips:
+            grouped.setdefault(clip["clip_type"], []).append(
+                clip_payload(request, {
+                    name: clip[name] for name in CLIP_INDEX_FIELDS
+                })
+            )
+
+        return Response({
+            "video_id": str(upload.id),
+            "clips_by_type": grouped,
+        })
+
+
+class VideoClipVideoAPIView(APIView):
+    """
+    GET /api/analytics/clips/<clip_id>/video/
+
+    Supports Range (206) for seeking and conditional GET (304).
+    """
+
+    permission_classes = []
+
+    def get(self, request, clip_id: UUID):
+        clip = get_object_or_404(
+            VideoClip.objects.only("file_path"), id=clip_id
+        )
+        return media_file_response(request, clip.file_path)
+
+
+class VideoClipThumbnailAPIView(APIView):
+    """
+    GET /api/analytics/clips/<clip_id>/thumbnail/
+    """
+
+    permission_classes = []
+
+    def get(self, request, clip_id: UUID):
+        clip = get_object_or_404(
+            VideoClip.objects
+            .only("thumbnail_path")
+            .exclude(thumbnail_path=""),
+            id=clip_id,
+            thumbnail_path__isnull=False,
+        )
+        return media_file_response(request, clip.thumbnail_path)
@@ -6,9 +6,5 @@ class AnalyticsConfig(AppConfig):
     name = "apps.analytics"
     label = "analytics"
 
-
-
-
-
-
-
+    def ready(self):
+        from apps.analytics import jobs, signals  # noqa: F401
@@ -4,6 +4,8 @@ from uuid import UUID
 from django.apps import apps
 from django.db.models import Sum
 
+from apps.analytics.instrumentation import query_budget, traced
+
 
 # ============================================================
 # CONSTANTS (Domain knowledge)
@@ -55,6 +57,8 @@ def calculate_team_load(
 # INFRASTRUCTURE (Django ORM)
 # ============================================================
 
+@traced
+@query_budget(1)
 def load_team_minutes(team_id: UUID, matches) -> int:
     Appearance = apps.get_model("players", "Appearance")
 
@@ -66,6 +70,8 @@ def load_team_minutes(team_id: UUID, matches) -> int:
     )
 
 
+@traced
+@query_budget(1)
 def load_players_used(team_id: UUID, matches) -> int:
     Appearance = apps.get_model("players", "Appearance")
 
@@ -82,6 +88,7 @@ def load_players_used(team_id: UUID, matches) -> int:
     )
 
 
+@query_budget(1)
 def count_matches(matches: Iterable) -> int:
     if hasattr(matches, "count"):
         return matches.count()
@@ -92,6 +99,8 @@ def count_matches(matches: Iterable) -> int:
 # APPLICATION / USE-CASE
 # ============================================================
 
+@traced
+@query_budget(3)
 def build_load(team_id: UUID, matches) -> Dict:
     """
     Build team load analytics block for Coach Summary.
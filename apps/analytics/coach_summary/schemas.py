@@ -28,3 +28,7 @@ class SnapshotSchema:
 
     # Recent form (e.g. ["W", "D", "L"])
     form: List[str]
+
+    # Shot quality (stored per-shot xG)
+    xg_for: float = 0.0
+    xg_against: float = 0.0
@@ -7,8 +7,11 @@ from apps.competitions.models import Match
 from apps.events.models import Event
 
 from apps.analytics.coach_summary.summary import build_explainable_summary
+from apps.analytics.instrumentation import query_budget, traced
 
 
+@traced
+@query_budget(15)
 def get_coach_summary(
     team_id: UUID,
     match_ids: List[UUID],
@@ -2,11 +2,13 @@ from typing import Dict, List
 from uuid import UUID
 
 from django.apps import apps
-from django.db.models import QuerySet
+from django.db.models import Count, Q, QuerySet
 
 from apps.competitions.models import Match
 
 from apps.analytics.coach_summary.schemas import SnapshotSchema
+from apps.analytics.services.expected_goals import load_team_xg_by_match
+from apps.analytics.instrumentation import query_budget, traced
 
 
 # ============================================================
@@ -22,6 +24,7 @@ def calculate_snapshot_from_results(
 
     wins = draws = losses = 0
     goals_for = goals_against = 0
+    xg_for = xg_against = 0.0
     form: List[str] = []
 
     for r in results:
@@ -30,6 +33,8 @@ def calculate_snapshot_from_results(
 
         goals_for += gf
         goals_against += ga
+        xg_for += r.get("xg_for", 0.0)
+        xg_against += r.get("xg_against", 0.0)
 
         if gf > ga:
             wins += 1
@@ -55,6 +60,8 @@ def calculate_snapshot_from_results(
         points=points,
         points_per_match=ppm,
         form=form,
+        xg_for=round(xg_for, 2),
+        xg_against=round(xg_against, 2),
     )
 
 
@@ -62,31 +69,49 @@ def calculate_snapshot_from_results(
 # INFRASTRUCTURE (Django ORM)
 # ============================================================
 
+@traced
+@query_budget(3)
 def load_match_goal_counts(
     team_id: UUID,
     matches: QuerySet[Match],
 ) -> List[Dict]:
     """
-    Load goals for / against per match from Event table.
+    Load goals and stored xG for / against per match from Event table.
     """
 
     Event = apps.get_model("events", "Event")
 
-    results: List[Dict] = []
-
-    for match in matches.order_by("kickoff_time"):
-        match_events = Event.objects.filter(
-            match=match,
-            event_type="goal",
+    xg_by_match = load_team_xg_by_match(team_id, matches)
+
+    # One grouped count for all matches instead of two per match
+    goals_by_match = {
+        row["match_id"]: row
+        for row in (
+            Event.objects
+            .filter(match__in=matches, event_type="goal")
+            .values("match_id")
+            .annotate(
+                goals_for=Count("id", filter=Q(team_id=team_id)),
+                goals_against=Count("id", filter=~Q(team_id=team_id)),
+            )
         )
+    }
+    no_goals = {"goals_for": 0, "goals_against": 0}
+
+    results: List[Dict] = []
 
-        goals_for = match_events.filter(team_id=team_id).count()
-        goals_against = match_events.exclude(team_id=team_id).count()
+    for match_id in matches.order_by("kickoff_time").values_list(
+        "id", flat=True
+    ):
+        goals = goals_by_match.get(match_id, no_goals)
 
         results.append({
-            "match_id": match.id,
-            "goals_for": goals_for,
-            "goals_against": goals_against,
+            "match_id": match_id,
+            "goals_for": goals["goals_for"],
+            "goals_against": goals["goals_against"],
+            **xg_by_match.get(
+                match_id, {"xg_for": 0.0, "xg_against": 0.0}
+            ),
         })
 
     return results
@@ -96,6 +121,8 @@ def load_match_goal_counts(
 # APPLICATION / USE-CASE
 # ============================================================
 
+@traced
+@query_budget(3)
 def build_snapshot(
     team_id: UUID,
     matches: QuerySet[Match],
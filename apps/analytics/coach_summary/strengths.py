@@ -6,11 +6,17 @@ from django.db.models import QuerySet
 from apps.competitions.models import Match
 from apps.events.models import Event
 
+from apps.analytics.services.expected_goals import load_team_xg
+from apps.analytics.instrumentation import query_budget, traced
+
 
 POSSESSION_THRESHOLD = 55
 HIGH_PRESS_THRESHOLD = 15
+XG_DIFF_PER_MATCH_THRESHOLD = 0.5
 
 
+@traced
+@query_budget(5)
 def build_strengths(
     team_id: UUID,
     matches: QuerySet[Match],
@@ -58,8 +64,7 @@ def build_strengths(
     high_def_actions = scoped_events.filter(
         team_id=team_id,
         event_type__in=["tackle", "interception"],
-        x__gte=60,
-    ).count()
+    ).beyond_x(60).count()
 
     if high_def_actions >= HIGH_PRESS_THRESHOLD:
         strengths.append({
@@ -70,4 +75,25 @@ def build_strengths(
             },
         })
 
+    # ---------------------------------
+    # Chance quality (stored xG)
+    # ---------------------------------
+    matches_count = matches.count()
+    xg = load_team_xg(team_id, matches)
+
+    if matches_count:
+        xg_diff_per_match = (
+            (xg["xg_for"] - xg["xg_against"]) / matches_count
+        )
+
+        if xg_diff_per_match >= XG_DIFF_PER_MATCH_THRESHOLD:
+            strengths.append({
+                "code": "CHANCE_QUALITY",
+                "text": "Команда создаёт более опасные моменты, чем соперники.",
+                "evidence": {
+                    **xg,
+                    "xg_diff_per_match": round(xg_diff_per_match, 2),
+                },
+            })
+
     return strengths
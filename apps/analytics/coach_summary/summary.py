@@ -10,6 +10,7 @@ from apps.analytics.coach_summary.load import build_load
 from apps.analytics.coach_summary.usage import build_usage
 from apps.analytics.coach_summary.strengths import build_strengths
 from apps.analytics.coach_summary.weaknesses import build_weaknesses
+from apps.analytics.instrumentation import query_budget, traced
 
 
 WEAKNESS_LABELS = {
@@ -20,9 +21,12 @@ WEAKNESS_LABELS = {
 STRENGTH_LABELS = {
     "POSSESSION_CONTROL": "контроль мяча",
     "HIGH_PRESS_ACTIVITY": "активный высокий прессинг",
+    "CHANCE_QUALITY": "качество создаваемых моментов",
 }
 
 
+@traced
+@query_budget(15)
 def build_explainable_summary(
     team_id: UUID,
     matches: QuerySet[Match],
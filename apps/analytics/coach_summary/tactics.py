@@ -1,11 +1,14 @@
 from typing import Dict, Any
 from uuid import UUID
 
-from django.apps import apps
-from django.db.models import QuerySet, Avg
+import numpy as np
+from django.db.models import QuerySet
 
 from apps.competitions.models import Match
 
+from apps.analytics.services.event_columns import iter_match_columns
+from apps.analytics.instrumentation import query_budget, traced
+
 
 # ============================================================
 # CONSTANTS (Domain knowledge)
@@ -147,92 +150,81 @@ def evaluate_tempo(
 
 
 # ============================================================
-# INFRASTRUCTURE (Django ORM)
+# INFRASTRUCTURE (columnar event store)
 # ============================================================
 
+@traced
+@query_budget(1)
 def load_ppda_data(
     team_id: UUID,
     matches: QuerySet[Match],
 ) -> tuple[int, int]:
-    Event = apps.get_model("events", "Event")
-
-    opponent_passes = (
-        Event.objects
-        .filter(
-            match__in=matches,
-            event_type="pass",
-            x__gte=40,
-        )
-        .exclude(team_id=team_id)
-        .count()
-    )
-
-    defensive_actions = (
-        Event.objects
-        .filter(
-            match__in=matches,
-            team_id=team_id,
-            event_type__in=["tackle", "interception", "foul"],
-            x__gte=40,
-        )
-        .count()
-    )
+    opponent_passes = 0
+    defensive_actions = 0
+
+    for columns in iter_match_columns(matches):
+        team = columns.team_mask(team_id)
+        pressing_zone = columns.x >= 40
+
+        opponent_passes += int(np.count_nonzero(
+            columns.type_mask(["pass"]) & ~team & pressing_zone
+        ))
+        defensive_actions += int(np.count_nonzero(
+            columns.type_mask(["tackle", "interception", "foul"])
+            & team
+            & pressing_zone
+        ))
 
     return opponent_passes, defensive_actions
 
 
+@traced
+@query_budget(1)
 def load_pass_counts(
     team_id: UUID,
     matches: QuerySet[Match],
 ) -> tuple[int, int]:
-    Event = apps.get_model("events", "Event")
-
-    team_passes = (
-        Event.objects
-        .filter(
-            match__in=matches,
-            team_id=team_id,
-            event_type="pass",
-        )
-        .count()
-    )
+    team_passes = 0
+    opponent_passes = 0
 
-    opponent_passes = (
-        Event.objects
-        .filter(
-            match__in=matches,
-            event_type="pass",
-        )
-        .exclude(team_id=team_id)
-        .count()
-    )
+    for columns in iter_match_columns(matches):
+        team = columns.team_mask(team_id)
+        passes = columns.type_mask(["pass"])
+
+        team_passes += int(np.count_nonzero(passes & team))
+        opponent_passes += int(np.count_nonzero(passes & ~team))
 
     return team_passes, opponent_passes
 
 
+@traced
+@query_budget(1)
 def load_defensive_line_x(
     team_id: UUID,
     matches: QuerySet[Match],
 ) -> float:
-    Event = apps.get_model("events", "Event")
-
-    return (
-        Event.objects
-        .filter(
-            match__in=matches,
-            team_id=team_id,
-            event_type__in=["tackle", "interception"],
+    total_x = 0.0
+    count = 0
+
+    for columns in iter_match_columns(matches):
+        mask = (
+            columns.team_mask(team_id)
+            & columns.type_mask(["tackle", "interception"])
+            & ~np.isnan(columns.x)
         )
-        .aggregate(avg_x=Avg("x"))
-        .get("avg_x")
-        or 0.0
-    )
+
+        total_x += float(columns.x[mask].sum(dtype=np.float64))
+        count += int(np.count_nonzero(mask))
+
+    return total_x / count if count else 0.0
 
 
 # ============================================================
 # APPLICATION / USE-CASE
 # ============================================================
 
+@traced
+@query_budget(4)
 def build_tactical_identity(
     team_id: UUID,
     matches: QuerySet[Match],
@@ -3,6 +3,8 @@ from uuid import UUID
 
 from django.apps import apps
 
+from apps.analytics.instrumentation import query_budget, traced
+
 
 # ============================================================
 # DOMAIN LOGIC (pure)
@@ -26,6 +28,8 @@ def calculate_usage(
 # INFRASTRUCTURE (Django ORM)
 # ============================================================
 
+@traced
+@query_budget(2)
 def load_usage_data(team_id: UUID, matches) -> Dict:
     Appearance = apps.get_model("players", "Appearance")
 
@@ -46,6 +50,8 @@ def load_usage_data(team_id: UUID, matches) -> Dict:
 # APPLICATION / USE-CASE
 # ============================================================
 
+@traced
+@query_budget(2)
 def build_usage(team_id: UUID, matches) -> Dict:
     """
     Build usage block for Coach Summary.
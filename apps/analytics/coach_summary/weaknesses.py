@@ -6,12 +6,15 @@ from django.db.models import QuerySet, Sum
 
 from apps.competitions.models import Match
 from apps.events.models import Event
+from apps.analytics.instrumentation import query_budget, traced
 
 
 TURNOVER_THRESHOLD = 20
 LOW_TEMPO_THRESHOLD = 0.2
 
 
+@traced
+@query_budget(3)
 def build_weaknesses(
     team_id: UUID,
     matches: QuerySet[Match],
@@ -52,7 +55,12 @@ def build_weaknesses(
         or 0
     )
 
-    team_events = events.filter(team_id=team_id).count()
+    team_events = (
+        events
+        .filter(team_id=team_id)
+        .exclude(event_type__in=Event.UNCOUNTED_TYPES)
+        .count()
+    )
 
     if total_minutes > 0:
         tempo = team_events / total_minutes
@@ -0,0 +1,451 @@
+"""
+Per-request query and timing instrumentation for the analytics API.
+
+Enabled with settings.ANALYTICS_INSTRUMENTATION["ENABLED"]. Each request
+then records its query count, DB time, slowest queries and the time
+spent in every @traced service function. The totals go out in a
+Server-Timing header and into a rolling in-process window that the
+stats endpoint reports.
+
+When disabled the middleware unloads itself and @traced costs one
+context variable lookup per call.
+
+@query_budget(n) caps the queries of one service call. Overruns raise
+in DEBUG and are logged otherwise (see settings.ANALYTICS_QUERY_BUDGETS);
+the project's test runner always raises. Lazy cache fills run under a
+fill_budget() of their own.
+"""
+
+import contextlib
+import contextvars
+import functools
+import heapq
+import logging
+import statistics
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+
+# ============================================================
+# CONSTANTS (defaults, overridable via settings.ANALYTICS_INSTRUMENTATION)
+# ============================================================
+
+DEFAULT_INSTRUMENTATION_SETTINGS = {
+    "ENABLED": False,
+    # Requests the middleware profiles
+    "PATH_PREFIXES": ["/api/analytics/"],
+    # Slowest queries kept per request
+    "SLOW_QUERIES": 5,
+    # Requests kept per route in the rolling window
+    "WINDOW": 500,
+    "SQL_MAX_LENGTH": 500,
+    # Service spans sent in Server-Timing (slowest first)
+    "SERVER_TIMING_SPANS": 10,
+}
+
+# Module prefixes dropped from span names
+SPAN_NAME_PREFIXES = ("apps.analytics.services.", "apps.analytics.")
+
+# What an exceeded @query_budget does: "raise", "log" or "off".
+# None: raise in DEBUG, log otherwise.
+DEFAULT_QUERY_BUDGET_MODE = None
+
+logger = logging.getLogger(__name__)
+
+
+def instrumentation_settings() -> Dict:
+    return {
+        **DEFAULT_INSTRUMENTATION_SETTINGS,
+        **getattr(settings, "ANALYTICS_INSTRUMENTATION", {}),
+    }
+
+
+def query_budget_mode() -> str:
+    mode = getattr(settings, "ANALYTICS_QUERY_BUDGETS", {}).get(
+        "MODE", DEFAULT_QUERY_BUDGET_MODE
+    )
+    if mode is not None:
+        return mode
+    return "raise" if settings.DEBUG else "log"
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+# ============================================================
+# DOMAIN: request profile (pure)
+# ============================================================
+
+@dataclass
+class RequestProfile:
+    slow_query_limit: int = 5
+    sql_max_length: int = 500
+    started: float = field(default_factory=time.perf_counter)
+    queries: int = 0
+    db_seconds: float = 0.0
+    # Min-heap of (seconds, sequence, sql): the slowest queries so far
+    slow_queries: List[Tuple[float, int, str]] = field(default_factory=list)
+    # {span name: [calls, seconds]}
+    spans: Dict[str, List] = field(default_factory=dict)
+
+    def add_query(self, sql: str, seconds: float) -> None:
+        self.queries += 1
+        self.db_seconds += seconds
+
+        item = (seconds, self.queries, sql[: self.sql_max_length])
+        if len(self.slow_queries) < self.slow_query_limit:
+            heapq.heappush(self.slow_queries, item)
+        elif seconds > self.slow_queries[0][0]:
+            heapq.heapreplace(self.slow_queries, item)
+
+    def add_span(self, name: str, seconds: float) -> None:
+        span = self.spans.setdefault(name, [0, 0.0])
+        span[0] += 1
+        span[1] += seconds
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def slowest_queries(self) -> List[Dict]:
+        return [
+            {"sql": sql, "ms": round(seconds * 1000, 2)}
+            for seconds, _, sql in sorted(self.slow_queries, reverse=True)
+        ]
+
+    def summary(self) -> Dict:
+        return {
+            "total_ms": round(self.elapsed() * 1000, 2),
+            "queries": self.queries,
+            "db_ms": round(self.db_seconds * 1000, 2),
+            "spans": {
+                name: {"calls": calls, "ms": round(seconds * 1000, 2)}
+                for name, (calls, seconds) in self.spans.items()
+            },
+            "slow_queries": self.slowest_queries(),
+        }
+
+
+def server_timing_header(profile: RequestProfile, max_spans: int) -> str:
+    """
+    Server-Timing value: total, db and the slowest service spans.
+    """
+
+    metrics = [
+        f"total;dur={profile.elapsed() * 1000:.1f}",
+        f'db;dur={profile.db_seconds * 1000:.1f};desc="{profile.queries} queries"',
+    ]
+
+    slowest = sorted(
+        profile.spans.items(), key=lambda item: item[1][1], reverse=True
+    )[:max_spans]
+    for name, (calls, seconds) in slowest:
+        metrics.append(
+            f'{name};dur={seconds * 1000:.1f};desc="{calls}x"'
+        )
+
+    return ", ".join(metrics)
+
+
+# ============================================================
+# DOMAIN: rolling stats (pure)
+# ============================================================
+
+def distribution(values: List[float]) -> Dict:
+    ordered = sorted(values)
+    return {
+        "p50": round(statistics.median(ordered), 2),
+        "p95": round(ordered[max(0, round(0.95 * len(ordered)) - 1)], 2),
+        "max": round(ordered[-1], 2),
+    }
+
+
+class RollingStats:
+    """
+    The last `window` request summaries per route, thread-safe.
+    """
+
+    def __init__(self, window: int):
+        self.window = window
+        self._samples: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+    def add(self, route: str, summary: Dict) -> None:
+        with self._lock:
+            samples = self._samples.get(route)
+            if samples is None:
+                samples = self._samples[route] = deque(maxlen=self.window)
+            samples.append(summary)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+    def snapshot(self, slow_queries: int = 10) -> Dict[str, Dict]:
+        with self._lock:
+            samples = {
+                route: list(items) for route, items in self._samples.items()
+            }
+
+        return {
+            route: self._route_stats(items, slow_queries)
+            for route, items in samples.items()
+        }
+
+    @staticmethod
+    def _route_stats(items: List[Dict], slow_queries: int) -> Dict:
+        span_totals: Dict[str, List[float]] = {}
+        for item in items:
+            for name, span in item["spans"].items():
+                span_totals.setdefault(name, []).append(span["ms"])
+
+        queries = heapq.nlargest(
+            slow_queries,
+            (query for item in items for query in item["slow_queries"]),
+            key=lambda query: query["ms"],
+        )
+
+        return {
+            "requests": len(items),
+            "total_ms": distribution([i["total_ms"] for i in items]),
+            "db_ms": distribution([i["db_ms"] for i in items]),
+            "queries": distribution([i["queries"] for i in items]),
+            "spans": {
+                name: {
+                    "requests": len(values),
+                    "mean_ms": round(statistics.fmean(values), 2),
+                    **distribution(values),
+                }
+                for name, values in sorted(
+                    span_totals.items(),
+                    key=lambda item: sum(item[1]),
+                    reverse=True,
+                )
+            },
+            "slow_queries": queries,
+        }
+
+
+# ============================================================
+# INFRASTRUCTURE (DB execute wrapper, context)
+# ============================================================
+
+_active_profile: contextvars.ContextVar[RequestProfile | None] = (
+    contextvars.ContextVar("analytics_profile", default=None)
+)
+
+# Rolling window of this process (created on first use)
+_stats: RollingStats | None = None
+_stats_lock = threading.Lock()
+
+
+def get_rolling_stats() -> RollingStats:
+    global _stats
+
+    if _stats is None:
+        with _stats_lock:
+            if _stats is None:
+                _stats = RollingStats(instrumentation_settings()["WINDOW"])
+    return _stats
+
+
+class QueryRecorder:
+    """
+    connection.execute_wrapper() hook timing every query.
+    """
+
+    def __init__(self, profile: RequestProfile):
+        self.profile = profile
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.profile.add_query(sql, time.perf_counter() - started)
+
+
+@contextlib.contextmanager
+def capture_profile() -> Iterator[RequestProfile]:
+    """
+    Profile the enclosed block: queries on every database alias and
+    @traced spans. Usable outside requests (shell, jobs, benchmarks).
+    """
+
+    config = instrumentation_settings()
+    profile = RequestProfile(
+        slow_query_limit=config["SLOW_QUERIES"],
+        sql_max_length=config["SQL_MAX_LENGTH"],
+    )
+    recorder = QueryRecorder(profile)
+
+    token = _active_profile.set(profile)
+    try:
+        with contextlib.ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            yield profile
+    finally:
+        _active_profile.reset(token)
+
+
+def span_name(fn: Callable) -> str:
+    name = f"{fn.__module__}.{fn.__qualname__}"
+    for prefix in SPAN_NAME_PREFIXES:
+        if name.startswith(prefix):
+            return name[len(prefix):]
+    return name
+
+
+def traced(fn: Callable) -> Callable:
+    """
+    Record the wrapped function's time in the active profile, if any.
+    """
+
+    name = span_name(fn)
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        profile = _active_profile.get()
+        if profile is None:
+            return fn(*args, **kwargs)
+
+        started = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            profile.add_span(name, time.perf_counter() - started)
+
+    return wrapper
+
+
+# ============================================================
+# INFRASTRUCTURE (query budgets)
+# ============================================================
+
+# Depth of nested fill_budget() blocks: a budget only counts the
+# queries run at the depth it was opened at
+_budget_depth: contextvars.ContextVar[int] = contextvars.ContextVar(
+    "analytics_budget_depth", default=0
+)
+
+
+class QueryCounter:
+    """
+    connection.execute_wrapper() hook counting queries of one call.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.depth = _budget_depth.get()
+
+    def __call__(self, execute, sql, params, many, context):
+        if _budget_depth.get() == self.depth:
+            self.count += 1
+        return execute(sql, params, many, context)
+
+
+@contextlib.contextmanager
+def enforce_query_budget(name: str, max_queries: int) -> Iterator[None]:
+    mode = query_budget_mode()
+    if mode == "off":
+        yield
+        return
+
+    counter = QueryCounter()
+    with contextlib.ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(counter))
+        yield
+
+    if counter.count > max_queries:
+        message = (
+            f"{name} ran {counter.count} queries "
+            f"(budget {max_queries})"
+        )
+        if mode == "raise":
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
+
+
+@contextlib.contextmanager
+def fill_budget(max_queries: int, name: str) -> Iterator[None]:
+    """
+    Budget of its own for a lazy cache fill inside a budgeted call.
+
+    For cold caches (columnar files, possession chains, live state): the
+    fill is a one-off cost, not the call's query shape, so its queries
+    are charged to this budget instead of the enclosing ones.
+    """
+
+    token = _budget_depth.set(_budget_depth.get() + 1)
+    try:
+        with enforce_query_budget(name, max_queries):
+            yield
+    finally:
+        _budget_depth.reset(token)
+
+
+def query_budget(max_queries: int) -> Callable:
+    """
+    Declare the most queries one call of the function may run.
+
+    Nested budgeted calls count towards the caller's budget too.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        name = span_name(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with enforce_query_budget(name, max_queries):
+                return fn(*args, **kwargs)
+
+        wrapper.query_budget = max_queries
+        return wrapper
+
+    return decorator
+
+
+# ============================================================
+# APPLICATION (middleware)
+# ============================================================
+
+class QueryInstrumentationMiddleware:
+    """
+    Profiles matching requests; adds Server-Timing and feeds the
+    rolling stats. Removed from the stack when instrumentation is off.
+    """
+
+    def __init__(self, get_response):
+        config = instrumentation_settings()
+        if not config["ENABLED"]:
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+        self.path_prefixes = tuple(config["PATH_PREFIXES"])
+        self.max_spans = config["SERVER_TIMING_SPANS"]
+
+    def __call__(self, request):
+        if not request.path.startswith(self.path_prefixes):
+            return self.get_response(request)
+
+        with capture_profile() as profile:
+            response = self.get_response(request)
+
+        response["Server-Timing"] = server_timing_header(
+            profile, self.max_spans
+        )
+
+        match = request.resolver_match
+        route = match.route if match is not None else request.path
+        get_rolling_stats().add(f"{request.method} {route}", profile.summary())
+
+        return response
@@ -0,0 +1,50 @@
+from uuid import UUID
+
+from apps.jobs.registry import job_handler
+
+from apps.analytics.services.clip_generation import (
+    generate_match_video_clips,
+)
+from apps.analytics.services.derived_data import rebuild_match_derived_data
+from apps.analytics.services.expected_goals import fit_expected_goals
+from apps.analytics.services.expected_threat import fit_expected_threat
+from apps.analytics.services.video_detections import (
+    ingest_match_video_detections,
+)
+
+
+# Job types handled by the analytics app
+REBUILD_MATCH_DERIVED = "rebuild_match_derived"
+FIT_MODELS = "fit_models"
+INGEST_VIDEO_DETECTIONS = "ingest_video_detections"
+GENERATE_VIDEO_CLIPS = "generate_video_clips"
+
+
+@job_handler(REBUILD_MATCH_DERIVED)
+def rebuild_match_derived_job(match_id: UUID) -> None:
+    rebuild_match_derived_data(match_id)
+
+
+@job_handler(FIT_MODELS)
+def fit_models_job(match_id: None = None) -> None:
+    fit_expected_threat()
+    fit_expected_goals()
+
+
+@job_handler(INGEST_VIDEO_DETECTIONS)
+def ingest_video_detections_job(match_id: UUID) -> None:
+    # One job per match: covers every pending upload (e.g. both halves)
+    ingest_match_video_detections(match_id)
+
+
+@job_handler(GENERATE_VIDEO_CLIPS)
+def generate_video_clips_job(match_id: UUID) -> None:
+    failed = [
+        result for result in generate_match_video_clips(match_id)
+        if "error" in result
+    ]
+    if failed:
+        # Encoded clips stay on disk: the retry resumes after them
+        raise RuntimeError(
+            "; ".join(f"{r['video_id']}: {r['error']}" for r in failed)
+        )
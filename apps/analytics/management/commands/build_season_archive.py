@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.competitions.models import Season
+
+from apps.analytics.services.season_archive import build_season_archive
+
+
+class Command(BaseCommand):
+    help = "Build memory-mapped season event archives for cross-match scans."
+
+    def add_arguments(self, parser):
+        parser.add_argument("season_ids", nargs="*")
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Build archives for every season.",
+        )
+
+    def handle(self, *args, **options):
+        if options["all"]:
+            season_ids = list(Season.objects.values_list("id", flat=True))
+        else:
+            season_ids = options["season_ids"]
+
+        if not season_ids:
+            raise CommandError("Pass season ids or --all")
+
+        for season_id in season_ids:
+            if not Season.objects.filter(id=season_id).exists():
+                raise CommandError(f"Season {season_id} not found")
+
+            path = build_season_archive(season_id)
+            self.stdout.write(f"Built {path}")
@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand
+
+from apps.competitions.models import Match
+from apps.jobs.queue import enqueue_job
+
+from apps.analytics.jobs import REBUILD_MATCH_DERIVED
+from apps.analytics.services.expected_goals import (
+    fit_expected_goals,
+    score_match_expected_goals,
+)
+
+
+class Command(BaseCommand):
+    help = "Fit the shot-quality (xG) model on stored shots."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rescore",
+            action="store_true",
+            help=(
+                "Store xG of every shot with the new coefficients and "
+                "queue the rebuild of the player metrics derived from "
+                "them."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        artifact = fit_expected_goals()
+        meta = artifact.metadata
+
+        self.stdout.write(
+            f"Fitted {artifact.name} v{artifact.version}: "
+            f"{meta['shots']} shots, {meta['goals']} goals, "
+            f"log loss {meta['log_loss']}"
+        )
+
+        if not options["rescore"]:
+            return
+
+        coefficients = artifact.arrays["coefficients"]
+        scored = 0
+        affected = []
+        for match_id in Match.objects.values_list("id", flat=True):
+            count = score_match_expected_goals(match_id, coefficients)
+            if count:
+                scored += count
+                affected.append(match_id)
+
+        # Player metrics still hold the old values
+        for match_id in affected:
+            enqueue_job(REBUILD_MATCH_DERIVED, match_id)
+
+        self.stdout.write(
+            f"Scored {scored} shots, "
+            f"queued the rebuild of {len(affected)} matches"
+        )
@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand
+
+from apps.competitions.models import Match
+from apps.jobs.queue import enqueue_job
+
+from apps.analytics.jobs import REBUILD_MATCH_DERIVED
+from apps.analytics.services.expected_threat import (
+    fit_expected_threat,
+    value_match_expected_threat,
+)
+
+
+class Command(BaseCommand):
+    help = "Fit the expected-threat (xT) grid from stored events."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--revalue",
+            action="store_true",
+            help=(
+                "Store xT deltas of every match with the new grid and "
+                "queue the rebuild of the momentum / player metrics "
+                "derived from them."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        artifact = fit_expected_threat()
+        meta = artifact.metadata
+
+        self.stdout.write(
+            f"Fitted {artifact.name} v{artifact.version}: "
+            f"{meta['matches']} matches, {meta['shots']} shots, "
+            f"{meta['moves']} moves, {meta['iterations']} iterations"
+        )
+
+        if not options["revalue"]:
+            return
+
+        xt_grid = artifact.arrays["xt"]
+        valued = 0
+        affected = []
+        for match_id in Match.objects.values_list("id", flat=True):
+            count = value_match_expected_threat(match_id, xt_grid)
+            if count:
+                valued += count
+                affected.append(match_id)
+
+        # Momentum series and player metrics still hold the old values
+        for match_id in affected:
+            enqueue_job(REBUILD_MATCH_DERIVED, match_id)
+
+        self.stdout.write(
+            f"Valued {valued} events, "
+            f"queued the rebuild of {len(affected)} matches"
+        )
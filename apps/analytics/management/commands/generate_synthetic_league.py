@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+
+from apps.analytics.sandbox.synthetic_league import generate_league
+from apps.analytics.services.derived_data import rebuild_match_derived_data
+
+
+class Command(BaseCommand):
+    help = "Create a seeded synthetic league (teams, players, matches, events)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--competitions", type=int, default=1)
+        parser.add_argument("--teams", type=int, default=10)
+        parser.add_argument("--seasons", type=int, default=1)
+        parser.add_argument("--events-per-match", type=int, default=1600)
+        parser.add_argument(
+            "--rebuild-derived",
+            action="store_true",
+            help="Compute derived match data now instead of leaving it.",
+        )
+
+    def handle(self, *args, **options):
+        result = generate_league(
+            seed=options["seed"],
+            competitions=options["competitions"],
+            teams=options["teams"],
+            seasons=options["seasons"],
+            events_per_match=options["events_per_match"],
+            log=self.stdout.write,
+        )
+
+        if options["rebuild_derived"]:
+            for match_id in result["match_ids"]:
+                rebuild_match_derived_data(match_id)
+
+        self.stdout.write(
+            f"Created {result['competitions']} competitions, "
+            f"{result['teams']} teams, {result['players']} players, "
+            f"{result['matches']} matches, {result['events']} events"
+        )
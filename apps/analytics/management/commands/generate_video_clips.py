@@ -0,0 +1,65 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.analytics.models import VideoUpload
+
+from apps.analytics.services.clip_generation import (
+    DEFAULT_CLIP_WORKERS,
+    StubClipEncoder,
+    generate_video_clips,
+)
+
+
+class Command(BaseCommand):
+    help = "Cut highlight clips and thumbnails from processed videos."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "video_ids",
+            nargs="*",
+            help="VideoUpload ids (default: every completed upload).",
+        )
+        parser.add_argument("--match", help="Only uploads of this match.")
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=DEFAULT_CLIP_WORKERS,
+            help="Encoding processes running at once.",
+        )
+        parser.add_argument(
+            "--stub-encoder",
+            action="store_true",
+            help="Write placeholder files instead of running ffmpeg.",
+        )
+
+    def handle(self, *args, **options):
+        uploads = VideoUpload.objects.filter(
+            status=VideoUpload.Status.COMPLETED
+        )
+        if options["video_ids"]:
+            uploads = uploads.filter(id__in=options["video_ids"])
+        if options["match"]:
+            uploads = uploads.filter(match_id=options["match"])
+
+        upload_ids = list(uploads.values_list("id", flat=True))
+        if not upload_ids:
+            raise CommandError("No completed video uploads to process")
+
+        results = generate_video_clips(
+            upload_ids,
+            encoder=StubClipEncoder() if options["stub_encoder"] else None,
+            workers=options["workers"],
+        )
+
+        for result in results:
+            if "error" in result:
+                self.stderr.write(
+                    f"{result['video_id']}: {result['error']}"
+                )
+                continue
+            self.stdout.write(
+                f"{result['video_id']}: {result['clips']} clips "
+                f"({result['encoded']} encoded, {result['resumed']} resumed) "
+                f"plan {result['plan_seconds']}s, "
+                f"encode {result['encode_seconds']}s, "
+                f"store {result['store_seconds']}s"
+            )
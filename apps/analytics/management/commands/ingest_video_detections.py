@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.analytics.models import VideoUpload
+
+from apps.analytics.services.video_detections import ingest_video_detections
+
+
+class Command(BaseCommand):
+    help = "Load a video upload's detector JSON output as match events."
+
+    def add_arguments(self, parser):
+        parser.add_argument("video_id", help="VideoUpload id")
+        parser.add_argument(
+            "--json",
+            dest="json_path",
+            help="Detector output to use (stored as json_output_path).",
+        )
+
+    def handle(self, *args, **options):
+        video_id = options["video_id"]
+
+        try:
+            upload = VideoUpload.objects.get(id=video_id)
+        except (VideoUpload.DoesNotExist, ValueError):
+            raise CommandError(f"Video {video_id} not found")
+
+        if options["json_path"]:
+            upload.json_output_path = options["json_path"]
+            upload.save(update_fields=["json_output_path", "updated_at"])
+
+        try:
+            result = ingest_video_detections(upload.id)
+        except (OSError, ValueError) as exc:
+            raise CommandError(str(exc))
+
+        self.stdout.write(
+            f"Inserted {result['events_count']} events "
+            f"for match {result['match_id']} "
+            f"({result['merged']} duplicate detections merged)"
+        )
+        for reason, count in result["skipped"].items():
+            self.stdout.write(f"  skipped ({reason}): {count}")
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from apps.analytics.models import VideoUpload
+
+from apps.analytics.services.clip_index import link_clip_events
+
+
+class Command(BaseCommand):
+    help = "Link clips without an event to the first event they cover."
+
+    def handle(self, *args, **options):
+        linked = 0
+        for upload_id in (
+            VideoUpload.objects
+            .filter(match__isnull=False, clips__event__isnull=True)
+            .distinct()
+            .values_list("id", flat=True)
+        ):
+            linked += link_clip_events(upload_id)
+
+        self.stdout.write(f"Linked {linked} clips")
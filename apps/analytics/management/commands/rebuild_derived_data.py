@@ -0,0 +1,71 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Exists, OuterRef
+
+from apps.competitions.models import Match
+from apps.events.models import Event
+from apps.jobs.queue import enqueue_job
+from apps.players.models import PlayerMatchMetric
+
+from apps.analytics.jobs import REBUILD_MATCH_DERIVED
+from apps.analytics.services.derived_data import rebuild_match_derived_data
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild stored per-match derived data (columns, chains, xT / xG "
+        "values, momentum, player metrics). Without match ids: matches "
+        "with player events but no player metrics, e.g. after an upgrade."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("match_ids", nargs="*")
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Rebuild every match with events.",
+        )
+        parser.add_argument(
+            "--queue",
+            action="store_true",
+            help="Enqueue rebuild jobs for the workers instead.",
+        )
+
+    def handle(self, *args, **options):
+        matches = Match.objects.filter(
+            Exists(Event.objects.filter(match_id=OuterRef("pk")))
+        )
+
+        if options["match_ids"]:
+            matches = Match.objects.filter(id__in=options["match_ids"])
+            missing = set(map(str, options["match_ids"])) - {
+                str(mid) for mid in matches.values_list("id", flat=True)
+            }
+            if missing:
+                raise CommandError(
+                    "Matches not found: " + ", ".join(sorted(missing))
+                )
+        elif not options["all"]:
+            # Only matches that would get metric rows
+            matches = matches.filter(
+                Exists(Event.objects.filter(
+                    match_id=OuterRef("pk"), player__isnull=False
+                ))
+            ).exclude(
+                Exists(PlayerMatchMetric.objects.filter(
+                    match_id=OuterRef("pk")
+                ))
+            )
+
+        match_ids = list(
+            matches.order_by("kickoff_time").values_list("id", flat=True)
+        )
+
+        for match_id in match_ids:
+            if options["queue"]:
+                enqueue_job(REBUILD_MATCH_DERIVED, match_id)
+            else:
+                rebuild_match_derived_data(match_id)
+                self.stdout.write(f"Rebuilt {match_id}")
+
+        verb = "Queued" if options["queue"] else "Rebuilt"
+        self.stdout.write(f"{verb} {len(match_ids)} matches")
@@ -0,0 +1,63 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.analytics.sandbox.benchmarks import (
+    BENCHMARK_SIZES,
+    DEFAULT_CONCURRENT_READERS,
+    DEFAULT_REPEATS,
+    DEFAULT_WARMUP,
+    run_benchmarks,
+)
+
+
+class Command(BaseCommand):
+    help = "Time the analytics services on synthetic leagues of several sizes."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            nargs="+",
+            choices=list(BENCHMARK_SIZES),
+            default=["tiny", "small"],
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+        parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+        parser.add_argument(
+            "--concurrent-readers",
+            type=int,
+            default=DEFAULT_CONCURRENT_READERS,
+            help="Reader threads during imports on SQLite (0 skips).",
+        )
+        parser.add_argument(
+            "--output",
+            help="Write the JSON report to this file (default: stdout).",
+        )
+        parser.add_argument(
+            "--use-current-db",
+            action="store_true",
+            help="Generate into the configured database and keep the data.",
+        )
+
+    def handle(self, *args, **options):
+        if options["repeats"] < 1:
+            raise CommandError("--repeats must be at least 1")
+
+        report = run_benchmarks(
+            sizes=options["sizes"],
+            seed=options["seed"],
+            repeats=options["repeats"],
+            warmup=options["warmup"],
+            isolated=not options["use_current_db"],
+            concurrent_readers=options["concurrent_readers"],
+            log=self.stderr.write,
+        )
+
+        payload = json.dumps(report, indent=2)
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as f:
+                f.write(payload + "\n")
+            self.stderr.write(f"Report written to {options['output']}")
+        else:
+            self.stdout.write(payload)
@@ -0,0 +1,455 @@
+"""
+Benchmark suite for the analytics read paths and the importer.
+
+Each data size is a synthetic league (see synthetic_league). The services
+are then timed on one of its matches. By default every size runs in a
+throwaway test database, so the configured database is never touched.
+"""
+
+import contextlib
+import io
+import platform
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import django
+from django.conf import settings
+from django.core.management import call_command
+from django.db import OperationalError, connection, connections, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory
+
+from apps.competitions.models import Match, MatchTeam
+from apps.events.models import Event
+from apps.events.sqlite_tuning import DEFAULT_SQLITE_PRAGMAS
+from apps.players.models import Appearance, Player
+from apps.teams.models import Team
+
+from apps.analytics.api.match_list import MatchListAPIView
+from apps.analytics.coach_summary.service import get_coach_summary
+from apps.analytics.sandbox.import_statsbomb import import_match
+from apps.analytics.sandbox.synthetic_league import generate_league
+from apps.analytics.services.derived_data import rebuild_match_derived_data
+from apps.analytics.services.match_dashboard import get_match_overview
+from apps.analytics.services.player_match_profile import (
+    PlayerMatchProfileService,
+)
+
+
+# ============================================================
+# CONSTANTS
+# ============================================================
+
+# generate_league() arguments per data size
+BENCHMARK_SIZES = {
+    "tiny": {"competitions": 1, "teams": 4, "seasons": 1,
+             "events_per_match": 800},
+    "small": {"competitions": 1, "teams": 10, "seasons": 1,
+              "events_per_match": 1600},
+    "medium": {"competitions": 1, "teams": 20, "seasons": 1,
+               "events_per_match": 1600},
+    "large": {"competitions": 2, "teams": 20, "seasons": 2,
+              "events_per_match": 1700},
+}
+
+DEFAULT_REPEATS = 5
+DEFAULT_WARMUP = 1
+
+# Matches fed to the coach summary
+COACH_SUMMARY_MATCHES = 5
+
+# Concurrent read benchmark: reader threads and committed imports
+DEFAULT_CONCURRENT_READERS = 4
+CONCURRENT_IMPORTS = 3
+
+# SQLite settings it compares: stock rollback journal vs the tuning
+SQLITE_PROFILES = {
+    "default": {"journal_mode": "DELETE", "synchronous": "FULL"},
+    "tuned": DEFAULT_SQLITE_PRAGMAS,
+}
+
+# StatsBomb files the importer benchmark loads (repository root)
+STATSBOMB_DIR = Path(settings.BASE_DIR).parent / "statsbomb_data"
+
+
+class RollbackImport(Exception):
+    pass
+
+
+# ============================================================
+# DOMAIN: timing statistics (pure)
+# ============================================================
+
+def percentile(values: List[float], share: float) -> float:
+    """
+    Nearest-rank percentile.
+    """
+
+    ordered = sorted(values)
+    rank = max(1, round(share * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def timing_stats(seconds: List[float], queries: int) -> Dict:
+    return {
+        "runs": len(seconds),
+        "min_ms": round(min(seconds) * 1000, 2),
+        "median_ms": round(statistics.median(seconds) * 1000, 2),
+        "p95_ms": round(percentile(seconds, 0.95) * 1000, 2),
+        "mean_ms": round(statistics.fmean(seconds) * 1000, 2),
+        "queries": queries,
+    }
+
+
+def measure(fn: Callable, repeats: int, warmup: int) -> Dict:
+    """
+    Time fn() `repeats` times after `warmup` untimed calls.
+
+    Queries are counted in one extra call: capturing them forces the
+    debug cursor, which must not skew the timed runs.
+    """
+
+    for _ in range(warmup):
+        fn()
+
+    seconds = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        seconds.append(time.perf_counter() - started)
+
+    with CaptureQueriesContext(connection) as captured:
+        fn()
+
+    return timing_stats(seconds, len(captured.captured_queries))
+
+
+# ============================================================
+# INFRASTRUCTURE (Django ORM, test database)
+# ============================================================
+
+def dataset_counts() -> Dict[str, int]:
+    return {
+        "teams": Team.objects.count(),
+        "players": Player.objects.count(),
+        "matches": Match.objects.count(),
+        "appearances": Appearance.objects.count(),
+        "events": Event.objects.count(),
+    }
+
+
+def pick_subjects(match_ids: List) -> Dict:
+    """
+    The benchmarked match (mid-season), one of its starters and the
+    home team's latest matches up to it.
+    """
+
+    match = Match.objects.get(id=match_ids[len(match_ids) // 2])
+    home = MatchTeam.objects.get(match=match, side=MatchTeam.Side.HOME)
+    appearance = (
+        Appearance.objects
+        .filter(match=match, team_id=home.team_id, started=True)
+        .exclude(player__primary_position="GK")
+        .select_related("player")
+        .order_by("player__last_name", "player_id")
+        .first()
+    )
+    team_match_ids = list(
+        MatchTeam.objects
+        .filter(
+            team_id=home.team_id,
+            match__kickoff_time__lte=match.kickoff_time,
+        )
+        .order_by("-match__kickoff_time")
+        .values_list("match_id", flat=True)[:COACH_SUMMARY_MATCHES]
+    )
+
+    return {
+        "match": match,
+        "player": appearance.player,
+        "team_id": home.team_id,
+        "team_match_ids": team_match_ids,
+    }
+
+
+@contextlib.contextmanager
+def isolated_database():
+    """
+    Run inside a fresh test database, destroyed afterwards.
+
+    SQLite gets a file instead of its in-memory test database, so
+    journaling and concurrent connections behave as in deployment.
+    """
+
+    with contextlib.ExitStack() as stack:
+        test_settings = connection.settings_dict.setdefault("TEST", {})
+        if connection.vendor == "sqlite" and not test_settings.get("NAME"):
+            directory = stack.enter_context(tempfile.TemporaryDirectory())
+            test_settings["NAME"] = str(Path(directory) / "benchmark.sqlite3")
+            stack.callback(test_settings.pop, "NAME", None)
+
+        old_name = connection.creation.create_test_db(
+            verbosity=0, autoclobber=True, keepdb=False
+        )
+        try:
+            yield
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+# ============================================================
+# APPLICATION: benchmark cases
+# ============================================================
+
+def benchmark_cases(subjects: Dict) -> Dict[str, Callable]:
+    match = subjects["match"]
+    factory = APIRequestFactory()
+    match_list_view = MatchListAPIView.as_view()
+
+    def match_list():
+        response = match_list_view(factory.get("/api/analytics/matches/"))
+        response.render()
+
+    def importer():
+        # Timed for real, then rolled back so every run starts equal
+        try:
+            with transaction.atomic(), contextlib.redirect_stdout(
+                io.StringIO()
+            ):
+                import_match(
+                    STATSBOMB_DIR / "matches.json",
+                    STATSBOMB_DIR / "events.json",
+                )
+                raise RollbackImport()
+        except RollbackImport:
+            pass
+
+    cases = {
+        "match_overview": lambda: get_match_overview(match.id),
+        "player_match_profile": lambda: PlayerMatchProfileService(
+            match, subjects["player"]
+        ).build(),
+        "coach_summary": lambda: get_coach_summary(
+            subjects["team_id"], subjects["team_match_ids"]
+        ),
+        "match_list": match_list,
+    }
+    if (STATSBOMB_DIR / "events.json").exists():
+        cases["importer"] = importer
+
+    return cases
+
+
+def concurrent_reads(match_id, readers: int, imports: int) -> Dict:
+    """
+    Time get_match_overview in `readers` threads while a writer thread
+    commits `imports` StatsBomb imports.
+    """
+
+    stop = threading.Event()
+    lock = threading.Lock()
+    latencies: List[float] = []
+    import_seconds: List[float] = []
+    errors = {"reads": 0, "imports": 0}
+
+    def reader():
+        try:
+            while not stop.is_set():
+                started = time.perf_counter()
+                try:
+                    get_match_overview(match_id)
+                except OperationalError:
+                    with lock:
+                        errors["reads"] += 1
+                    continue
+                with lock:
+                    latencies.append(time.perf_counter() - started)
+        finally:
+            connections.close_all()
+
+    def writer():
+        try:
+            for _ in range(imports):
+                started = time.perf_counter()
+                try:
+                    import_match(
+                        STATSBOMB_DIR / "matches.json",
+                        STATSBOMB_DIR / "events.json",
+                    )
+                except OperationalError:
+                    errors["imports"] += 1
+                    continue
+                import_seconds.append(time.perf_counter() - started)
+        finally:
+            stop.set()
+            connections.close_all()
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads.append(threading.Thread(target=writer))
+
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    elapsed = time.perf_counter() - started
+
+    result = {
+        "readers": readers,
+        "imports": len(import_seconds),
+        "import_seconds": (
+            round(statistics.fmean(import_seconds), 3)
+            if import_seconds else None
+        ),
+        "reads": len(latencies),
+        "reads_per_second": round(len(latencies) / elapsed, 1),
+        "locked_errors": errors,
+    }
+    if latencies:
+        result["read_ms"] = {
+            key: value
+            for key, value in timing_stats(latencies, 0).items()
+            if key.endswith("_ms")
+        }
+        result["read_ms"]["max_ms"] = round(max(latencies) * 1000, 2)
+    return result
+
+
+def benchmark_concurrent_reads(match_id, readers: int, log=None) -> Dict:
+    """
+    concurrent_reads() under each SQLite profile, on fresh connections.
+    """
+
+    # Warm the lazy caches so readers stay read-only
+    get_match_overview(match_id)
+
+    results = {}
+    for profile, pragmas in SQLITE_PROFILES.items():
+        with override_settings(SQLITE_PRAGMAS=pragmas):
+            connections.close_all()
+            results[profile] = concurrent_reads(
+                match_id, readers, CONCURRENT_IMPORTS
+            )
+        connections.close_all()
+
+        if log is not None:
+            stats = results[profile]
+            log(
+                f"[concurrent/{profile}] {stats['reads_per_second']} reads/s, "
+                f"p95 {stats.get('read_ms', {}).get('p95_ms')} ms, "
+                f"imports {stats['import_seconds']} s, "
+                f"locked {stats['locked_errors']}"
+            )
+
+    return results
+
+
+def benchmark_size(
+    name: str,
+    seed: int,
+    repeats: int,
+    warmup: int,
+    concurrent_readers: int = 0,
+    log=None,
+) -> Dict:
+    started = time.perf_counter()
+    league = generate_league(seed=seed, **BENCHMARK_SIZES[name])
+    generate_seconds = time.perf_counter() - started
+
+    subjects = pick_subjects(league["match_ids"])
+
+    # Derived data only for the matches the read paths touch
+    started = time.perf_counter()
+    for match_id in {subjects["match"].id, *subjects["team_match_ids"]}:
+        rebuild_match_derived_data(match_id)
+    derived_seconds = time.perf_counter() - started
+
+    result = {
+        "size": name,
+        "params": BENCHMARK_SIZES[name],
+        "dataset": dataset_counts(),
+        "generate_seconds": round(generate_seconds, 2),
+        "derived_seconds_per_match": round(
+            derived_seconds / (1 + len(subjects["team_match_ids"])), 3
+        ),
+        "benchmarks": {},
+    }
+
+    for case, fn in benchmark_cases(subjects).items():
+        result["benchmarks"][case] = measure(fn, repeats, warmup)
+        if log is not None:
+            stats = result["benchmarks"][case]
+            log(
+                f"[{name}] {case}: median {stats['median_ms']} ms, "
+                f"p95 {stats['p95_ms']} ms, {stats['queries']} queries"
+            )
+
+    if concurrent_readers and connection.vendor == "sqlite" and (
+        STATSBOMB_DIR / "events.json"
+    ).exists():
+        result["concurrent_reads"] = benchmark_concurrent_reads(
+            subjects["match"].id, concurrent_readers, log=log
+        )
+
+    return result
+
+
+# ============================================================
+# APPLICATION (public API)
+# ============================================================
+
+def run_benchmarks(
+    sizes: List[str],
+    seed: int = 0,
+    repeats: int = DEFAULT_REPEATS,
+    warmup: int = DEFAULT_WARMUP,
+    isolated: bool = True,
+    concurrent_readers: int = DEFAULT_CONCURRENT_READERS,
+    log=None,
+) -> Dict:
+    """
+    Benchmark every size; returns a JSON-serializable report.
+
+    Sizes run smallest first. With isolated=False the synthetic data is
+    written to the configured database and left there. On SQLite each
+    size also measures reads during imports (concurrent_readers=0 skips).
+    """
+
+    unknown = set(sizes) - set(BENCHMARK_SIZES)
+    if unknown:
+        raise ValueError(f"Unknown sizes: {', '.join(sorted(unknown))}")
+
+    report = {
+        "started_at": timezone.now().isoformat(),
+        "seed": seed,
+        "repeats": repeats,
+        "warmup": warmup,
+        "environment": {
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "database": connection.vendor,
+            "isolated": isolated,
+        },
+        "sizes": [],
+    }
+
+    database = isolated_database() if isolated else contextlib.nullcontext()
+    with database:
+        for name in sorted(sizes, key=list(BENCHMARK_SIZES).index):
+            report["sizes"].append(
+                benchmark_size(
+                    name, seed, repeats, warmup,
+                    concurrent_readers=concurrent_readers,
+                    log=log,
+                )
+            )
+            if isolated:
+                call_command("flush", interactive=False, verbosity=0)
+
+    return report
@@ -17,6 +17,10 @@ from apps.players.models import Player
 from apps.competitions.models import Match, Competition, Season, MatchTeam
 from apps.events.models import Event
 
+from apps.jobs.queue import enqueue_on_commit
+
+from apps.analytics.jobs import FIT_MODELS, REBUILD_MATCH_DERIVED
+
 
 # =========================
 # CONFIG
@@ -24,6 +28,13 @@ from apps.events.models import Event
 
 MATCH_ID = 7585  # ← поменяйте на нужный матч
 
+# Размеры поля в координатах StatsBomb
+SB_PITCH_LENGTH = 120
+SB_PITCH_WIDTH = 80
+
+# Переобучение xT / xG после импорта: импорты подряд — одна задача
+REFIT_DELAY_SECONDS = 600
+
 
 EVENT_TYPE_MAP = {
     "Pass": "pass",
@@ -33,6 +44,7 @@ EVENT_TYPE_MAP = {
     "Duel": "duel",
     "Foul Committed": "foul",
     "Ball Recovery": "recovery",
+    "Carry": "carry",
 }
 
 
@@ -112,6 +124,14 @@ def get_or_create_player(sb_player: dict) -> Player:
     return player
 
 
+def normalize_location(loc):
+    # StatsBomb 120x80 → нормализованные 0-100
+    return (
+        float(loc[0]) / SB_PITCH_LENGTH * 100,
+        float(loc[1]) / SB_PITCH_WIDTH * 100,
+    )
+
+
 # =========================
 # MAIN IMPORT FUNCTION
 # =========================
@@ -184,10 +204,35 @@ def import_match(matches_json_path: Path, events_json_path: Path):
         else:
             event_type = EVENT_TYPE_MAP[sb_type]
 
+        # Получатель передачи (успешная передача — без "outcome")
+        receiver = None
+        event_outcome = Event.Outcome.UNKNOWN
+        sb_end = None
+        if sb_type == "Pass":
+            sb_pass = ev.get("pass", {})
+            sb_end = sb_pass.get("end_location")
+            event_outcome = (
+                Event.Outcome.FAIL if "outcome" in sb_pass
+                else Event.Outcome.SUCCESS
+            )
+            sb_recipient = sb_pass.get("recipient")
+            if sb_recipient:
+                if sb_recipient["id"] not in player_cache:
+                    player_cache[sb_recipient["id"]] = get_or_create_player(
+                        sb_recipient
+                    )
+                receiver = player_cache[sb_recipient["id"]]
+        elif sb_type == "Carry":
+            event_outcome = Event.Outcome.SUCCESS
+            sb_end = ev.get("carry", {}).get("end_location")
+
+        # Конечная точка передачи / ведения мяча
+        end_x = end_y = None
+        if sb_end:
+            end_x, end_y = normalize_location(sb_end)
+
         # Координаты
-        loc = ev.get("location") or [0, 0]
-        x = float(loc[0])
-        y = float(loc[1])
+        x, y = normalize_location(ev.get("location") or [0, 0])
 
         # Период (очень важно!)
         period = ev.get("period", 1)
@@ -202,16 +247,24 @@ def import_match(matches_json_path: Path, events_json_path: Path):
                 match=match,
                 team=team,
                 player=player,
+                secondary_player=receiver,
                 event_type=event_type,
+                outcome=event_outcome,
                 period=period,
                 x=x,
                 y=y,
+                end_x=end_x,
+                end_y=end_y,
                 timestamp_ms=timestamp_ms,
             )
         )
 
     # Массовое создание событий
-    Event.objects.bulk_create(events_to_create, batch_size=1000)
+    Event.objects.bulk_load(events_to_create, batch_size=1000)
+
+    # Производные данные — фоновая задача (manage.py run_jobs)
+    enqueue_on_commit(REBUILD_MATCH_DERIVED, match.id, priority=10)
+    enqueue_on_commit(FIT_MODELS, delay_seconds=REFIT_DELAY_SECONDS)
 
     print(f"Успешно импортирован матч {MATCH_ID}")
     return match, home_team, away_team
\ No newline at end of file
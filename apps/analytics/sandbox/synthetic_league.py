@@ -0,0 +1,438 @@
+"""
+Seeded synthetic league data for load and benchmark runs.
+
+Creates competitions with seasons of double round-robin fixtures, squads,
+appearances with substitutions and per-match event streams whose type
+mix, possession runs, pitch locations and outcomes follow typical
+event-data distributions. The same seed always yields the same league.
+"""
+
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List
+
+import numpy as np
+from django.db import transaction
+from django.utils import timezone
+
+from apps.competitions.models import Competition, Match, MatchTeam, Season
+from apps.events.models import Event
+from apps.players.models import Appearance, Player
+from apps.teams.models import Team
+
+
+# ============================================================
+# CONSTANTS
+# ============================================================
+
+# Event type mix (shares of all events; goals, assists and cards are
+# derived from shots / fouls below)
+EVENT_TYPE_SHARES = {
+    "pass": 0.43,
+    "carry": 0.22,
+    "pressure": 0.08,
+    "duel": 0.05,
+    "recovery": 0.05,
+    "turnover": 0.04,
+    "interception": 0.025,
+    "clearance": 0.025,
+    "tackle": 0.02,
+    "foul": 0.015,
+    "free_kick": 0.012,
+    "shot": 0.012,
+    "corner": 0.006,
+}
+
+PASS_SUCCESS_RATE = 0.8
+GOALS_PER_SHOT = 0.11
+ASSISTED_GOAL_RATE = 0.7
+YELLOW_PER_FOUL = 0.12
+RED_PER_FOUL = 0.004
+
+# Mean events a team strings together before losing the ball
+MEAN_POSSESSION_RUN = 6
+
+# Squad: (position, players) - 23 per team
+SQUAD_SHAPE = [("GK", 3), ("DF", 8), ("MF", 7), ("FW", 5)]
+STARTING_SHAPE = {"GK": 1, "DF": 4, "MF": 4, "FW": 2}
+SUBSTITUTIONS = 3
+
+# How often a position is on the ball (relative weights)
+POSITION_INVOLVEMENT = {"GK": 0.4, "DF": 1.0, "MF": 1.4, "FW": 0.9}
+
+# Mean pitch x (0-100, attacking direction) per event type
+EVENT_X_MEAN = {
+    "shot": 88, "goal": 92, "assist": 80, "corner": 99,
+    "clearance": 18, "interception": 35, "tackle": 40, "recovery": 38,
+    "pressure": 55, "duel": 50, "foul": 50, "free_kick": 50,
+}
+DEFAULT_X_MEAN = 52
+
+PERIOD_MS = 45 * 60 * 1000
+COUNTRIES = ["Uzbekistan", "Kazakhstan", "Kyrgyzstan", "Tajikistan"]
+FIRST_NAMES = [
+    "Aziz", "Bekzod", "Dilshod", "Eldor", "Farrukh", "Jamshid", "Otabek",
+    "Sardor", "Timur", "Ulugbek", "Rustam", "Sherzod", "Islom", "Javlon",
+]
+LAST_NAMES = [
+    "Karimov", "Tursunov", "Rashidov", "Yusupov", "Aliev", "Nazarov",
+    "Ismoilov", "Khamidov", "Sultanov", "Ergashev", "Mirzaev", "Saidov",
+]
+
+
+# ============================================================
+# DOMAIN: event stream (pure)
+# ============================================================
+
+@dataclass
+class Lineup:
+    team_id: uuid.UUID
+    # Player ids with their minute on / off the pitch
+    players: List[uuid.UUID]
+    positions: List[str]
+    minute_on: List[int]
+    minute_off: List[int]
+
+
+def generate_match_events(
+    rng: np.random.Generator,
+    home: Lineup,
+    away: Lineup,
+    events_count: int,
+) -> Dict[str, np.ndarray]:
+    """
+    Columns of one match's event stream, in time order.
+    """
+
+    n = events_count
+
+    # Match time: two halves with stoppage time
+    stoppage = rng.integers(60_000, 300_000, size=2)
+    periods = np.sort(1 + (rng.random(n) < 0.5).astype(np.int64))
+    offsets = np.where(periods == 1, 0, PERIOD_MS)
+    lengths = PERIOD_MS + stoppage[periods - 1]
+    timestamps = offsets + (rng.random(n) * lengths).astype(np.int64)
+    order = np.lexsort((timestamps, periods))
+    periods, timestamps = periods[order], timestamps[order]
+
+    # Possession runs alternate between the teams
+    runs = rng.geometric(1 / MEAN_POSSESSION_RUN, size=n)
+    owner = np.repeat(np.arange(len(runs)) % 2, runs)[:n]
+    if rng.random() < 0.5:
+        owner = 1 - owner
+
+    types = rng.choice(
+        list(EVENT_TYPE_SHARES),
+        size=n,
+        p=np.array(list(EVENT_TYPE_SHARES.values()))
+        / sum(EVENT_TYPE_SHARES.values()),
+    ).astype(object)
+
+    shots = types == "shot"
+    types[shots & (rng.random(n) < GOALS_PER_SHOT)] = "goal"
+    fouls = np.flatnonzero(types == "foul")
+    cards = rng.random(len(fouls))
+    types[fouls[cards < RED_PER_FOUL]] = "red_card"
+    types[fouls[(cards >= RED_PER_FOUL) & (cards < YELLOW_PER_FOUL)]] = (
+        "yellow_card"
+    )
+
+    # Assists: the event before an assisted goal, by the same team
+    goals = np.flatnonzero(types == "goal")
+    assisted = goals[(goals > 0) & (rng.random(len(goals)) < ASSISTED_GOAL_RATE)]
+    types[assisted - 1] = "assist"
+    owner[assisted - 1] = owner[assisted]
+
+    # Locations (normalized 0-100, own attacking direction)
+    x_mean = np.array([EVENT_X_MEAN.get(t, DEFAULT_X_MEAN) for t in types])
+    x = np.clip(rng.normal(x_mean, 14), 0, 100)
+    y = np.clip(rng.normal(50, 24, size=n), 0, 100)
+
+    moves = np.isin(types, ["pass", "carry"])
+    end_x = np.where(
+        moves,
+        np.clip(x + rng.normal(np.where(types == "pass", 7, 4), 10), 0, 100),
+        np.nan,
+    )
+    end_y = np.where(moves, np.clip(y + rng.normal(0, 12, size=n), 0, 100), np.nan)
+
+    outcomes = np.full(n, "unknown", dtype=object)
+    outcomes[moves] = np.where(
+        (types[moves] == "carry") | (rng.random(moves.sum()) < PASS_SUCCESS_RATE),
+        "success",
+        "fail",
+    )
+
+    # Actor: a player of the owning team on the pitch at that minute
+    minutes = timestamps // 60_000
+    players = np.empty(n, dtype=object)
+    receivers = np.full(n, None, dtype=object)
+    for side, lineup in enumerate((home, away)):
+        weights = np.array(
+            [POSITION_INVOLVEMENT[p] for p in lineup.positions]
+        )
+        on = np.array(lineup.minute_on)[:, None]
+        off = np.array(lineup.minute_off)[:, None]
+        idx = np.flatnonzero(owner == side)
+        active = (on <= minutes[idx]) & (minutes[idx] < off)
+        probs = active * weights[:, None]
+        probs = probs / probs.sum(axis=0)
+        # Inverse-CDF sampling, one column per event
+        picks = (probs.cumsum(axis=0) < rng.random(len(idx))).sum(axis=0)
+        picks = np.minimum(picks, len(lineup.players) - 1)
+        ids = np.array(lineup.players, dtype=object)
+        players[idx] = ids[picks]
+
+        passes = idx[(types[idx] == "pass") & (outcomes[idx] == "success")]
+        receivers[passes] = ids[rng.integers(0, len(ids), size=len(passes))]
+
+    teams = np.where(owner == 0, home.team_id, away.team_id).astype(object)
+
+    return {
+        "team_id": teams,
+        "player_id": players,
+        "secondary_player_id": receivers,
+        "event_type": types,
+        "outcome": outcomes,
+        "period": periods,
+        "timestamp_ms": timestamps,
+        "x": np.round(x, 2),
+        "y": np.round(y, 2),
+        "end_x": np.round(end_x, 2),
+        "end_y": np.round(end_y, 2),
+    }
+
+
+def build_lineup(
+    rng: np.random.Generator,
+    team_id: uuid.UUID,
+    squad: List[Player],
+) -> Lineup:
+    """
+    Starting XI plus substitutes with their minutes on / off.
+    """
+
+    by_position: Dict[str, List[Player]] = {}
+    for player in squad:
+        by_position.setdefault(player.primary_position, []).append(player)
+
+    starters, bench = [], []
+    for position, count in STARTING_SHAPE.items():
+        pool = list(by_position.get(position, []))
+        rng.shuffle(pool)
+        starters += pool[:count]
+        bench += pool[count:]
+
+    players = list(starters)
+    minute_on = [0] * len(starters)
+    minute_off = [95] * len(starters)
+
+    outfield = [i for i, p in enumerate(starters) if p.primary_position != "GK"]
+    bench = [p for p in bench if p.primary_position != "GK"]
+    rng.shuffle(bench)
+    for slot, substitute in zip(
+        rng.choice(outfield, size=SUBSTITUTIONS, replace=False), bench
+    ):
+        minute = int(rng.integers(55, 88))
+        minute_off[slot] = minute
+        players.append(substitute)
+        minute_on.append(minute)
+        minute_off.append(95)
+
+    return Lineup(
+        team_id=team_id,
+        players=[p.id for p in players],
+        positions=[p.primary_position for p in players],
+        minute_on=minute_on,
+        minute_off=minute_off,
+    )
+
+
+def round_robin(team_count: int) -> List[List[tuple]]:
+    """
+    Double round-robin rounds of (home, away) team indexes (circle method).
+    """
+
+    teams = list(range(team_count))
+    if team_count % 2:
+        teams.append(None)
+
+    rounds = []
+    for _ in range(len(teams) - 1):
+        pairs = [
+            (teams[i], teams[-1 - i]) for i in range(len(teams) // 2)
+        ]
+        rounds.append([p for p in pairs if None not in p])
+        teams = [teams[0], teams[-1]] + teams[1:-1]
+
+    return rounds + [[(a, h) for h, a in r] for r in rounds]
+
+
+# ============================================================
+# INFRASTRUCTURE (Django ORM)
+# ============================================================
+
+def create_squad(rng: np.random.Generator, team_name: str) -> List[Player]:
+    players = []
+    for position, count in SQUAD_SHAPE:
+        for _ in range(count):
+            players.append(Player(
+                first_name=str(rng.choice(FIRST_NAMES)),
+                last_name=str(rng.choice(LAST_NAMES)),
+                date_of_birth=date(int(rng.integers(1988, 2006)), 1, 1)
+                + timedelta(days=int(rng.integers(0, 365))),
+                nationality="Uzbekistan",
+                primary_position=position,
+            ))
+    return Player.objects.bulk_create(players)
+
+
+def insert_match(
+    rng: np.random.Generator,
+    season: Season,
+    kickoff: datetime,
+    home: Team,
+    away: Team,
+    squads: Dict[uuid.UUID, List[Player]],
+    events_per_match: int,
+) -> Match:
+    match = Match.objects.create(
+        season=season,
+        kickoff_time=kickoff,
+        status=Match.Status.FINISHED,
+    )
+    MatchTeam.objects.bulk_create([
+        MatchTeam(match=match, team=home, side=MatchTeam.Side.HOME),
+        MatchTeam(match=match, team=away, side=MatchTeam.Side.AWAY),
+    ])
+
+    lineups = [
+        build_lineup(rng, team.id, squads[team.id]) for team in (home, away)
+    ]
+
+    Appearance.objects.bulk_create([
+        Appearance(
+            player_id=player_id,
+            match=match,
+            team_id=lineup.team_id,
+            minutes_played=min(off, 90) - on,
+            started=on == 0,
+        )
+        for lineup in lineups
+        for player_id, on, off in zip(
+            lineup.players, lineup.minute_on, lineup.minute_off
+        )
+    ])
+
+    n = int(rng.normal(events_per_match, events_per_match * 0.08))
+    columns = generate_match_events(rng, *lineups, max(n, 100))
+
+    def value(name, i):
+        v = columns[name][i]
+        return None if np.isnan(v) else float(v)
+
+    Event.objects.bulk_load(
+        (
+            Event(
+                match=match,
+                team_id=columns["team_id"][i],
+                player_id=columns["player_id"][i],
+                secondary_player_id=columns["secondary_player_id"][i],
+                event_type=columns["event_type"][i],
+                outcome=columns["outcome"][i],
+                period=int(columns["period"][i]),
+                timestamp_ms=int(columns["timestamp_ms"][i]),
+                x=float(columns["x"][i]),
+                y=float(columns["y"][i]),
+                end_x=value("end_x", i),
+                end_y=value("end_y", i),
+            )
+            for i in range(len(columns["event_type"]))
+        ),
+        batch_size=2000,
+    )
+
+    match.events_count = len(columns["event_type"])
+    return match
+
+
+# ============================================================
+# APPLICATION (public API)
+# ============================================================
+
+def generate_league(
+    seed: int = 0,
+    competitions: int = 1,
+    teams: int = 10,
+    seasons: int = 1,
+    events_per_match: int = 1600,
+    log=None,
+) -> Dict:
+    """
+    Create a synthetic league; returns counts and the created match ids.
+
+    Every match is inserted in its own transaction, so a large run can
+    be interrupted without losing what was already written.
+    """
+
+    rng = np.random.default_rng(seed)
+    tag = f"{seed:04d}"
+    created = {"competitions": 0, "teams": 0, "players": 0, "matches": 0,
+               "events": 0, "match_ids": []}
+
+    for c in range(competitions):
+        with transaction.atomic():
+            competition = Competition.objects.create(
+                name=f"Synthetic League {tag}-{c + 1}",
+                country=COUNTRIES[c % len(COUNTRIES)],
+                level=1 + c // len(COUNTRIES),
+            )
+            club_teams = Team.objects.bulk_create([
+                Team(
+                    name=f"Synthetic FC {tag}-{c + 1}-{t + 1}",
+                    short_name=f"S{c + 1}-{t + 1}",
+                    competition=competition,
+                )
+                for t in range(teams)
+            ])
+            squads = {
+                team.id: create_squad(rng, team.name) for team in club_teams
+            }
+
+        created["competitions"] += 1
+        created["teams"] += len(club_teams)
+        created["players"] += sum(len(s) for s in squads.values())
+
+        for s in range(seasons):
+            year = 2020 + s
+            season = Season.objects.create(
+                competition=competition,
+                name=f"{year}/{(year + 1) % 100:02d}",
+                start_date=date(year, 8, 1),
+                end_date=date(year + 1, 5, 31),
+            )
+
+            for round_number, fixtures in enumerate(round_robin(teams)):
+                day = season.start_date + timedelta(weeks=round_number)
+                kickoff = timezone.make_aware(
+                    datetime.combine(day, time(18, 0))
+                )
+                for home, away in fixtures:
+                    with transaction.atomic():
+                        match = insert_match(
+                            rng, season, kickoff,
+                            club_teams[home], club_teams[away],
+                            squads, events_per_match,
+                        )
+                    created["matches"] += 1
+                    created["events"] += match.events_count
+                    created["match_ids"].append(match.id)
+
+                if log is not None:
+                    log(
+                        f"{competition.name} {season.name}: round "
+                        f"{round_number + 1}, {created['events']} events"
+                    )
+
+    return created
@@ -0,0 +1,48 @@
+from rest_framework import serializers
+
+from apps.events.models import Event
+
+
+class LiveEventSerializer(serializers.Serializer):
+    """
+    One event of a live ingestion batch (normalized 0-100 coordinates).
+    """
+
+    team_id = serializers.UUIDField()
+    player_id = serializers.UUIDField(required=False, allow_null=True)
+    secondary_player_id = serializers.UUIDField(
+        required=False, allow_null=True
+    )
+    event_type = serializers.ChoiceField(choices=Event.Type.choices)
+    outcome = serializers.ChoiceField(
+        choices=Event.Outcome.choices,
+        default=Event.Outcome.UNKNOWN,
+    )
+    period = serializers.IntegerField(min_value=1, max_value=5)
+    timestamp_ms = serializers.IntegerField(min_value=0)
+    x = serializers.FloatField(
+        required=False, allow_null=True, min_value=0, max_value=100
+    )
+    y = serializers.FloatField(
+        required=False, allow_null=True, min_value=0, max_value=100
+    )
+    end_x = serializers.FloatField(
+        required=False, allow_null=True, min_value=0, max_value=100
+    )
+    end_y = serializers.FloatField(
+        required=False, allow_null=True, min_value=0, max_value=100
+    )
+    confidence = serializers.FloatField(
+        required=False, allow_null=True, min_value=0, max_value=1
+    )
+
+
+class LiveEventBatchSerializer(serializers.Serializer):
+    events = LiveEventSerializer(many=True, allow_empty=False)
+
+    def validate_events(self, events):
+        if len(events) > 1000:
+            raise serializers.ValidationError(
+                "At most 1000 events per batch"
+            )
+        return events
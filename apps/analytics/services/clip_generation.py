@@ -0,0 +1,518 @@
+import hashlib
+import os
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List
+from uuid import UUID
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connections, transaction
+
+from apps.analytics.services.clip_index import touch_video_upload
+
+
+# ============================================================
+# CONSTANTS (Domain knowledge)
+# ============================================================
+
+CLIPS_DIR = "video_clips"
+
+# Highlight window around an event (video seconds)
+CLIP_PRE_SECONDS = 2.0
+CLIP_POST_SECONDS = 4.0
+
+# Windows closer than this are cut as one clip
+MERGE_GAP_SECONDS = 1.0
+
+# Longest merged clip; longer runs are split
+MAX_CLIP_SECONDS = 30.0
+
+# Event types that make a highlight, by clip type
+HIGHLIGHT_CLIP_TYPES = {
+    "goal": "goal",
+    "penalty": "dangerous_moment",
+    "shot": "shot",
+    "assist": "pass",
+    "tackle": "tackle",
+}
+
+# Clip type of a merged window: the most important of its events
+CLIP_TYPE_PRIORITY = ["goal", "dangerous_moment", "shot", "pass", "tackle"]
+
+# Detections below this confidence never make a clip
+MIN_HIGHLIGHT_CONFIDENCE = 0.5
+
+# Clips per ffmpeg invocation (bounded command line)
+CLIP_BATCH_SIZE = 40
+
+DEFAULT_CLIP_WORKERS = 2
+
+# VideoClip columns refreshed when a clip is planned again
+CLIP_FIELDS = [
+    "event_id",
+    "clip_type",
+    "title",
+    "file_size",
+    "duration_seconds",
+    "start_time_seconds",
+    "end_time_seconds",
+    "timestamp_ms",
+    "confidence",
+    "thumbnail_path",
+]
+
+
+# ============================================================
+# DOMAIN: highlight windows (pure)
+# ============================================================
+
+@dataclass
+class HighlightWindow:
+    start: float
+    end: float
+    clip_type: str
+    timestamp_ms: int
+    event_id: UUID | None = None
+    confidence: float | None = None
+    event_ids: List[UUID] = field(default_factory=list)
+
+
+def clip_priority(clip_type: str) -> int:
+    if clip_type in CLIP_TYPE_PRIORITY:
+        return CLIP_TYPE_PRIORITY.index(clip_type)
+    return len(CLIP_TYPE_PRIORITY)
+
+
+def merge_windows(
+    windows: Iterable[HighlightWindow],
+    gap: float = MERGE_GAP_SECONDS,
+    max_length: float = MAX_CLIP_SECONDS,
+) -> List[HighlightWindow]:
+    """
+    Merge overlapping or adjacent windows in one sorted pass.
+
+    A merged window takes the clip type, timestamp and event of its most
+    important member (ties: the most confident one).
+    """
+
+    merged: List[HighlightWindow] = []
+
+    for window in sorted(windows, key=lambda w: (w.start, w.end)):
+        last = merged[-1] if merged else None
+        if (
+            last is not None
+            and window.start <= last.end + gap
+            and max(last.end, window.end) - last.start <= max_length
+        ):
+            last.end = max(last.end, window.end)
+            last.event_ids += window.event_ids
+            if (
+                clip_priority(window.clip_type),
+                -(window.confidence or 0.0),
+            ) < (
+                clip_priority(last.clip_type),
+                -(last.confidence or 0.0),
+            ):
+                last.clip_type = window.clip_type
+                last.timestamp_ms = window.timestamp_ms
+                last.event_id = window.event_id
+                last.confidence = window.confidence
+            continue
+
+        merged.append(HighlightWindow(
+            start=window.start,
+            end=window.end,
+            clip_type=window.clip_type,
+            timestamp_ms=window.timestamp_ms,
+            event_id=window.event_id,
+            confidence=window.confidence,
+            event_ids=list(window.event_ids),
+        ))
+
+    return merged
+
+
+# ============================================================
+# DOMAIN: encoding (runs in worker processes)
+# ============================================================
+
+@dataclass
+class ClipSpec:
+    """
+    One output of an encoding pass (times in source video seconds).
+    """
+
+    index: int
+    start: float
+    end: float
+    thumbnail_at: float
+    output_path: str
+    thumbnail_path: str
+
+    def paths(self) -> List[str]:
+        return [self.output_path, self.thumbnail_path]
+
+    def is_done(self) -> bool:
+        return all(
+            os.path.exists(path) and os.path.getsize(path) > 0
+            for path in self.paths()
+        )
+
+
+def partial_path(path: str) -> str:
+    # Keeps the extension, so encoders still infer the container
+    root, ext = os.path.splitext(path)
+    return f"{root}.part{ext}"
+
+
+class FFmpegClipEncoder:
+    """
+    Cuts many clips and thumbnails from one source file.
+
+    Clips are sorted and cut in batches of CLIP_BATCH_SIZE. Each batch is
+    one ffmpeg process: the input is seeked once to the batch start and
+    decoded once for all of its outputs, so the source is decoded a
+    single time overall. Outputs are written under .part names and
+    renamed when the batch succeeds.
+    """
+
+    def __init__(
+        self,
+        ffmpeg_path: str | None = None,
+        batch_size: int = CLIP_BATCH_SIZE,
+    ):
+        self.ffmpeg_path = ffmpeg_path or getattr(
+            settings, "FFMPEG_PATH", "ffmpeg"
+        )
+        self.batch_size = batch_size
+
+    def encode(self, source: str, clips: List[ClipSpec]) -> None:
+        clips = sorted(clips, key=lambda c: c.start)
+        for i in range(0, len(clips), self.batch_size):
+            self._encode_batch(source, clips[i:i + self.batch_size])
+
+    def _encode_batch(self, source: str, clips: List[ClipSpec]) -> None:
+        seek = max(0.0, clips[0].start)
+        args = [
+            self.ffmpeg_path, "-nostdin", "-y", "-v", "error",
+            "-ss", f"{seek:.3f}", "-i", source,
+        ]
+
+        for clip in clips:
+            args += [
+                "-map", "0:v:0", "-map", "0:a:0?",
+                "-ss", f"{clip.start - seek:.3f}",
+                "-t", f"{clip.end - clip.start:.3f}",
+                "-c:v", "libx264", "-preset", "veryfast", "-crf", "23",
+                "-c:a", "aac", "-movflags", "+faststart",
+                partial_path(clip.output_path),
+                "-map", "0:v:0",
+                "-ss", f"{clip.thumbnail_at - seek:.3f}",
+                "-frames:v", "1", "-q:v", "3",
+                partial_path(clip.thumbnail_path),
+            ]
+
+        process = subprocess.run(args, capture_output=True, text=True)
+        if process.returncode != 0:
+            raise RuntimeError(
+                f"ffmpeg failed on {source}: {process.stderr[-2000:]}"
+            )
+
+        for clip in clips:
+            os.replace(partial_path(clip.output_path), clip.output_path)
+            os.replace(
+                partial_path(clip.thumbnail_path), clip.thumbnail_path
+            )
+
+
+class StubClipEncoder:
+    """
+    Writes placeholder files instead of invoking ffmpeg (tests, dev).
+    """
+
+    def encode(self, source: str, clips: List[ClipSpec]) -> None:
+        for clip in clips:
+            for path in (clip.output_path, clip.thumbnail_path):
+                with open(path, "w") as f:
+                    f.write(f"{source} {clip.start:.3f}-{clip.end:.3f}")
+
+
+def encode_clips(encoder, source: str, clips: List[ClipSpec]) -> Dict:
+    """
+    Worker entry point: encode the clips not on disk yet.
+    """
+
+    started = time.perf_counter()
+    pending = [clip for clip in clips if not clip.is_done()]
+
+    if pending:
+        os.makedirs(os.path.dirname(pending[0].output_path), exist_ok=True)
+        encoder.encode(source, pending)
+
+    return {
+        "encoded": len(pending),
+        "resumed": len(clips) - len(pending),
+        "sizes": {
+            clip.index: os.path.getsize(clip.output_path) for clip in clips
+        },
+        "encode_seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+# ============================================================
+# INFRASTRUCTURE (Django ORM, file system)
+# ============================================================
+
+def clips_directory(upload_id: UUID) -> Path:
+    return Path(settings.MEDIA_ROOT) / CLIPS_DIR / str(upload_id)
+
+
+def clip_stem(upload, start: float, end: float, thumbnail_at: float) -> str:
+    """
+    File name stem keyed on what the files contain, not on the clip's
+    position in the plan: a replanned window never reuses another's file.
+    """
+
+    content = (
+        f"{upload.file_path}|{upload.file_size}|"
+        f"{start:.3f}|{end:.3f}|{thumbnail_at:.3f}"
+    )
+    digest = hashlib.sha1(content.encode()).hexdigest()[:16]
+    return f"{upload.id}_clip_{digest}"
+
+
+def prune_clip_files(upload_id: UUID, specs: List[ClipSpec]) -> int:
+    """
+    Delete files of an upload's clip directory that the plan no longer
+    references (earlier plans, interrupted .part outputs).
+    """
+
+    directory = clips_directory(upload_id)
+    if not directory.is_dir():
+        return 0
+
+    planned = {path for spec in specs for path in spec.paths()}
+    removed = 0
+    for path in directory.iterdir():
+        if path.is_file() and str(path) not in planned:
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def source_path(upload) -> Path:
+    return Path(settings.MEDIA_ROOT) / upload.file_path
+
+
+def load_highlight_windows(upload) -> List[HighlightWindow]:
+    """
+    Highlight windows (video seconds) of the events an upload covers.
+    """
+
+    Event = apps.get_model("events", "Event")
+
+    offset_ms = upload.video_start_offset_ms
+    events = Event.objects.filter(
+        match_id=upload.match_id,
+        event_type__in=list(HIGHLIGHT_CLIP_TYPES),
+        timestamp_ms__gte=offset_ms,
+    ).exclude(confidence__lt=MIN_HIGHLIGHT_CONFIDENCE)
+    if upload.period is not None:
+        events = events.filter(period=upload.period)
+    if upload.duration_seconds:
+        events = events.filter(
+            timestamp_ms__lte=offset_ms + upload.duration_seconds * 1000
+        )
+
+    windows = []
+    for event_id, event_type, timestamp_ms, confidence in events.values_list(
+        "id", "event_type", "timestamp_ms", "confidence"
+    ):
+        at = (timestamp_ms - offset_ms) / 1000
+        end = at + CLIP_POST_SECONDS
+        if upload.duration_seconds:
+            end = min(end, upload.duration_seconds)
+        windows.append(HighlightWindow(
+            start=max(0.0, at - CLIP_PRE_SECONDS),
+            end=end,
+            clip_type=HIGHLIGHT_CLIP_TYPES[event_type],
+            timestamp_ms=timestamp_ms,
+            event_id=event_id,
+            confidence=confidence,
+            event_ids=[event_id],
+        ))
+
+    return windows
+
+
+def plan_clip_specs(upload, windows: List[HighlightWindow]) -> List[ClipSpec]:
+    directory = clips_directory(upload.id)
+
+    specs = []
+    for index, window in enumerate(windows, start=1):
+        at = (window.timestamp_ms - upload.video_start_offset_ms) / 1000
+        thumbnail_at = min(max(at, window.start), window.end)
+        stem = clip_stem(upload, window.start, window.end, thumbnail_at)
+        specs.append(ClipSpec(
+            index=index,
+            start=window.start,
+            end=window.end,
+            thumbnail_at=thumbnail_at,
+            output_path=str(directory / f"{stem}.mp4"),
+            thumbnail_path=str(directory / f"{stem}_thumb.jpg"),
+        ))
+    return specs
+
+
+@transaction.atomic
+def store_video_clips(
+    upload,
+    windows: List[HighlightWindow],
+    specs: List[ClipSpec],
+    sizes: Dict[int, int],
+) -> int:
+    """
+    Sync VideoClip rows with the plan (keyed by file path).
+    """
+
+    VideoClip = apps.get_model("analytics", "VideoClip")
+
+    existing = {
+        clip.file_path: clip
+        for clip in VideoClip.objects.filter(video_upload_id=upload.id)
+    }
+    planned = {spec.output_path for spec in specs}
+
+    VideoClip.objects.filter(
+        video_upload_id=upload.id,
+        file_path__in=[path for path in existing if path not in planned],
+    ).delete()
+
+    labels = dict(VideoClip.ClipType.choices)
+    to_create, to_update = [], []
+
+    for window, spec in zip(windows, specs):
+        values = {
+            "event_id": window.event_id,
+            "clip_type": window.clip_type,
+            "title": labels.get(window.clip_type, window.clip_type),
+            "file_size": sizes.get(spec.index),
+            "duration_seconds": round(spec.end - spec.start, 3),
+            "start_time_seconds": round(spec.start, 3),
+            "end_time_seconds": round(spec.end, 3),
+            "timestamp_ms": window.timestamp_ms,
+            "confidence": window.confidence,
+            "thumbnail_path": spec.thumbnail_path,
+        }
+
+        clip = existing.get(spec.output_path)
+        if clip is None:
+            to_create.append(VideoClip(
+                video_upload_id=upload.id,
+                file_path=spec.output_path,
+                **values,
+            ))
+        else:
+            for name, value in values.items():
+                setattr(clip, name, value)
+            to_update.append(clip)
+
+    VideoClip.objects.bulk_create(to_create, batch_size=500)
+    VideoClip.objects.bulk_update(to_update, CLIP_FIELDS, batch_size=500)
+
+    # Bulk writes bypass signals: bump the clip index version explicitly
+    touch_video_upload(upload.id)
+    return len(to_create) + len(to_update)
+
+
+# ============================================================
+# APPLICATION (public API)
+# ============================================================
+
+def generate_video_clips(
+    upload_ids: Iterable[UUID],
+    encoder=None,
+    workers: int = DEFAULT_CLIP_WORKERS,
+) -> List[Dict]:
+    """
+    Plan, encode and store highlight clips of several uploads.
+
+    Planning and storing run here; encoding runs in a pool of at most
+    `workers` processes, one task (one decode pass) per upload. Clip files
+    are named after their content; those already on disk are not encoded
+    again, so an interrupted run resumes where it stopped, and files no
+    longer planned are deleted once the clips are stored. Every result
+    reports per-stage timings.
+    """
+
+    VideoUpload = apps.get_model("analytics", "VideoUpload")
+
+    encoder = encoder or FFmpegClipEncoder()
+    plans = {}
+    results = []
+
+    for upload in VideoUpload.objects.filter(
+        id__in=list(upload_ids), match__isnull=False
+    ):
+        started = time.perf_counter()
+        windows = merge_windows(load_highlight_windows(upload))
+        plans[upload.id] = (
+            upload,
+            windows,
+            plan_clip_specs(upload, windows),
+            round(time.perf_counter() - started, 3),
+        )
+
+    # Forked workers must not inherit open DB connections
+    connections.close_all()
+
+    with ProcessPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {
+            pool.submit(
+                encode_clips, encoder, str(source_path(upload)), specs
+            ): upload_id
+            for upload_id, (upload, _, specs, _) in plans.items()
+            if specs
+        }
+
+        encoded = {}
+        for future in as_completed(futures):
+            upload_id = futures[future]
+            try:
+                encoded[upload_id] = future.result()
+            except Exception as exc:
+                encoded[upload_id] = {"error": str(exc)}
+
+    for upload_id, (upload, windows, specs, plan_seconds) in plans.items():
+        outcome = encoded.get(upload_id, {"encoded": 0, "sizes": {}})
+        result = {
+            "video_id": str(upload_id),
+            "clips": len(specs),
+            "plan_seconds": plan_seconds,
+            **{k: v for k, v in outcome.items() if k != "sizes"},
+        }
+
+        if "error" not in outcome:
+            started = time.perf_counter()
+            store_video_clips(upload, windows, specs, outcome["sizes"])
+            result["pruned"] = prune_clip_files(upload_id, specs)
+            result["store_seconds"] = round(time.perf_counter() - started, 3)
+
+        results.append(result)
+
+    return results
+
+
+def generate_match_video_clips(match_id: UUID, **kwargs) -> List[Dict]:
+    VideoUpload = apps.get_model("analytics", "VideoUpload")
+
+    return generate_video_clips(
+        VideoUpload.objects
+        .filter(match_id=match_id, status=VideoUpload.Status.COMPLETED)
+        .values_list("id", flat=True),
+        **kwargs,
+    )
@@ -0,0 +1,299 @@
+import threading
+from typing import Dict, Iterable, List, Tuple
+from uuid import UUID
+
+import numpy as np
+from django.apps import apps
+from django.db.models import Count, Max
+from django.utils import timezone
+
+from apps.analytics.instrumentation import query_budget
+
+
+# ============================================================
+# DOMAIN: static interval index (pure)
+# ============================================================
+
+class PeriodClipIntervals:
+    """
+    Clip intervals of one match period, in match time (ms).
+
+    Intervals are sorted by start, and `max_length` bounds every
+    interval. Any interval covering t therefore starts in
+    [t - max_length, t], a slice found by binary search. Queries cost
+    O(log n + k) instead of a scan over every clip.
+    """
+
+    def __init__(self, starts, ends, positions):
+        order = np.argsort(starts, kind="stable")
+        self.starts = np.asarray(starts, dtype=np.int64)[order]
+        self.ends = np.asarray(ends, dtype=np.int64)[order]
+        self.positions = np.asarray(positions, dtype=np.int64)[order]
+        self.max_length = (
+            int((self.ends - self.starts).max()) if len(self.starts) else 0
+        )
+
+    def overlapping(self, from_ms: int, to_ms: int) -> np.ndarray:
+        """
+        Positions of intervals intersecting [from_ms, to_ms].
+        """
+
+        lo = np.searchsorted(self.starts, from_ms - self.max_length, "left")
+        hi = np.searchsorted(self.starts, to_ms, "right")
+        hits = lo + np.flatnonzero(self.ends[lo:hi] >= from_ms)
+        return self.positions[hits]
+
+    def covering(self, t_ms: int) -> np.ndarray:
+        return self.overlapping(t_ms, t_ms)
+
+    def covering_many(self, times_ms: np.ndarray) -> List[np.ndarray]:
+        """
+        covering() for many instants with vectorized bisection.
+        """
+
+        times_ms = np.asarray(times_ms, dtype=np.int64)
+        lo = np.searchsorted(self.starts, times_ms - self.max_length, "left")
+        hi = np.searchsorted(self.starts, times_ms, "right")
+        return [
+            self.positions[a + np.flatnonzero(self.ends[a:b] >= t)]
+            for t, a, b in zip(times_ms.tolist(), lo.tolist(), hi.tolist())
+        ]
+
+
+class MatchClipIndex:
+    """
+    Interval index over every clip of a match, per period.
+
+    Clip rows are kept as parallel arrays; the per-period interval sets
+    store positions into them. Clips of full-match videos (period None)
+    sit in their own set, searched for every period: their match times
+    are absolute like event timestamps.
+    """
+
+    def __init__(self, match_id: UUID, clips: List[Dict]):
+        self.match_id = match_id
+        self.clips = clips
+        self.clip_types = np.array(
+            [clip["clip_type"] for clip in clips], dtype=object
+        )
+        self.upload_ids = np.array(
+            [clip["video_upload_id"] for clip in clips], dtype=object
+        )
+
+        by_period: Dict[int, List[int]] = {}
+        for position, clip in enumerate(clips):
+            by_period.setdefault(clip["period"], []).append(position)
+
+        self.periods = {
+            period: PeriodClipIntervals(
+                starts=[clips[p]["start_ms"] for p in positions],
+                ends=[clips[p]["end_ms"] for p in positions],
+                positions=positions,
+            )
+            for period, positions in by_period.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.clips)
+
+    def find(
+        self,
+        period: int | None = None,
+        from_ms: int | None = None,
+        to_ms: int | None = None,
+        clip_types: Iterable[str] | None = None,
+        upload_id: UUID | None = None,
+    ) -> List[Dict]:
+        """
+        Clips overlapping a match-time window, in time order.
+        """
+
+        lo = 0 if from_ms is None else from_ms
+        hi = np.iinfo(np.int64).max if to_ms is None else to_ms
+
+        periods = list(self.periods.values()) if period is None else [
+            self.periods[key]
+            for key in (period, None)
+            if key in self.periods
+        ]
+        if not periods:
+            return []
+
+        positions = np.concatenate([
+            intervals.overlapping(lo, hi) for intervals in periods
+        ])
+
+        if clip_types is not None:
+            positions = positions[
+                np.isin(self.clip_types[positions], list(clip_types))
+            ]
+        if upload_id is not None:
+            positions = positions[self.upload_ids[positions] == upload_id]
+
+        # Full-match clips sort with the requested period
+        return sorted(
+            (self.clips[p] for p in positions.tolist()),
+            key=lambda clip: (
+                clip["period"] if clip["period"] is not None else period or 0,
+                clip["start_ms"],
+            ),
+        )
+
+    def covering(self, period: int, t_ms: int) -> List[Dict]:
+        return self.find(period=period, from_ms=t_ms, to_ms=t_ms)
+
+    def clips_for_events(
+        self,
+        events: List[Tuple[UUID, int, int]],
+    ) -> Dict[UUID, List[UUID]]:
+        """
+        {event_id: [clip ids covering it]} for (event_id, period, ms).
+        """
+
+        result: Dict[UUID, List[UUID]] = {}
+
+        by_period: Dict[int, List[Tuple[UUID, int]]] = {}
+        for event_id, period, t_ms in events:
+            by_period.setdefault(period, []).append((event_id, t_ms))
+
+        for period, items in by_period.items():
+            times = [t for _, t in items]
+            for key in (period, None):
+                intervals = self.periods.get(key)
+                if intervals is None:
+                    continue
+                hits = intervals.covering_many(times)
+                for (event_id, _), positions in zip(items, hits):
+                    if len(positions):
+                        result.setdefault(event_id, []).extend(
+                            self.clips[p]["id"] for p in positions.tolist()
+                        )
+
+        return result
+
+
+# ============================================================
+# INFRASTRUCTURE (Django ORM, process cache)
+# ============================================================
+
+@query_budget(1)
+def match_clips_version(match_id: UUID) -> Tuple:
+    """
+    Changes whenever an upload of the match or one of its clips changes
+    (clip writes touch their upload's updated_at).
+    """
+
+    VideoUpload = apps.get_model("analytics", "VideoUpload")
+
+    stats = VideoUpload.objects.filter(match_id=match_id).aggregate(
+        uploads=Count("id"), updated=Max("updated_at")
+    )
+    return stats["uploads"], stats["updated"]
+
+
+def touch_video_upload(upload_id: UUID) -> None:
+    VideoUpload = apps.get_model("analytics", "VideoUpload")
+
+    VideoUpload.objects.filter(id=upload_id).update(
+        updated_at=timezone.now()
+    )
+
+
+@query_budget(1)
+def build_match_clip_index(match_id: UUID) -> MatchClipIndex:
+    """
+    One query over the match's clips, converted to match time.
+    """
+
+    VideoClip = apps.get_model("analytics", "VideoClip")
+
+    clips = []
+    for row in (
+        VideoClip.objects
+        .filter(video_upload__match_id=match_id)
+        .values(
+            "id", "video_upload_id", "event_id", "clip_type", "title",
+            "start_time_seconds", "end_time_seconds", "timestamp_ms",
+            "duration_seconds", "confidence",
+            "video_upload__period", "video_upload__video_start_offset_ms",
+        )
+    ):
+        offset_ms = row.pop("video_upload__video_start_offset_ms")
+        # None: full-match video, matched against every period
+        row["period"] = row.pop("video_upload__period")
+        row["start_ms"] = offset_ms + round(row["start_time_seconds"] * 1000)
+        row["end_ms"] = offset_ms + round(row["end_time_seconds"] * 1000)
+        clips.append(row)
+
+    return MatchClipIndex(match_id, clips)
+
+
+# Indexes built by this process: {match_id: (version, index)}
+_clip_indexes: Dict[UUID, Tuple[Tuple, MatchClipIndex]] = {}
+_clip_indexes_lock = threading.Lock()
+
+
+# ============================================================
+# APPLICATION (public API)
+# ============================================================
+
+@query_budget(2)
+def get_match_clip_index(match_id: UUID) -> MatchClipIndex:
+    """
+    The match's clip index, rebuilt only when its clips changed.
+    """
+
+    version = match_clips_version(match_id)
+
+    cached = _clip_indexes.get(match_id)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    index = build_match_clip_index(match_id)
+    with _clip_indexes_lock:
+        _clip_indexes[match_id] = (version, index)
+    return index
+
+
+def link_clip_events(upload_id: UUID) -> int:
+    """
+    Point clips without an event at the earliest event they cover.
+    """
+
+    VideoUpload = apps.get_model("analytics", "VideoUpload")
+    VideoClip = apps.get_model("analytics", "VideoClip")
+    Event = apps.get_model("events", "Event")
+
+    upload = VideoUpload.objects.get(id=upload_id)
+    index = get_match_clip_index(upload.match_id)
+
+    unlinked = {
+        clip["id"] for clip in index.find(upload_id=upload.id)
+        if clip["event_id"] is None
+    }
+    if not unlinked:
+        return 0
+
+    events = Event.objects.filter(match_id=upload.match_id)
+    if upload.period is not None:
+        events = events.filter(period=upload.period)
+
+    covering = index.clips_for_events(list(
+        events.order_by("timestamp_ms")
+        .values_list("id", "period", "timestamp_ms")
+    ))
+
+    links: Dict[UUID, UUID] = {}
+    for event_id, clip_ids in covering.items():
+        for clip_id in clip_ids:
+            if clip_id in unlinked:
+                # Events come in time order: keep the first one
+                links.setdefault(clip_id, event_id)
+
+    clips = list(VideoClip.objects.filter(id__in=list(links)))
+    for clip in clips:
+        clip.event_id = links[clip.id]
+    VideoClip.objects.bulk_update(clips, ["event"], batch_size=500)
+
+    touch_video_upload(upload.id)
+    return len(clips)
@@ -0,0 +1,54 @@
+from uuid import UUID
+
+from apps.analytics.services.event_columns import (
+    invalidate_match_columns,
+    rebuild_match_columns,
+)
+from apps.analytics.services.expected_goals import score_match_expected_goals
+from apps.analytics.services.expected_threat import value_match_expected_threat
+from apps.analytics.services.momentum import (
+    invalidate_match_momentum,
+    rebuild_match_momentum,
+)
+from apps.analytics.services.player_trends import refresh_player_match_metrics
+from apps.analytics.services.possession_chains import (
+    invalidate_possession_chains,
+    rebuild_possession_chains,
+)
+from apps.analytics.services.season_archive import invalidate_season_archive
+
+
+# ============================================================
+# APPLICATION (public API)
+# ============================================================
+
+def rebuild_match_derived_data(match_id: UUID) -> None:
+    """
+    Recompute every stored per-match derivative of the Event table.
+
+    Order matters: model values feed momentum and player metrics.
+    """
+
+    rebuild_match_columns(match_id)
+    rebuild_possession_chains(match_id)
+    value_match_expected_threat(match_id)
+    score_match_expected_goals(match_id)
+    rebuild_match_momentum(match_id)
+    refresh_player_match_metrics(match_id)
+
+
+def invalidate_match_derived_data(
+    match_id: UUID,
+    season_id: UUID | None,
+) -> None:
+    """
+    Drop the lazily rebuilt caches of a match whose events changed:
+    columnar files (and the heatmaps keyed on them), possession chains,
+    momentum series and the season archive.
+    """
+
+    invalidate_match_columns(match_id)
+    invalidate_possession_chains(match_id)
+    invalidate_match_momentum(match_id)
+    if season_id is not None:
+        invalidate_season_archive(season_id)
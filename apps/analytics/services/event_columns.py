@@ -0,0 +1,324 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List
+from uuid import UUID
+
+import numpy as np
+from django.apps import apps
+from django.conf import settings
+from django.db import models
+from django.db.models import ExpressionWrapper, F
+
+from apps.analytics.instrumentation import fill_budget, query_budget
+from apps.analytics.services.versioned_dirs import (
+    new_version_dir,
+    publish_version_dir,
+    remove_version_dir,
+    resolve_version_dir,
+)
+from config.db_router import use_primary
+
+
+# ============================================================
+# CONSTANTS (storage layout)
+# ============================================================
+
+COLUMNS_DIR = "event_columns"
+
+# Building a match's columns: one SELECT of its events
+COLUMNS_FILL_QUERIES = 1
+
+NO_PLAYER = -1
+
+COLUMN_DTYPES = {
+    "event_type": np.uint8,
+    "team": np.int8,
+    "player": np.int16,
+    "receiver": np.int16,
+    "timestamp_ms": np.uint32,
+    "period": np.uint8,
+    "x": np.float32,
+    "y": np.float32,
+    "end_x": np.float32,
+    "end_y": np.float32,
+    "outcome": np.uint8,
+}
+
+
+# ============================================================
+# DOMAIN: columnar view of one match
+# ============================================================
+
+@dataclass
+class MatchEventColumns:
+    """
+    Events of one match as parallel NumPy arrays.
+
+    Rows are ordered by (period, timestamp_ms). `team` holds indexes
+    into `teams`; `player` and `receiver` (secondary player, e.g. pass
+    receiver) hold indexes into `players` (NO_PLAYER when empty),
+    `event_type` / `outcome` hold Event storage codes and missing
+    coordinates are NaN.
+    """
+
+    match_id: UUID
+    teams: List[UUID]
+    players: List[UUID]
+    event_type: np.ndarray
+    team: np.ndarray
+    player: np.ndarray
+    receiver: np.ndarray
+    timestamp_ms: np.ndarray
+    period: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    end_x: np.ndarray
+    end_y: np.ndarray
+    outcome: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.event_type)
+
+    def type_mask(self, event_types: Iterable[str]) -> np.ndarray:
+        Event = apps.get_model("events", "Event")
+
+        codes = [
+            Event.TYPE_CODES[t]
+            for t in event_types
+            if t in Event.TYPE_CODES
+        ]
+        return np.isin(self.event_type, codes)
+
+    def counted_mask(self) -> np.ndarray:
+        """
+        Events that count towards volume metrics (Event.UNCOUNTED_TYPES).
+        """
+
+        Event = apps.get_model("events", "Event")
+        return ~self.type_mask(Event.UNCOUNTED_TYPES)
+
+    def team_mask(self, team_id: UUID) -> np.ndarray:
+        if team_id not in self.teams:
+            return np.zeros(len(self), dtype=bool)
+        return self.team == self.teams.index(team_id)
+
+    def counts_by_team(self, mask: np.ndarray) -> Dict[UUID, int]:
+        counts = np.bincount(self.team[mask], minlength=len(self.teams))
+        return {
+            team_id: int(counts[i])
+            for i, team_id in enumerate(self.teams)
+            if counts[i]
+        }
+
+    def counts_by_player(self, mask: np.ndarray) -> Dict[UUID, int]:
+        players = self.player[mask & (self.player != NO_PLAYER)]
+        counts = np.bincount(players, minlength=len(self.players))
+        return {
+            player_id: int(counts[i])
+            for i, player_id in enumerate(self.players)
+            if counts[i]
+        }
+
+
+# ============================================================
+# INFRASTRUCTURE (Django ORM → columns)
+# ============================================================
+
+@query_budget(1)
+def build_match_columns(match_id: UUID) -> MatchEventColumns:
+    """
+    Read all events of a match in one query and pack them into columns.
+    """
+
+    Event = apps.get_model("events", "Event")
+
+    # Raw storage codes: skip the field's code → string conversion
+    rows = (
+        Event.objects
+        .filter(match_id=match_id)
+        .order_by("period", "timestamp_ms")
+        .values_list(
+            ExpressionWrapper(
+                F("event_type"), output_field=models.IntegerField()
+            ),
+            "team_id",
+            "player_id",
+            "secondary_player_id",
+            "timestamp_ms",
+            "period",
+            "x",
+            "y",
+            "end_x",
+            "end_y",
+            ExpressionWrapper(
+                F("outcome"), output_field=models.IntegerField()
+            ),
+        )
+    )
+
+    teams: Dict[UUID, int] = {}
+    players: Dict[UUID, int] = {}
+    data: Dict[str, list] = {name: [] for name in COLUMN_DTYPES}
+
+    def player_index(player_id: UUID | None) -> int:
+        if player_id is None:
+            return NO_PLAYER
+        return players.setdefault(player_id, len(players))
+
+    for (
+        type_code, team_id, player_id, receiver_id,
+        ts, period, x, y, end_x, end_y, outcome,
+    ) in rows:
+        data["event_type"].append(type_code)
+        data["team"].append(teams.setdefault(team_id, len(teams)))
+        data["player"].append(player_index(player_id))
+        data["receiver"].append(player_index(receiver_id))
+        data["timestamp_ms"].append(ts)
+        data["period"].append(period)
+        data["x"].append(np.nan if x is None else x)
+        data["y"].append(np.nan if y is None else y)
+        data["end_x"].append(np.nan if end_x is None else end_x)
+        data["end_y"].append(np.nan if end_y is None else end_y)
+        data["outcome"].append(outcome)
+
+    return MatchEventColumns(
+        match_id=match_id,
+        teams=list(teams),
+        players=list(players),
+        **{
+            name: np.asarray(values, dtype=COLUMN_DTYPES[name])
+            for name, values in data.items()
+        },
+    )
+
+
+# ============================================================
+# INFRASTRUCTURE (memory-mapped files under MEDIA_ROOT)
+# ============================================================
+
+def match_columns_path(match_id: UUID) -> Path:
+    return Path(settings.MEDIA_ROOT) / COLUMNS_DIR / str(match_id)
+
+
+def save_match_columns(columns: MatchEventColumns) -> Path:
+    """
+    Persist columns as one .npy file per column.
+
+    Files are written to a new version directory and published with an
+    atomic link swap, so readers never see a half-written match.
+    """
+
+    path = match_columns_path(columns.match_id)
+    tmp_path = new_version_dir(path)
+
+    for name in COLUMN_DTYPES:
+        np.save(tmp_path / f"{name}.npy", getattr(columns, name))
+
+    np.save(tmp_path / "teams.npy", np.array([t.hex for t in columns.teams]))
+    np.save(
+        tmp_path / "players.npy", np.array([p.hex for p in columns.players])
+    )
+
+    publish_version_dir(path, tmp_path)
+
+    return path
+
+
+def read_match_columns(match_id: UUID) -> MatchEventColumns | None:
+    """
+    Open persisted columns as read-only memory maps (None if missing).
+    """
+
+    # Every file comes from the one version the link points at
+    path = resolve_version_dir(match_columns_path(match_id))
+    if path is None:
+        return None
+
+    try:
+        arrays = {
+            name: np.load(path / f"{name}.npy", mmap_mode="r")
+            for name in COLUMN_DTYPES
+        }
+        teams = np.load(path / "teams.npy")
+        players = np.load(path / "players.npy")
+    except (FileNotFoundError, ValueError):
+        # Replaced meanwhile or corrupted file: caller rebuilds
+        return None
+
+    return MatchEventColumns(
+        match_id=match_id,
+        teams=[UUID(t) for t in teams],
+        players=[UUID(p) for p in players],
+        **arrays,
+    )
+
+
+def match_columns_version(match_id: UUID) -> int | None:
+    """
+    Version token of persisted columns (changes on every rebuild),
+    used to key caches derived from them.
+    """
+
+    try:
+        return match_columns_path(match_id).stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def invalidate_match_columns(match_id: UUID) -> None:
+    remove_version_dir(match_columns_path(match_id))
+
+
+# ============================================================
+# APPLICATION (public API)
+# ============================================================
+
+def rebuild_match_columns(match_id: UUID) -> MatchEventColumns:
+    """
+    Rebuild the columnar cache of a match from the Event table.
+    """
+
+    # Persisted: must not be built from a lagging replica
+    use_primary()
+
+    columns = build_match_columns(match_id)
+    save_match_columns(columns)
+    return columns
+
+
+@query_budget(0)
+def load_match_columns(match_id: UUID) -> MatchEventColumns:
+    """
+    Columnar events of a match; built and persisted on first access.
+    """
+
+    columns = read_match_columns(match_id)
+    if columns is None:
+        with fill_budget(COLUMNS_FILL_QUERIES, "rebuild_match_columns"):
+            columns = rebuild_match_columns(match_id)
+    return columns
+
+
+def iter_match_columns(matches) -> Iterator[MatchEventColumns]:
+    """
+    Columnar events for a QuerySet of matches or an iterable of ids.
+
+    For a QuerySet, matches covered by a built season archive are served
+    as views into the archive instead of opening per-match files.
+    """
+
+    # season_archive builds on this module
+    from apps.analytics.services.season_archive import open_season_archive
+
+    if not hasattr(matches, "values_list"):
+        for match_id in matches:
+            yield load_match_columns(match_id)
+        return
+
+    for match_id, season_id in matches.values_list("id", "season_id"):
+        archive = open_season_archive(season_id)
+
+        if archive is not None and match_id in archive:
+            yield archive.match_columns(match_id)
+        else:
+            yield load_match_columns(match_id)
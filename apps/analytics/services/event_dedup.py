@@ -0,0 +1,168 @@
+import heapq
+import math
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List
+
+from django.conf import settings
+
+
+# ============================================================
+# CONSTANTS (defaults, overridable via settings.VIDEO_EVENT_DEDUP)
+# ============================================================
+
+DEFAULT_DEDUP_SETTINGS = {
+    # Detections of one action fall within this span of the first one
+    "WINDOW_MS": 800,
+    # ... and this far apart on the pitch (normalized 0-100 units)
+    "MAX_DISTANCE": 5.0,
+    # How far out of time order the detector output may be
+    "MAX_LAG_MS": 5000,
+}
+
+
+def dedup_settings() -> Dict:
+    return {
+        **DEFAULT_DEDUP_SETTINGS,
+        **getattr(settings, "VIDEO_EVENT_DEDUP", {}),
+    }
+
+
+# ============================================================
+# DOMAIN: confidence merge (pure)
+# ============================================================
+
+def merge_confidence(values: Iterable[float | None]) -> float | None:
+    """
+    Noisy-OR of the detections' confidences: 1 - prod(1 - c).
+
+    Repeated sightings of an action raise the survivor's confidence
+    without ever exceeding 1. Missing scores are ignored.
+    """
+
+    scores = [v for v in values if v is not None]
+    if not scores:
+        return None
+
+    miss = 1.0
+    for score in scores:
+        miss *= 1.0 - score
+    return round(1.0 - miss, 4)
+
+
+# ============================================================
+# DOMAIN: streaming sorted sweep (pure)
+# ============================================================
+
+@dataclass
+class DetectionCluster:
+    anchor_ms: int
+    best: Dict
+    confidences: List[float | None] = field(default_factory=list)
+
+    def add(self, row: Dict) -> None:
+        self.confidences.append(row["confidence"])
+        if (row["confidence"] or 0.0) > (self.best["confidence"] or 0.0):
+            self.best = row
+
+    def survivor(self) -> Dict:
+        return {
+            **self.best,
+            "confidence": merge_confidence(self.confidences),
+        }
+
+
+class EventDeduplicator:
+    """
+    Collapses repeated detections of one action into a single event.
+
+    Rows are swept in timestamp order. Each (event_type, team, period)
+    key keeps only the clusters still open, that is those that started
+    within WINDOW_MS. A row joins the first open cluster whose best
+    location is within MAX_DISTANCE, else it opens a new one. So each
+    row is compared with a handful of neighbours, not every other row.
+
+    Input may be out of time order by up to MAX_LAG_MS. Rows wait in a
+    heap until the watermark passes, so memory is bounded by the lag,
+    not by the file length.
+    """
+
+    def __init__(
+        self,
+        window_ms: int | None = None,
+        max_distance: float | None = None,
+        max_lag_ms: int | None = None,
+    ):
+        config = dedup_settings()
+        self.window_ms = (
+            config["WINDOW_MS"] if window_ms is None else window_ms
+        )
+        self.max_distance = (
+            config["MAX_DISTANCE"] if max_distance is None else max_distance
+        )
+        self.max_lag_ms = (
+            config["MAX_LAG_MS"] if max_lag_ms is None else max_lag_ms
+        )
+
+        self._heap: List[tuple] = []
+        self._sequence = 0
+        self._max_seen = -1
+        self._open: Dict[tuple, List[DetectionCluster]] = {}
+        self.merged = 0
+
+    def feed(self, row: Dict) -> Iterator[Dict]:
+        """
+        Add one mapped row; yields survivors whose window has closed.
+        """
+
+        heapq.heappush(
+            self._heap, (row["timestamp_ms"], self._sequence, row)
+        )
+        self._sequence += 1
+        self._max_seen = max(self._max_seen, row["timestamp_ms"])
+
+        watermark = self._max_seen - self.max_lag_ms
+        while self._heap and self._heap[0][0] < watermark:
+            yield from self._sweep(heapq.heappop(self._heap)[2])
+
+    def flush(self) -> Iterator[Dict]:
+        """
+        Drain everything still buffered (end of input).
+        """
+
+        while self._heap:
+            yield from self._sweep(heapq.heappop(self._heap)[2])
+
+        for clusters in self._open.values():
+            for cluster in clusters:
+                yield cluster.survivor()
+        self._open.clear()
+
+    def _sweep(self, row: Dict) -> Iterator[Dict]:
+        key = (row["event_type"], row["team_id"], row["period"])
+        clusters = self._open.setdefault(key, [])
+
+        # Close clusters the sweep has moved past
+        still_open = []
+        for cluster in clusters:
+            if row["timestamp_ms"] - cluster.anchor_ms > self.window_ms:
+                yield cluster.survivor()
+            else:
+                still_open.append(cluster)
+        clusters[:] = still_open
+
+        for cluster in clusters:
+            if self._near(cluster.best, row):
+                cluster.add(row)
+                self.merged += 1
+                return
+
+        cluster = DetectionCluster(anchor_ms=row["timestamp_ms"], best=row)
+        cluster.confidences.append(row["confidence"])
+        clusters.append(cluster)
+
+    def _near(self, a: Dict, b: Dict) -> bool:
+        # Without a location on either side, time alone decides
+        if None in (a["x"], a["y"], b["x"], b["y"]):
+            return True
+        distance = math.hypot(a["x"] - b["x"], a["y"] - b["y"])
+        return distance <= self.max_distance
@@ -0,0 +1,295 @@
+from typing import Dict, Iterable
+from uuid import UUID
+
+import numpy as np
+from django.apps import apps
+from django.db.models import Count, Q, Sum
+
+from apps.analytics.services.event_columns import iter_match_columns
+from apps.analytics.services.model_artifacts import (
+    ModelArtifact,
+    load_artifact,
+    save_artifact,
+)
+from apps.analytics.instrumentation import query_budget
+
+
+# ============================================================
+# CONSTANTS (Domain knowledge)
+# ============================================================
+
+ARTIFACT_NAME = "expected_goals"
+
+# Normalized 0-100 coordinates → metres (attacking towards x = 100)
+PITCH_LENGTH_M = 105.0
+PITCH_WIDTH_M = 68.0
+GOAL_WIDTH_M = 7.32
+
+SHOT_EVENTS = ["shot", "goal"]
+
+# Newton (IRLS) fit of the logistic model
+MAX_ITERATIONS = 25
+CONVERGENCE_EPS = 1e-8
+L2_PENALTY = 1e-3
+
+# Used until a model has been fitted on stored shots
+DEFAULT_COEFFICIENTS = np.array([-1.0, -0.12, 1.2])
+
+
+# ============================================================
+# DOMAIN: shot features and logistic model (pure, vectorized)
+# ============================================================
+
+def shot_features(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Design matrix [1, distance (m), goal mouth angle (rad)] per shot.
+    """
+
+    dx = (100.0 - np.asarray(x, dtype=np.float64)) / 100 * PITCH_LENGTH_M
+    dy = (np.asarray(y, dtype=np.float64) - 50.0) / 100 * PITCH_WIDTH_M
+    dx = np.maximum(dx, 0.0)
+
+    distance = np.hypot(dx, dy)
+
+    # Angle between the lines to both posts
+    half = GOAL_WIDTH_M / 2
+    angle = np.arctan2(
+        GOAL_WIDTH_M * dx,
+        dx ** 2 + dy ** 2 - half ** 2,
+    )
+
+    return np.column_stack([np.ones_like(distance), distance, angle])
+
+
+def sigmoid(z: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-np.clip(z, -30, 30)))
+
+
+def score_shots(
+    coefficients: np.ndarray,
+    x: np.ndarray,
+    y: np.ndarray,
+) -> np.ndarray:
+    """
+    Goal probability of every shot in one matrix product.
+    """
+
+    return sigmoid(shot_features(x, y) @ coefficients)
+
+
+def fit_logistic(
+    features: np.ndarray,
+    goals: np.ndarray,
+    max_iterations: int = MAX_ITERATIONS,
+) -> np.ndarray:
+    """
+    L2-regularized logistic regression by Newton's method (IRLS).
+    """
+
+    coefficients = np.zeros(features.shape[1])
+    penalty = L2_PENALTY * np.eye(features.shape[1])
+    penalty[0, 0] = 0.0  # intercept is not shrunk
+
+    for _ in range(max_iterations):
+        p = sigmoid(features @ coefficients)
+        gradient = features.T @ (p - goals) + penalty @ coefficients
+        hessian = (features.T * (p * (1 - p))) @ features + penalty
+
+        step = np.linalg.solve(hessian, gradient)
+        coefficients -= step
+
+        if np.max(np.abs(step)) < CONVERGENCE_EPS:
+            break
+
+    return coefficients
+
+
+def log_loss(probabilities: np.ndarray, goals: np.ndarray) -> float:
+    p = np.clip(probabilities, 1e-12, 1 - 1e-12)
+    return float(-np.mean(goals * np.log(p) + (1 - goals) * np.log(1 - p)))
+
+
+# ============================================================
+# INFRASTRUCTURE (Django ORM)
+# ============================================================
+
+def store_xg(ids: Iterable[UUID], values: Iterable[float]) -> int:
+    Event = apps.get_model("events", "Event")
+
+    rows = [
+        Event(id=event_id, xg=value)
+        for event_id, value in zip(ids, values)
+    ]
+    Event.objects.bulk_update(rows, ["xg"], batch_size=1000)
+    return len(rows)
+
+
+@query_budget(1)
+def load_team_xg(team_id: UUID, matches) -> Dict[str, float]:
+    """
+    Stored xG for / against a team over matches (one aggregate query).
+    """
+
+    Event = apps.get_model("events", "Event")
+
+    totals = (
+        Event.objects
+        .filter(match__in=matches, xg__isnull=False)
+        .aggregate(
+            xg_for=Sum("xg", filter=Q(team_id=team_id)),
+            xg_against=Sum("xg", filter=~Q(team_id=team_id)),
+        )
+    )
+
+    return {
+        "xg_for": round(totals["xg_for"] or 0.0, 2),
+        "xg_against": round(totals["xg_against"] or 0.0, 2),
+    }
+
+
+@query_budget(1)
+def load_team_xg_by_match(team_id: UUID, matches) -> Dict[UUID, Dict]:
+    """
+    Stored xG for / against per match (one grouped query).
+    """
+
+    Event = apps.get_model("events", "Event")
+
+    return {
+        row["match_id"]: {
+            "xg_for": row["xg_for"] or 0.0,
+            "xg_against": row["xg_against"] or 0.0,
+        }
+        for row in Event.objects
+        .filter(match__in=matches, xg__isnull=False)
+        .values("match_id")
+        .annotate(
+            xg_for=Sum("xg", filter=Q(team_id=team_id)),
+            xg_against=Sum("xg", filter=~Q(team_id=team_id)),
+        )
+    }
+
+
+@query_budget(1)
+def load_player_xg(match_id: UUID, player_id: UUID) -> Dict:
+    Event = apps.get_model("events", "Event")
+
+    totals = (
+        Event.objects
+        .filter(
+            match_id=match_id,
+            player_id=player_id,
+            event_type__in=SHOT_EVENTS,
+        )
+        .aggregate(xg=Sum("xg"), shots=Count("id"))
+    )
+
+    xg = round(totals["xg"] or 0.0, 2)
+    shots = totals["shots"]
+
+    return {
+        "xg": xg,
+        "shots": shots,
+        "xg_per_shot": round(xg / shots, 3) if shots else None,
+    }
+
+
+# ============================================================
+# APPLICATION (public API)
+# ============================================================
+
+def fit_expected_goals(matches=None) -> ModelArtifact:
+    """
+    Fit the xG model on stored shots and save it as a new version.
+    """
+
+    Event = apps.get_model("events", "Event")
+    Match = apps.get_model("competitions", "Match")
+
+    if matches is None:
+        matches = Match.objects.all()
+
+    goal_code = Event.TYPE_CODES[Event.Type.GOAL]
+    x_parts, y_parts, goal_parts = [], [], []
+
+    for columns in iter_match_columns(matches):
+        shots = (
+            columns.type_mask(SHOT_EVENTS)
+            & ~np.isnan(columns.x)
+            & ~np.isnan(columns.y)
+        )
+        x_parts.append(np.asarray(columns.x[shots], dtype=np.float64))
+        y_parts.append(np.asarray(columns.y[shots], dtype=np.float64))
+        goal_parts.append(columns.event_type[shots] == goal_code)
+
+    x = np.concatenate(x_parts) if x_parts else np.zeros(0)
+    y = np.concatenate(y_parts) if y_parts else np.zeros(0)
+    goals = (
+        np.concatenate(goal_parts).astype(np.float64)
+        if goal_parts else np.zeros(0)
+    )
+
+    features = shot_features(x, y)
+
+    # A logistic fit needs both classes
+    if 0 < goals.sum() < len(goals):
+        coefficients = fit_logistic(features, goals)
+    else:
+        coefficients = DEFAULT_COEFFICIENTS.copy()
+
+    return save_artifact(
+        ARTIFACT_NAME,
+        arrays={"coefficients": coefficients},
+        metadata={
+            "features": ["intercept", "distance_m", "angle_rad"],
+            "shots": int(len(goals)),
+            "goals": int(goals.sum()),
+            "log_loss": (
+                round(log_loss(sigmoid(features @ coefficients), goals), 4)
+                if len(goals) else None
+            ),
+        },
+    )
+
+
+def load_expected_goals_coefficients() -> np.ndarray:
+    """
+    Latest fitted coefficients (defaults until a model is fitted).
+    """
+
+    artifact = load_artifact(ARTIFACT_NAME)
+    if artifact is None:
+        return DEFAULT_COEFFICIENTS
+    return artifact.arrays["coefficients"]
+
+
+def score_match_expected_goals(
+    match_id: UUID,
+    coefficients: np.ndarray | None = None,
+) -> int:
+    """
+    Score every located shot of a match in one batch and store xG.
+    """
+
+    Event = apps.get_model("events", "Event")
+
+    if coefficients is None:
+        coefficients = load_expected_goals_coefficients()
+
+    rows = list(
+        Event.objects
+        .filter(
+            match_id=match_id,
+            event_type__in=SHOT_EVENTS,
+            x__isnull=False,
+            y__isnull=False,
+        )
+        .values_list("id", "x", "y")
+    )
+    if not rows:
+        return 0
+
+    ids, x, y = zip(*rows)
+    xg = score_shots(coefficients, np.array(x), np.array(y))
+
+    return store_xg(ids, np.round(xg, 4).tolist())
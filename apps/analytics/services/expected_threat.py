@@ -0,0 +1,431 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, Tuple
+from uuid import UUID
+
+import numpy as np
+from django.apps import apps
+from django.db import models, transaction
+from django.db.models import ExpressionWrapper, F, Sum
+
+from apps.analytics.services.event_columns import (
+    MatchEventColumns,
+    iter_match_columns,
+)
+from apps.analytics.services.model_artifacts import (
+    ModelArtifact,
+    load_artifact,
+    save_artifact,
+)
+from apps.analytics.instrumentation import query_budget
+
+
+# ============================================================
+# CONSTANTS (Domain knowledge)
+# ============================================================
+
+ARTIFACT_NAME = "expected_threat"
+
+# Pitch grid of the model (length x width cells)
+XT_GRID = (16, 12)
+
+# Normalized pitch coordinates (see Event.x / Event.y)
+PITCH_MAX = 100.0
+
+MAX_ITERATIONS = 50
+CONVERGENCE_EPS = 1e-6
+
+# Actions that move the ball and are valued by xT
+MOVE_EVENTS = ["pass", "carry"]
+SHOT_EVENTS = ["shot", "goal"]
+
+
+# ============================================================
+# DOMAIN: grid geometry (pure, vectorized)
+# ============================================================
+
+def grid_cells(
+    x: np.ndarray,
+    y: np.ndarray,
+    grid: Tuple[int, int] = XT_GRID,
+) -> np.ndarray:
+    """
+    Flat xT cell of every location (-1 when coordinates are missing).
+    """
+
+    x_bins, y_bins = grid
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    ix = np.minimum(np.clip(x, 0, PITCH_MAX) / PITCH_MAX * x_bins, x_bins - 1)
+    iy = np.minimum(np.clip(y, 0, PITCH_MAX) / PITCH_MAX * y_bins, y_bins - 1)
+
+    cells = np.full(len(x), -1, dtype=np.int64)
+    located = ~(np.isnan(ix) | np.isnan(iy))
+    cells[located] = (
+        ix[located].astype(np.int64) * y_bins + iy[located].astype(np.int64)
+    )
+    return cells
+
+
+def move_end_locations(
+    team: np.ndarray,
+    period: np.ndarray,
+    x: np.ndarray,
+    y: np.ndarray,
+    end_x: np.ndarray,
+    end_y: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    End location of every event: the recorded one, otherwise where the
+    same team's next event in the same period starts.
+
+    Rows must be ordered by (period, timestamp_ms).
+    """
+
+    end_x = np.array(end_x, dtype=np.float64)
+    end_y = np.array(end_y, dtype=np.float64)
+
+    if len(x) < 2:
+        return end_x, end_y
+
+    missing = np.isnan(end_x) | np.isnan(end_y)
+    follows = np.zeros(len(x), dtype=bool)
+    follows[:-1] = (team[1:] == team[:-1]) & (period[1:] == period[:-1])
+
+    fill = missing & follows
+    rows = np.flatnonzero(fill)
+    end_x[rows] = x[rows + 1]
+    end_y[rows] = y[rows + 1]
+
+    return end_x, end_y
+
+
+# ============================================================
+# DOMAIN: model fitting (value iteration)
+# ============================================================
+
+@dataclass
+class ThreatCounts:
+    """
+    Per-cell action counts accumulated over matches.
+    """
+
+    shots: np.ndarray
+    goals: np.ndarray
+    moves: np.ndarray
+    transitions: np.ndarray
+
+    @classmethod
+    def empty(cls, grid: Tuple[int, int] = XT_GRID) -> "ThreatCounts":
+        n = grid[0] * grid[1]
+        return cls(
+            shots=np.zeros(n, dtype=np.int64),
+            goals=np.zeros(n, dtype=np.int64),
+            moves=np.zeros(n, dtype=np.int64),
+            transitions=np.zeros((n, n), dtype=np.int64),
+        )
+
+
+def accumulate_counts(
+    counts: ThreatCounts,
+    columns: MatchEventColumns,
+    grid: Tuple[int, int] = XT_GRID,
+) -> None:
+    """
+    Add one match to the counts (bincounts over the whole match).
+    """
+
+    Event = apps.get_model("events", "Event")
+
+    n = grid[0] * grid[1]
+    cells = grid_cells(columns.x, columns.y, grid)
+    located = cells >= 0
+
+    shots = columns.type_mask(SHOT_EVENTS) & located
+    goals = columns.type_mask(["goal"]) & located
+    moves = columns.type_mask(MOVE_EVENTS) & located
+
+    counts.shots += np.bincount(cells[shots], minlength=n)
+    counts.goals += np.bincount(cells[goals], minlength=n)
+    counts.moves += np.bincount(cells[moves], minlength=n)
+
+    end_x, end_y = move_end_locations(
+        columns.team, columns.period,
+        columns.x, columns.y, columns.end_x, columns.end_y,
+    )
+    end_cells = grid_cells(end_x, end_y, grid)
+
+    completed = (
+        moves
+        & (end_cells >= 0)
+        & (columns.outcome != Event.OUTCOME_CODES[Event.Outcome.FAIL])
+    )
+    counts.transitions += np.bincount(
+        cells[completed] * n + end_cells[completed], minlength=n * n
+    ).reshape(n, n)
+
+
+def solve_expected_threat(
+    counts: ThreatCounts,
+    grid: Tuple[int, int] = XT_GRID,
+    max_iterations: int = MAX_ITERATIONS,
+    eps: float = CONVERGENCE_EPS,
+) -> Tuple[np.ndarray, int]:
+    """
+    Value iteration: xT = P(shot)·P(goal|shot) + P(move)·T·xT.
+
+    Failed moves stay in the move probability but have no transition,
+    so they contribute zero threat. Returns the (x_bins, y_bins) grid and
+    the number of iterations run.
+    """
+
+    actions = counts.shots + counts.moves
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        shot_prob = np.nan_to_num(counts.shots / actions)
+        move_prob = np.nan_to_num(counts.moves / actions)
+        goal_prob = np.nan_to_num(counts.goals / counts.shots)
+        transition = np.nan_to_num(
+            counts.transitions / counts.moves[:, None]
+        )
+
+    scoring = shot_prob * goal_prob
+    xt = np.zeros_like(scoring)
+
+    iterations = 0
+    for iterations in range(1, max_iterations + 1):
+        updated = scoring + move_prob * (transition @ xt)
+        converged = np.max(np.abs(updated - xt)) < eps
+        xt = updated
+        if converged:
+            break
+
+    return xt.reshape(grid), iterations
+
+
+# ============================================================
+# DOMAIN: valuation (pure, vectorized)
+# ============================================================
+
+def value_moves(
+    xt_grid: np.ndarray,
+    is_move: np.ndarray,
+    failed: np.ndarray,
+    x: np.ndarray,
+    y: np.ndarray,
+    end_x: np.ndarray,
+    end_y: np.ndarray,
+) -> np.ndarray:
+    """
+    xT gained by every move (NaN for rows that are not valued).
+
+    Completed moves are worth xT(end) - xT(start); failed moves are
+    worth 0 (the loss of the ball is not charged to the mover).
+    """
+
+    grid = xt_grid.shape
+    flat = xt_grid.ravel()
+
+    start = grid_cells(x, y, grid)
+    end = grid_cells(end_x, end_y, grid)
+
+    deltas = np.full(len(x), np.nan)
+
+    valued = is_move & (start >= 0) & (failed | (end >= 0))
+    completed = valued & ~failed
+
+    deltas[valued & failed] = 0.0
+    deltas[completed] = flat[end[completed]] - flat[start[completed]]
+
+    return deltas
+
+
+# ============================================================
+# INFRASTRUCTURE (Django ORM)
+# ============================================================
+
+@query_budget(1)
+def load_match_moves(match_id: UUID):
+    """
+    Events of a match needed for valuation, in one ordered query.
+    """
+
+    Event = apps.get_model("events", "Event")
+
+    return list(
+        Event.objects
+        .filter(match_id=match_id)
+        .order_by("period", "timestamp_ms")
+        .values_list(
+            "id",
+            "team_id",
+            "period",
+            ExpressionWrapper(
+                F("event_type"), output_field=models.IntegerField()
+            ),
+            ExpressionWrapper(
+                F("outcome"), output_field=models.IntegerField()
+            ),
+            "x",
+            "y",
+            "end_x",
+            "end_y",
+        )
+    )
+
+
+@transaction.atomic
+def store_xt_deltas(
+    match_id: UUID,
+    ids: Iterable[UUID],
+    deltas: Iterable[float],
+) -> int:
+    Event = apps.get_model("events", "Event")
+
+    # Clear values of events that are no longer valued
+    Event.objects.filter(
+        match_id=match_id, xt_delta__isnull=False
+    ).update(xt_delta=None)
+
+    rows = [
+        Event(id=event_id, xt_delta=delta)
+        for event_id, delta in zip(ids, deltas)
+    ]
+    Event.objects.bulk_update(rows, ["xt_delta"], batch_size=1000)
+    return len(rows)
+
+
+@query_budget(1)
+def load_team_xt(match_id: UUID) -> Dict[UUID, float]:
+    """
+    Total stored xT per team (one grouped query).
+    """
+
+    Event = apps.get_model("events", "Event")
+
+    return {
+        row["team_id"]: round(row["xt"] or 0.0, 3)
+        for row in Event.objects
+        .filter(match_id=match_id, xt_delta__isnull=False)
+        .values("team_id")
+        .annotate(xt=Sum("xt_delta"))
+    }
+
+
+@query_budget(1)
+def load_player_xt(match_id: UUID, player_id: UUID) -> float:
+    Event = apps.get_model("events", "Event")
+
+    total = (
+        Event.objects
+        .filter(match_id=match_id, player_id=player_id)
+        .aggregate(xt=Sum("xt_delta"))["xt"]
+    )
+    return round(total or 0.0, 3)
+
+
+# ============================================================
+# APPLICATION (public API)
+# ============================================================
+
+def fit_expected_threat(
+    matches=None,
+    grid: Tuple[int, int] = XT_GRID,
+    max_iterations: int = MAX_ITERATIONS,
+) -> ModelArtifact:
+    """
+    Fit the xT grid from stored events and save it as a new version.
+    """
+
+    Match = apps.get_model("competitions", "Match")
+
+    if matches is None:
+        matches = Match.objects.all()
+
+    counts = ThreatCounts.empty(grid)
+    matches_count = 0
+
+    for columns in iter_match_columns(matches):
+        accumulate_counts(counts, columns, grid)
+        matches_count += 1
+
+    xt_grid, iterations = solve_expected_threat(
+        counts, grid, max_iterations=max_iterations
+    )
+
+    return save_artifact(
+        ARTIFACT_NAME,
+        arrays={"xt": xt_grid},
+        metadata={
+            "grid": list(grid),
+            "iterations": iterations,
+            "matches": matches_count,
+            "shots": int(counts.shots.sum()),
+            "moves": int(counts.moves.sum()),
+        },
+    )
+
+
+def load_expected_threat_grid() -> np.ndarray | None:
+    """
+    Latest fitted xT grid (None until the model has been fitted).
+    """
+
+    artifact = load_artifact(ARTIFACT_NAME)
+    return None if artifact is None else artifact.arrays["xt"]
+
+
+def value_match_expected_threat(
+    match_id: UUID,
+    xt_grid: np.ndarray | None = None,
+) -> int:
+    """
+    Value every pass / carry of a match and store the deltas.
+
+    Returns the number of events updated (0 when no model is fitted).
+    """
+
+    Event = apps.get_model("events", "Event")
+
+    if xt_grid is None:
+        xt_grid = load_expected_threat_grid()
+    if xt_grid is None:
+        return 0
+
+    rows = load_match_moves(match_id)
+    if not rows:
+        return 0
+
+    ids, teams, period, types, outcomes, x, y, end_x, end_y = zip(*rows)
+
+    def floats(values):
+        return np.array(
+            [np.nan if v is None else v for v in values], dtype=np.float64
+        )
+
+    team_index: Dict[UUID, int] = {}
+    team = np.array([team_index.setdefault(t, len(team_index)) for t in teams])
+    period = np.array(period)
+    x, y = floats(x), floats(y)
+
+    end_x, end_y = move_end_locations(
+        team, period, x, y, floats(end_x), floats(end_y)
+    )
+
+    move_codes = [Event.TYPE_CODES[t] for t in MOVE_EVENTS]
+    deltas = value_moves(
+        xt_grid,
+        is_move=np.isin(types, move_codes),
+        failed=np.array(outcomes) == Event.OUTCOME_CODES[Event.Outcome.FAIL],
+        x=x,
+        y=y,
+        end_x=end_x,
+        end_y=end_y,
+    )
+
+    valued = np.flatnonzero(~np.isnan(deltas))
+    return store_xt_deltas(
+        match_id,
+        [ids[i] for i in valued],
+        deltas[valued].tolist(),
+    )
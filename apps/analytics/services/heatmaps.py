@@ -0,0 +1,272 @@
+from dataclasses import dataclass
+from typing import Iterable, List, Tuple
+from uuid import UUID
+
+import numpy as np
+from django.apps import apps
+from django.core.cache import cache
+
+from apps.analytics.services.event_columns import (
+    MatchEventColumns,
+    NO_PLAYER,
+    load_match_columns,
+    match_columns_version,
+)
+from apps.analytics.instrumentation import query_budget
+
+
+# ============================================================
+# CONSTANTS (Domain knowledge)
+# ============================================================
+
+DEFAULT_GRID = (12, 8)
+MAX_GRID_BINS = 50
+
+# Normalized pitch coordinates (see Event.x / Event.y)
+PITCH_MAX = 100.0
+
+# Match periods: 1st/2nd half, two extra-time halves, penalties
+MAX_PERIODS = 5
+
+CACHE_TIMEOUT = 60 * 60 * 24
+
+
+# ============================================================
+# DOMAIN: per-match count tensors
+# ============================================================
+
+@dataclass
+class SparseCounts:
+    """
+    Non-zero cells of an (owners, types, periods, x, y) count tensor:
+    flat tensor indexes (sorted) and their counts.
+    """
+
+    keys: np.ndarray
+    counts: np.ndarray
+
+
+@dataclass
+class MatchHeatmapGrids:
+    """
+    Event counts of one match binned on a (x_bins, y_bins) grid.
+
+    team_counts covers (team, type_code, period - 1, x, y) and
+    player_counts (player, type_code, period - 1, x, y). Both are kept
+    sparse, so a cached match costs O(events) whatever the grid size,
+    and any team / player / type / period filter is a mask-and-sum.
+    """
+
+    teams: List[UUID]
+    players: List[UUID]
+    grid: Tuple[int, int]
+    type_count: int
+    team_counts: SparseCounts
+    player_counts: SparseCounts
+
+    def decode(self, keys: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """
+        (owner, type_code, period index, cell) of flat tensor indexes.
+        """
+
+        rest, cell = np.divmod(keys, self.grid[0] * self.grid[1])
+        rest, period = np.divmod(rest, MAX_PERIODS)
+        owner, type_code = np.divmod(rest, self.type_count)
+        return owner, type_code, period, cell
+
+
+def event_cells(
+    columns: MatchEventColumns,
+    grid: Tuple[int, int],
+) -> np.ndarray:
+    """
+    Flat grid cell of every event (-1 when coordinates are missing).
+    """
+
+    x_bins, y_bins = grid
+
+    x = np.clip(columns.x, 0, PITCH_MAX)
+    y = np.clip(columns.y, 0, PITCH_MAX)
+
+    # Right pitch edge belongs to the last bin
+    ix = np.minimum((x / PITCH_MAX * x_bins), x_bins - 1)
+    iy = np.minimum((y / PITCH_MAX * y_bins), y_bins - 1)
+
+    cells = np.full(len(columns), -1, dtype=np.int64)
+    located = ~(np.isnan(ix) | np.isnan(iy))
+    cells[located] = (
+        ix[located].astype(np.int64) * y_bins + iy[located].astype(np.int64)
+    )
+    return cells
+
+
+def bin_counts(
+    owner: np.ndarray,
+    type_count: int,
+    columns: MatchEventColumns,
+    cells: np.ndarray,
+    mask: np.ndarray,
+    grid: Tuple[int, int],
+) -> SparseCounts:
+    """
+    Histogram events into a sparse (owners, types, periods, x, y)
+    tensor: one flat index per event, counted with np.unique.
+    """
+
+    cell_count = grid[0] * grid[1]
+
+    period = np.clip(columns.period.astype(np.int64), 1, MAX_PERIODS) - 1
+
+    flat = (
+        (owner[mask].astype(np.int64) * type_count
+         + columns.event_type[mask].astype(np.int64)) * MAX_PERIODS
+        + period[mask]
+    ) * cell_count + cells[mask]
+
+    keys, counts = np.unique(flat, return_counts=True)
+    return SparseCounts(keys=keys, counts=counts.astype(np.int32))
+
+
+def build_match_heatmap_grids(
+    columns: MatchEventColumns,
+    grid: Tuple[int, int] = DEFAULT_GRID,
+) -> MatchHeatmapGrids:
+    Event = apps.get_model("events", "Event")
+
+    type_count = max(Event.TYPE_CODES.values()) + 1
+    cells = event_cells(columns, grid)
+    located = cells >= 0
+
+    return MatchHeatmapGrids(
+        teams=list(columns.teams),
+        players=list(columns.players),
+        grid=tuple(grid),
+        type_count=type_count,
+        team_counts=bin_counts(
+            columns.team, type_count,
+            columns, cells, located, grid,
+        ),
+        player_counts=bin_counts(
+            columns.player, type_count,
+            columns, cells, located & (columns.player != NO_PLAYER), grid,
+        ),
+    )
+
+
+def select_heatmap(
+    grids: MatchHeatmapGrids,
+    team_id: UUID | None = None,
+    player_id: UUID | None = None,
+    event_types: Iterable[str] | None = None,
+    period: int | None = None,
+) -> np.ndarray:
+    """
+    Reduce cached counts to one (x_bins, y_bins) grid.
+    """
+
+    Event = apps.get_model("events", "Event")
+
+    empty = np.zeros(grids.grid, dtype=np.int64)
+
+    if player_id is not None:
+        if player_id not in grids.players:
+            return empty
+        sparse, owner_id = grids.player_counts, grids.players.index(player_id)
+    elif team_id is not None:
+        if team_id not in grids.teams:
+            return empty
+        sparse, owner_id = grids.team_counts, grids.teams.index(team_id)
+    else:
+        sparse, owner_id = grids.team_counts, None
+
+    if period is not None and not 1 <= period <= MAX_PERIODS:
+        return empty
+
+    owner, type_code, period_index, cell = grids.decode(sparse.keys)
+
+    mask = np.ones(len(sparse.keys), dtype=bool)
+    if owner_id is not None:
+        mask &= owner == owner_id
+    if event_types is not None:
+        codes = [
+            Event.TYPE_CODES[t]
+            for t in event_types
+            if t in Event.TYPE_CODES
+        ]
+        mask &= np.isin(type_code, codes)
+    if period is not None:
+        mask &= period_index == period - 1
+
+    totals = np.bincount(
+        cell[mask],
+        weights=sparse.counts[mask],
+        minlength=grids.grid[0] * grids.grid[1],
+    )
+    return totals.astype(np.int64).reshape(grids.grid)
+
+
+# ============================================================
+# INFRASTRUCTURE (cache)
+# ============================================================
+
+def heatmap_cache_key(match_id: UUID, grid: Tuple[int, int]) -> str | None:
+    version = match_columns_version(match_id)
+    if version is None:
+        return None
+    return f"heatmap:sparse:{match_id}:{version}:{grid[0]}x{grid[1]}"
+
+
+@query_budget(0)
+def load_match_heatmap_grids(
+    match_id: UUID,
+    grid: Tuple[int, int] = DEFAULT_GRID,
+) -> MatchHeatmapGrids:
+    """
+    Per-match sparse counts, cached until the match's columns change.
+    """
+
+    columns = load_match_columns(match_id)
+
+    key = heatmap_cache_key(match_id, grid)
+    grids = cache.get(key) if key else None
+
+    if grids is None:
+        grids = build_match_heatmap_grids(columns, grid)
+        if key:
+            cache.set(key, grids, CACHE_TIMEOUT)
+
+    return grids
+
+
+# ============================================================
+# APPLICATION (public API)
+# ============================================================
+
+@query_budget(0)
+def build_heatmap(
+    match_ids: Iterable[UUID],
+    grid: Tuple[int, int] = DEFAULT_GRID,
+    team_id: UUID | None = None,
+    player_id: UUID | None = None,
+    event_types: Iterable[str] | None = None,
+    period: int | None = None,
+) -> np.ndarray:
+    """
+    Heatmap summed over matches (one match or a season window).
+    """
+
+    if event_types is not None:
+        event_types = list(event_types)
+
+    total = np.zeros(grid, dtype=np.int64)
+
+    for match_id in match_ids:
+        total += select_heatmap(
+            load_match_heatmap_grids(match_id, grid),
+            team_id=team_id,
+            player_id=player_id,
+            event_types=event_types,
+            period=period,
+        )
+
+    return total
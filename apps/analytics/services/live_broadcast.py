@@ -0,0 +1,115 @@
+import asyncio
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+from uuid import UUID
+
+
+# ============================================================
+# CONSTANTS
+# ============================================================
+
+# Deltas a slow viewer may fall behind before it is resynced
+SUBSCRIBER_QUEUE_SIZE = 64
+
+
+# ============================================================
+# DOMAIN: deltas (pure)
+# ============================================================
+
+def changed_values(old: Dict[str, Any], new: Dict[str, Any]) -> Dict:
+    """
+    Nested dict of the leaves of `new` that differ from `old`.
+    """
+
+    delta: Dict[str, Any] = {}
+
+    for key, value in new.items():
+        previous = old.get(key)
+        if isinstance(value, dict) and isinstance(previous, dict):
+            nested = changed_values(previous, value)
+            if nested:
+                delta[key] = nested
+        elif value != previous:
+            delta[key] = value
+
+    return delta
+
+
+# ============================================================
+# INFRASTRUCTURE (in-process fan-out)
+# ============================================================
+
+@dataclass
+class Subscriber:
+    loop: asyncio.AbstractEventLoop
+    queue: asyncio.Queue = field(
+        default_factory=lambda: asyncio.Queue(SUBSCRIBER_QUEUE_SIZE)
+    )
+
+
+class LiveBroadcaster:
+    """
+    Fans live overview deltas out to every viewer of a match.
+
+    Publishing happens in the (sync) ingestion thread; each subscriber's
+    queue is fed on its own event loop via call_soon_threadsafe. The
+    delta is computed once per publish, whatever the number of viewers.
+
+    In-process only: ingestion and streams must be served by the same
+    ASGI process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: Dict[UUID, List[Subscriber]] = {}
+        self._latest: Dict[UUID, Dict] = {}
+
+    def subscribe(self, match_id: UUID) -> Subscriber:
+        subscriber = Subscriber(loop=asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.setdefault(match_id, []).append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, match_id: UUID, subscriber: Subscriber) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(match_id, [])
+            if subscriber in subscribers:
+                subscribers.remove(subscriber)
+            if not subscribers:
+                self._subscribers.pop(match_id, None)
+
+    def latest(self, match_id: UUID) -> Dict | None:
+        return self._latest.get(match_id)
+
+    def publish(self, match_id: UUID, overview: Dict) -> Dict:
+        """
+        Record the new overview and push only what changed.
+        """
+
+        with self._lock:
+            delta = changed_values(self._latest.get(match_id, {}), overview)
+            self._latest[match_id] = overview
+            subscribers = list(self._subscribers.get(match_id, []))
+
+        if delta:
+            for subscriber in subscribers:
+                subscriber.loop.call_soon_threadsafe(
+                    self._offer, subscriber.queue, delta, overview
+                )
+
+        return delta
+
+    @staticmethod
+    def _offer(queue: asyncio.Queue, delta: Dict, overview: Dict) -> None:
+        # Runs on the subscriber's loop
+        if queue.full():
+            # Viewer fell behind: replace its backlog with a full snapshot
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait({"snapshot": overview})
+        else:
+            queue.put_nowait({"delta": delta})
+
+
+live_broadcaster = LiveBroadcaster()
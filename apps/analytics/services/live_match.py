@@ -0,0 +1,607 @@
+import threading
+from typing import Dict, List
+from uuid import UUID
+
+import numpy as np
+from django.apps import apps
+from django.db import transaction
+
+from apps.analytics.services.derived_data import invalidate_match_derived_data
+from apps.analytics.services.event_columns import invalidate_match_columns
+from apps.analytics.services.expected_goals import (
+    SHOT_EVENTS,
+    load_expected_goals_coefficients,
+    score_shots,
+)
+from apps.analytics.services.expected_threat import (
+    MOVE_EVENTS,
+    load_expected_threat_grid,
+    value_moves,
+)
+from apps.analytics.services.live_broadcast import live_broadcaster
+from apps.analytics.services.match_dashboard import (
+    average,
+    load_player_positions,
+)
+from apps.analytics.services.momentum import (
+    MomentumAccumulator,
+    store_match_momentum,
+)
+from apps.analytics.services.normalization import normalize_player_metrics
+from apps.analytics.services.player_index import calculate_epi
+from apps.analytics.services.player_metrics import calculate_events_per_90
+from apps.analytics.services.possession_chains import (
+    MAX_CHAIN_INSERTS,
+    Chain,
+    PossessionSegmenter,
+    chain_to_row,
+    store_possession_chains,
+)
+from apps.analytics.services.season_archive import invalidate_season_archive
+from apps.analytics.instrumentation import fill_budget, query_budget
+from config.db_router import use_primary
+
+
+# ============================================================
+# CONSTANTS
+# ============================================================
+
+# Replaying a match: season, events, then its chains stored like
+# possession_chains does (transaction (2), delete, inserts)
+LIVE_FILL_QUERIES = 5 + MAX_CHAIN_INSERTS
+
+
+# ============================================================
+# DOMAIN: running state of one live match
+# ============================================================
+
+def counted_events(counts: Dict[str, int]) -> int:
+    """
+    Events of a per-type counter that count towards volume metrics.
+    """
+
+    Event = apps.get_model("events", "Event")
+
+    return sum(
+        count
+        for event_type, count in counts.items()
+        if event_type not in Event.UNCOUNTED_TYPES
+    )
+
+
+class LiveMatchState:
+    """
+    Incrementally maintained aggregates of a match in progress.
+
+    Every event is applied once: counters, the possession segmenter and
+    the momentum accumulator are all updated in place, so a batch costs
+    O(batch) no matter how long the match has been running.
+    """
+
+    def __init__(self, match_id: UUID):
+        self.match_id = match_id
+        self.lock = threading.Lock()
+        self.season_id: UUID | None = None
+        self.version = 0
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Forget every applied event; the lock and version are kept.
+        """
+
+        self.loaded = False
+        self.segmenter = PossessionSegmenter()
+        self.momentum = MomentumAccumulator()
+        self.team_counts: Dict[UUID, Dict[str, int]] = {}
+        self.player_counts: Dict[UUID, Dict[str, int]] = {}
+        self.player_teams: Dict[UUID, UUID] = {}
+        self.team_xt: Dict[UUID, float] = {}
+        self.possession_ms: Dict[UUID, int] = {}
+        self.events_count = 0
+        self.position = (0, 0)
+
+    def apply(
+        self,
+        team_id: UUID,
+        player_id: UUID | None,
+        event_type: str,
+        outcome: str,
+        period: int,
+        timestamp_ms: int,
+        x: float | None,
+        y: float | None,
+        end_x: float | None,
+        xt_delta: float | None,
+    ) -> List[Chain]:
+        """
+        Apply one event; returns possession chains closed by it.
+        """
+
+        team = self.team_counts.setdefault(team_id, {})
+        team[event_type] = team.get(event_type, 0) + 1
+
+        if player_id is not None:
+            player = self.player_counts.setdefault(player_id, {})
+            player[event_type] = player.get(event_type, 0) + 1
+            self.player_teams.setdefault(player_id, team_id)
+
+        if xt_delta:
+            self.team_xt[team_id] = self.team_xt.get(team_id, 0.0) + xt_delta
+
+        closed = self.segmenter.feed(
+            team_id, event_type, period, timestamp_ms, x, y
+        )
+        for chain in closed:
+            self.possession_ms[chain.team_id] = (
+                self.possession_ms.get(chain.team_id, 0)
+                + chain.end_ms - chain.start_ms
+            )
+
+        self.momentum.feed(
+            team_id, event_type, period, timestamp_ms, x, end_x,
+            failed=outcome == "fail",
+            xt_delta=xt_delta,
+        )
+
+        self.events_count += 1
+        self.position = max(self.position, (period, timestamp_ms))
+        return closed
+
+    def is_after(self, period: int, timestamp_ms: int) -> bool:
+        return (period, timestamp_ms) >= self.position
+
+    def team_possession_ms(self) -> Dict[UUID, int]:
+        """
+        Time on the ball per team, including the open chain.
+        """
+
+        totals = dict(self.possession_ms)
+        chain = self.segmenter.current
+        if chain is not None:
+            totals[chain.team_id] = (
+                totals.get(chain.team_id, 0) + chain.end_ms - chain.start_ms
+            )
+        return totals
+
+    def overview(self) -> Dict:
+        """
+        Current live aggregates, cheap enough to read after every batch.
+        """
+
+        possession = self.team_possession_ms()
+        total_ms = sum(possession.values())
+        elapsed_minutes = self.position[1] / 60000
+        counted = sum(
+            counted_events(counts) for counts in self.team_counts.values()
+        )
+
+        return {
+            "version": self.version,
+            "events_count": self.events_count,
+            "period": self.position[0],
+            "timestamp_ms": self.position[1],
+            "tempo": (
+                round(counted / elapsed_minutes, 2)
+                if elapsed_minutes > 0 else 0.0
+            ),
+            "teams": {
+                str(team_id): {
+                    "events": counted_events(counts),
+                    "turnovers": counts.get("turnover", 0),
+                    "shots": (
+                        counts.get("shot", 0) + counts.get("goal", 0)
+                    ),
+                    "goals": counts.get("goal", 0),
+                    "possession_pct": (
+                        round(possession.get(team_id, 0) / total_ms * 100, 1)
+                        if total_ms else 0.0
+                    ),
+                    "xt": round(self.team_xt.get(team_id, 0.0), 3),
+                }
+                for team_id, counts in self.team_counts.items()
+            },
+        }
+
+
+# ============================================================
+# DOMAIN: batch valuation (vectorized)
+# ============================================================
+
+def value_batch(events: List[Dict]) -> None:
+    """
+    Fill xt_delta / xg of a batch with the fitted models, in place.
+
+    Live moves are valued from their recorded end location only.
+    """
+
+    def column(name):
+        return np.array(
+            [np.nan if e.get(name) is None else e[name] for e in events],
+            dtype=np.float64,
+        )
+
+    types = np.array([e["event_type"] for e in events])
+    x, y = column("x"), column("y")
+
+    xt_grid = load_expected_threat_grid()
+    if xt_grid is not None:
+        deltas = value_moves(
+            xt_grid,
+            is_move=np.isin(types, MOVE_EVENTS),
+            failed=np.array([e["outcome"] == "fail" for e in events]),
+            x=x,
+            y=y,
+            end_x=column("end_x"),
+            end_y=column("end_y"),
+        )
+        for event, delta in zip(events, deltas.tolist()):
+            event["xt_delta"] = None if np.isnan(delta) else delta
+
+    shots = np.flatnonzero(
+        np.isin(types, SHOT_EVENTS) & ~np.isnan(x) & ~np.isnan(y)
+    )
+    if len(shots):
+        xg = score_shots(
+            load_expected_goals_coefficients(), x[shots], y[shots]
+        )
+        for i, value in zip(shots.tolist(), xg.tolist()):
+            events[i]["xg"] = round(value, 4)
+
+
+# ============================================================
+# INFRASTRUCTURE (process-level registry, Django ORM)
+# ============================================================
+
+# Live matches handled by this process: {match_id: LiveMatchState}
+_live_matches: Dict[UUID, LiveMatchState] = {}
+_registry_lock = threading.Lock()
+
+
+def load_live_state(state: LiveMatchState) -> None:
+    """
+    Replay the events already stored into `state`, in place (two
+    queries).
+
+    Used when a process first sees a match, or after late events; the
+    caller holds state.lock, so nobody sees a half-replayed state.
+    """
+
+    Event = apps.get_model("events", "Event")
+    Match = apps.get_model("competitions", "Match")
+
+    # Stores chains and stays cached: read the primary, not a replica
+    use_primary()
+
+    match_id = state.match_id
+    state.reset()
+    state.season_id = (
+        Match.objects
+        .filter(id=match_id)
+        .values_list("season_id", flat=True)
+        .first()
+    )
+    chains: List[Chain] = []
+
+    rows = (
+        Event.objects
+        .filter(match_id=match_id)
+        .order_by("period", "timestamp_ms")
+        .values_list(
+            "team_id", "player_id", "event_type", "outcome",
+            "period", "timestamp_ms", "x", "y", "end_x", "xt_delta",
+        )
+    )
+    for row in rows:
+        chains += state.apply(*row)
+
+    store_possession_chains(match_id, chains)
+    state.loaded = True
+
+
+@query_budget(0)
+def get_live_state(match_id: UUID) -> LiveMatchState:
+    """
+    The match's running state, replayed from the DB on first use.
+
+    The registry lock only guards the dict: a cold match is loaded
+    under its own state lock, so it never blocks other live matches.
+    """
+
+    state = _live_matches.get(match_id)
+    if state is None:
+        with _registry_lock:
+            state = _live_matches.setdefault(
+                match_id, LiveMatchState(match_id)
+            )
+
+    if not state.loaded:
+        with state.lock:
+            if not state.loaded:
+                with fill_budget(LIVE_FILL_QUERIES, "load_live_state"):
+                    load_live_state(state)
+    return state
+
+
+def peek_live_state(match_id: UUID) -> LiveMatchState | None:
+    return _live_matches.get(match_id)
+
+
+def drop_live_state(match_id: UUID) -> None:
+    with _registry_lock:
+        _live_matches.pop(match_id, None)
+
+
+@query_budget(1)
+def load_minutes_played(match_id: UUID) -> Dict[UUID, int]:
+    Appearance = apps.get_model("players", "Appearance")
+
+    return dict(
+        Appearance.objects
+        .filter(match_id=match_id, minutes_played__gt=0)
+        .values_list("player_id", "minutes_played")
+    )
+
+
+@query_budget(2)
+def live_epi_averages(state: LiveMatchState) -> Dict[UUID, int]:
+    """
+    Average EPI per team from the running player counters.
+    """
+
+    per_90 = calculate_events_per_90(
+        minutes_by_player=load_minutes_played(state.match_id),
+        event_counts={
+            player_id: counted_events(counts)
+            for player_id, counts in state.player_counts.items()
+        },
+    )
+    if not per_90:
+        return {}
+
+    epi = calculate_epi(normalize_player_metrics(
+        player_values={
+            player_id: {"events_per_90": value}
+            for player_id, value in per_90.items()
+        },
+        position_map=load_player_positions(list(per_90)),
+    ))
+
+    by_team: Dict[UUID, List[int]] = {}
+    for player_id, data in epi.items():
+        team_id = state.player_teams.get(player_id)
+        if team_id is not None:
+            by_team.setdefault(team_id, []).append(data["epi"])
+
+    return {
+        team_id: average(values)
+        for team_id, values in by_team.items()
+    }
+
+
+@query_budget(2)
+def live_overview(state: LiveMatchState) -> Dict:
+    overview = state.overview()
+    epi_avg = live_epi_averages(state)
+
+    for team_id, team in overview["teams"].items():
+        team["epi_avg"] = epi_avg.get(UUID(team_id))
+
+    return overview
+
+
+@query_budget(1)
+def load_match_team_ids(match_id: UUID) -> set:
+    MatchTeam = apps.get_model("competitions", "MatchTeam")
+
+    return set(
+        MatchTeam.objects
+        .filter(match_id=match_id)
+        .values_list("team_id", flat=True)
+    )
+
+
+@query_budget(1)
+def load_known_player_ids(player_ids: set) -> set:
+    Player = apps.get_model("players", "Player")
+
+    return set(
+        Player.objects
+        .filter(id__in=player_ids)
+        .values_list("id", flat=True)
+    )
+
+
+@query_budget(1)
+def count_stored_events(match_id: UUID) -> int:
+    Event = apps.get_model("events", "Event")
+    return Event.objects.filter(match_id=match_id).count()
+
+
+def validate_live_events(match_id: UUID, events: List[Dict]) -> None:
+    unknown_teams = {e["team_id"] for e in events} - load_match_team_ids(
+        match_id
+    )
+    if unknown_teams:
+        raise ValueError(
+            "Teams do not play in this match: "
+            + ", ".join(str(t) for t in unknown_teams)
+        )
+
+    player_ids = {
+        player_id
+        for e in events
+        for player_id in (e.get("player_id"), e.get("secondary_player_id"))
+        if player_id is not None
+    }
+    unknown_players = player_ids - load_known_player_ids(player_ids)
+    if unknown_players:
+        raise ValueError(
+            "Unknown players: "
+            + ", ".join(str(p) for p in unknown_players)
+        )
+
+
+# ============================================================
+# APPLICATION (public API)
+# ============================================================
+
+def ingest_live_events(match_id: UUID, events: List[Dict]) -> Dict:
+    """
+    Append a batch of live events and update running aggregates.
+
+    Events are inserted with one bulk_create; closed possession chains
+    and the momentum series are written in the same transaction. A batch
+    reaching back before already applied events falls back to a full
+    rebuild of the running state.
+
+    The running state lives in this process. When the stored event count
+    differs from it (another worker ingested, events were edited) it is
+    replayed first; a failed batch marks it for replay by the next one.
+    """
+
+    validate_live_events(match_id, events)
+
+    events = sorted(events, key=lambda e: (e["period"], e["timestamp_ms"]))
+    value_batch(events)
+
+    state = get_live_state(match_id)
+
+    with state.lock:
+        try:
+            with transaction.atomic():
+                overview = apply_live_batch(match_id, state, events)
+        except BaseException:
+            # The rolled back events may already be applied in memory
+            state.loaded = False
+            raise
+
+    invalidate_match_columns(match_id)
+    if state.season_id is not None:
+        invalidate_season_archive(state.season_id)
+
+    return {
+        "accepted": len(events),
+        **overview,
+    }
+
+
+def apply_live_batch(
+    match_id: UUID,
+    state: LiveMatchState,
+    events: List[Dict],
+) -> Dict:
+    """
+    Store a sorted, valued batch and apply it to the running state.
+
+    Runs inside the ingest transaction with the state locked; replays
+    rebuild the state in place under that same lock.
+    """
+
+    Event = apps.get_model("events", "Event")
+    PossessionChain = apps.get_model("events", "PossessionChain")
+
+    if (
+        not state.loaded
+        or count_stored_events(match_id) != state.events_count
+    ):
+        load_live_state(state)
+
+    Event.objects.bulk_create(
+        [
+            Event(
+                match_id=match_id,
+                team_id=e["team_id"],
+                player_id=e.get("player_id"),
+                secondary_player_id=e.get("secondary_player_id"),
+                event_type=e["event_type"],
+                outcome=e["outcome"],
+                period=e["period"],
+                timestamp_ms=e["timestamp_ms"],
+                x=e.get("x"),
+                y=e.get("y"),
+                end_x=e.get("end_x"),
+                end_y=e.get("end_y"),
+                xt_delta=e.get("xt_delta"),
+                xg=e.get("xg"),
+                confidence=e.get("confidence"),
+            )
+            for e in events
+        ],
+        batch_size=500,
+    )
+
+    first = events[0]
+    if state.is_after(first["period"], first["timestamp_ms"]):
+        closed: List[Chain] = []
+        for e in events:
+            closed += state.apply(
+                e["team_id"],
+                e.get("player_id"),
+                e["event_type"],
+                e["outcome"],
+                e["period"],
+                e["timestamp_ms"],
+                e.get("x"),
+                e.get("y"),
+                e.get("end_x"),
+                e.get("xt_delta"),
+            )
+        PossessionChain.objects.bulk_create(
+            [chain_to_row(match_id, chain) for chain in closed]
+        )
+    else:
+        # Late events: replay the match from the stored events
+        load_live_state(state)
+
+    state.version += 1
+    store_match_momentum(match_id, state.momentum)
+
+    overview = live_overview(state)
+
+    # Viewers only hear about committed events
+    transaction.on_commit(
+        lambda: live_broadcaster.publish(match_id, overview)
+    )
+
+    return overview
+
+
+@query_budget(2)
+def current_live_overview(match_id: UUID) -> Dict:
+    """
+    Last published overview, else one built from the stored events.
+    """
+
+    overview = live_broadcaster.latest(match_id)
+    if overview is None:
+        state = get_live_state(match_id)
+        with state.lock:
+            overview = live_overview(state)
+    return overview
+
+
+def finish_live_match(match_id: UUID) -> None:
+    """
+    Hand a match that just finished over to the batch pipeline.
+
+    The running state is dropped and the live-maintained caches are
+    invalidated; the queued rebuild closes the open possession chain
+    and fills player metrics and the season archive.
+    """
+
+    from apps.analytics.jobs import REBUILD_MATCH_DERIVED
+    from apps.jobs.queue import enqueue_job
+
+    Match = apps.get_model("competitions", "Match")
+
+    drop_live_state(match_id)
+
+    invalidate_match_derived_data(
+        match_id,
+        Match.objects
+        .filter(id=match_id)
+        .values_list("season_id", flat=True)
+        .first(),
+    )
+    enqueue_job(REBUILD_MATCH_DERIVED, match_id, priority=10)
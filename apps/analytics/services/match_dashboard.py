@@ -8,15 +8,24 @@ from apps.analytics.services.team_metrics import (
     event_tempo,
     team_turnovers,
 )
+from apps.analytics.services.expected_threat import load_team_xt
+from apps.analytics.services.momentum import (
+    BUCKET_SECONDS,
+    DEFAULT_WINDOW_MINUTES,
+    match_momentum,
+)
 from apps.analytics.services.player_metrics import player_events_per_90
 from apps.analytics.services.normalization import normalize_player_metrics
 from apps.analytics.services.player_index import calculate_epi
+from apps.analytics.instrumentation import query_budget, traced
 
 
 # ============================================================
 # INFRASTRUCTURE (Django ORM)
 # ============================================================
 
+@traced
+@query_budget(1)
 def load_match_participants(match_id: UUID) -> List[Dict]:
     MatchTeam = apps.get_model("competitions", "MatchTeam")
 
@@ -27,6 +36,8 @@ def load_match_participants(match_id: UUID) -> List[Dict]:
     )
 
 
+@traced
+@query_budget(1)
 def load_player_positions(player_ids: List[UUID]) -> Dict[UUID, str]:
     Player = apps.get_model("players", "Player")
 
@@ -83,6 +94,8 @@ def calculate_team_epi_averages(
 # APPLICATION SERVICE (public API)
 # ============================================================
 
+@traced
+@query_budget(7)
 def get_match_overview(match_id: UUID) -> Dict:
     """
     Aggregate key analytics for Match Overview dashboard.
@@ -96,6 +109,8 @@ def get_match_overview(match_id: UUID) -> Dict:
     possession = team_possession(match_id)
     turnovers = team_turnovers(match_id)
     tempo = event_tempo(match_id)
+    xt = load_team_xt(match_id)
+    momentum = match_momentum(match_id)
 
     # --------------------------------------------------------
     # Player-level metrics → EPI
@@ -123,6 +138,7 @@ def get_match_overview(match_id: UUID) -> Dict:
     # Build response
     # --------------------------------------------------------
     teams_data: Dict[str, Dict] = {}
+    momentum_data: Dict[str, Dict] = {}
 
     for p in participants:
         side = p["side"]
@@ -133,10 +149,19 @@ def get_match_overview(match_id: UUID) -> Dict:
             "possession": possession.get(team_id, 0.0),
             "turnovers": turnovers.get(team_id, 0),
             "epi_avg": epi_avg_by_team.get(team_id),
+            "xt": xt.get(team_id, 0.0),
         }
 
+        if team_id in momentum:
+            momentum_data[side] = momentum[team_id]
+
     return {
         "match_id": str(match_id),
         "teams": teams_data,
         "tempo": tempo,
+        "momentum": {
+            "bucket_seconds": BUCKET_SECONDS,
+            "window_minutes": DEFAULT_WINDOW_MINUTES,
+            "teams": momentum_data,
+        },
     }
@@ -0,0 +1,162 @@
+import json
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+import numpy as np
+from django.conf import settings
+from django.utils import timezone
+
+
+# ============================================================
+# CONSTANTS (storage layout)
+# ============================================================
+
+# Where versions fitted before settings.MODEL_ARTIFACTS_ROOT were kept,
+# under MEDIA_ROOT
+LEGACY_ARTIFACTS_DIR = "models"
+
+ARRAYS_FILE = "arrays.npz"
+METADATA_FILE = "metadata.json"
+
+
+# ============================================================
+# DOMAIN: fitted model artefact
+# ============================================================
+
+@dataclass
+class ModelArtifact:
+    """
+    Arrays and metadata of one fitted model version.
+
+    Versions are immutable: refitting writes a new version and keeps the
+    old ones. Stored per-event values do not record the version; re-run
+    the valuation after a refit (fit_expected_threat --revalue).
+
+    Artefacts live under settings.MODEL_ARTIFACTS_ROOT, outside
+    MEDIA_ROOT: they are never served.
+    """
+
+    name: str
+    version: int
+    arrays: Dict[str, np.ndarray]
+    metadata: Dict[str, Any]
+
+
+# ============================================================
+# INFRASTRUCTURE (files under MODEL_ARTIFACTS_ROOT)
+# ============================================================
+
+def artifact_root(name: str) -> Path:
+    return Path(settings.MODEL_ARTIFACTS_ROOT) / name
+
+
+def adopt_legacy_artifacts(name: str) -> None:
+    """
+    Move versions fitted before MODEL_ARTIFACTS_ROOT out of MEDIA_ROOT.
+    """
+
+    legacy = Path(settings.MEDIA_ROOT) / LEGACY_ARTIFACTS_DIR / name
+    root = artifact_root(name)
+    if root.exists() or not legacy.is_dir():
+        return
+
+    root.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        shutil.move(legacy, root)
+    except (FileNotFoundError, FileExistsError):
+        # Moved concurrently by another process
+        pass
+
+
+def artifact_path(name: str, version: int) -> Path:
+    return artifact_root(name) / f"v{version}"
+
+
+def latest_artifact_version(name: str) -> int | None:
+    adopt_legacy_artifacts(name)
+
+    root = artifact_root(name)
+    if not root.is_dir():
+        return None
+
+    versions = [
+        int(path.name[1:])
+        for path in root.iterdir()
+        if path.name.startswith("v") and path.name[1:].isdigit()
+    ]
+    return max(versions, default=None)
+
+
+def save_artifact(
+    name: str,
+    arrays: Dict[str, np.ndarray],
+    metadata: Dict[str, Any],
+) -> ModelArtifact:
+    """
+    Persist a new artefact version (previous versions are kept).
+    """
+
+    version = (latest_artifact_version(name) or 0) + 1
+    metadata = {
+        **metadata,
+        "name": name,
+        "version": version,
+        "created_at": timezone.now().isoformat(),
+    }
+
+    path = artifact_path(name, version)
+    tmp_path = path.with_name(f"{path.name}.tmp-{os.getpid()}")
+
+    if tmp_path.exists():
+        shutil.rmtree(tmp_path)
+    tmp_path.mkdir(parents=True)
+
+    np.savez(tmp_path / ARRAYS_FILE, **arrays)
+    with (tmp_path / METADATA_FILE).open("w", encoding="utf-8") as f:
+        json.dump(metadata, f, indent=2)
+
+    os.replace(tmp_path, path)
+
+    return ModelArtifact(
+        name=name, version=version, arrays=arrays, metadata=metadata
+    )
+
+
+# Artefacts loaded by this process: {(name, version): artifact}
+_loaded_artifacts: Dict[Tuple[str, int], ModelArtifact] = {}
+
+
+def load_artifact(name: str, version: int | None = None) -> ModelArtifact | None:
+    """
+    A stored artefact version, the latest by default (None if not fitted).
+
+    Loaded versions are kept per process; they never change on disk.
+    """
+
+    if version is None:
+        version = latest_artifact_version(name)
+        if version is None:
+            return None
+
+    cached = _loaded_artifacts.get((name, version))
+    if cached is not None:
+        return cached
+
+    path = artifact_path(name, version)
+
+    try:
+        with np.load(path / ARRAYS_FILE) as data:
+            arrays = {key: data[key] for key in data.files}
+        with (path / METADATA_FILE).open("r", encoding="utf-8") as f:
+            metadata = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+    artifact = ModelArtifact(
+        name=name, version=version, arrays=arrays, metadata=metadata
+    )
+    _loaded_artifacts[(name, version)] = artifact
+    return artifact
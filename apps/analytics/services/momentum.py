@@ -0,0 +1,351 @@
+from typing import Dict, List
+from uuid import UUID
+
+import numpy as np
+from django.apps import apps
+from django.core.cache import cache
+from django.db import transaction
+
+from apps.analytics.instrumentation import fill_budget, query_budget
+from config.db_router import use_primary
+
+
+# ============================================================
+# CONSTANTS (Domain knowledge)
+# ============================================================
+
+BUCKET_SECONDS = 60
+DEFAULT_WINDOW_MINUTES = 5
+
+# Match-clock minute each period kicks off at (1st/2nd half, extra time,
+# penalties). Event timestamps may follow the match clock or restart
+# at zero every period.
+PERIOD_START_MINUTES = {1: 0, 2: 45, 3: 90, 4: 105, 5: 120}
+
+# Attacking third starts two thirds up the pitch (normalized 0-100)
+FINAL_THIRD_X = 200 / 3
+
+MOVE_EVENTS = {"pass", "carry"}
+
+# A match without events stores no rows: remembered in the cache so
+# reads do not rebuild it every time
+EMPTY_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Building a match's series: events, transaction (2), delete, insert,
+# then the reload
+MOMENTUM_FILL_QUERIES = 6
+
+SERIES_DTYPES = {
+    "events": np.dtype("<u2"),
+    "final_third_entries": np.dtype("<u2"),
+    "xt": np.dtype("<f4"),
+}
+
+
+# ============================================================
+# DOMAIN: incremental bucket accumulator (pure)
+# ============================================================
+
+class MomentumAccumulator:
+    """
+    Per-team momentum counters, updated in O(1) per event.
+
+    Events must be fed in (period, timestamp_ms) order. Buckets are
+    keyed by (period, minute): each period's buckets follow the previous
+    period's, so stoppage time never shares a bucket with the next
+    period. A move without a recorded end location is resolved by the
+    next event: it entered the final third if the same team's next
+    action starts there.
+    """
+
+    def __init__(self, bucket_seconds: int = BUCKET_SECONDS):
+        self.bucket_ms = bucket_seconds * 1000
+        self.bucket_seconds = bucket_seconds
+        self.series: Dict[UUID, Dict[str, List]] = {}
+        self.buckets = 0
+        # {period: index of its first bucket}
+        self.period_starts: Dict[int, int] = {}
+        self._period_origins: Dict[int, int] = {}
+        self._pending: tuple | None = None
+
+    def feed(
+        self,
+        team_id: UUID,
+        event_type: str,
+        period: int,
+        timestamp_ms: int,
+        x: float | None,
+        end_x: float | None,
+        failed: bool = False,
+        xt_delta: float | None = None,
+    ) -> int:
+        """
+        Consume one event; returns the bucket it landed in.
+        """
+
+        bucket = self._bucket(period, timestamp_ms)
+        self._grow(bucket + 1)
+        series = self._team_series(team_id)
+
+        series["events"][bucket] += 1
+        if xt_delta:
+            series["xt"][bucket] += xt_delta
+
+        pending, self._pending = self._pending, None
+        if (
+            pending is not None
+            and pending[:2] == (team_id, period)
+            and x is not None
+            and x >= FINAL_THIRD_X
+        ):
+            series["final_third_entries"][pending[2]] += 1
+
+        if (
+            event_type in MOVE_EVENTS
+            and not failed
+            and x is not None
+            and x < FINAL_THIRD_X
+        ):
+            if end_x is None:
+                self._pending = (team_id, period, bucket)
+            elif end_x >= FINAL_THIRD_X:
+                series["final_third_entries"][bucket] += 1
+
+        return bucket
+
+    def arrays(self) -> Dict[UUID, Dict[str, np.ndarray]]:
+        return {
+            team_id: {
+                name: np.asarray(values, dtype=SERIES_DTYPES[name])
+                for name, values in series.items()
+            }
+            for team_id, series in self.series.items()
+        }
+
+    def _bucket(self, period: int, timestamp_ms: int) -> int:
+        clock = timestamp_ms // self.bucket_ms
+
+        start = self.period_starts.get(period)
+        if start is None:
+            start = self.period_starts[period] = self.buckets
+            kickoff = PERIOD_START_MINUTES.get(period, 0) * 60
+            self._period_origins[period] = min(
+                clock, kickoff // self.bucket_seconds
+            )
+
+        return start + max(clock - self._period_origins[period], 0)
+
+    def _team_series(self, team_id: UUID) -> Dict[str, List]:
+        series = self.series.get(team_id)
+        if series is None:
+            series = self.series[team_id] = {
+                "events": [0] * self.buckets,
+                "final_third_entries": [0] * self.buckets,
+                "xt": [0.0] * self.buckets,
+            }
+        return series
+
+    def _grow(self, buckets: int) -> None:
+        if buckets <= self.buckets:
+            return
+        extra = buckets - self.buckets
+        for series in self.series.values():
+            series["events"].extend([0] * extra)
+            series["final_third_entries"].extend([0] * extra)
+            series["xt"].extend([0.0] * extra)
+        self.buckets = buckets
+
+
+def rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing window sums in one cumulative pass.
+    """
+
+    totals = np.cumsum(values, dtype=np.float64)
+    if window > 1 and len(totals) > window:
+        totals[window:] = totals[window:] - totals[:-window]
+    return totals
+
+
+def rolling_sum_by_period(
+    values: np.ndarray,
+    window: int,
+    period_starts: Dict[int, int],
+) -> np.ndarray:
+    """
+    rolling_sum() restarted at every period: the window never reaches
+    back into the previous period.
+    """
+
+    bounds = sorted(set(period_starts.values()) | {0, len(values)})
+    return np.concatenate([
+        rolling_sum(values[start:end], window)
+        for start, end in zip(bounds, bounds[1:])
+    ] or [np.zeros(0)])
+
+
+# ============================================================
+# INFRASTRUCTURE (Django ORM)
+# ============================================================
+
+def pack_series(values: np.ndarray, dtype: np.dtype) -> bytes:
+    if dtype.kind == "u":
+        values = np.minimum(values, np.iinfo(dtype).max)
+    return np.asarray(values).astype(dtype).tobytes()
+
+
+@query_budget(1)
+def accumulate_match_momentum(
+    match_id: UUID,
+    bucket_seconds: int = BUCKET_SECONDS,
+) -> MomentumAccumulator:
+    """
+    Feed all events of a match, read in one ordered query.
+    """
+
+    Event = apps.get_model("events", "Event")
+
+    accumulator = MomentumAccumulator(bucket_seconds)
+
+    rows = (
+        Event.objects
+        .filter(match_id=match_id)
+        .order_by("period", "timestamp_ms")
+        .values_list(
+            "team_id", "event_type", "period", "timestamp_ms",
+            "x", "end_x", "outcome", "xt_delta",
+        )
+    )
+
+    for team_id, event_type, period, ts, x, end_x, outcome, xt in rows:
+        accumulator.feed(
+            team_id, event_type, period, ts, x, end_x,
+            failed=outcome == Event.Outcome.FAIL,
+            xt_delta=xt,
+        )
+
+    return accumulator
+
+
+@transaction.atomic
+def store_match_momentum(
+    match_id: UUID,
+    accumulator: MomentumAccumulator,
+) -> int:
+    MatchMomentum = apps.get_model("events", "MatchMomentum")
+
+    MatchMomentum.objects.filter(match_id=match_id).delete()
+
+    rows = []
+    for team_id, series in accumulator.arrays().items():
+        rows.append(MatchMomentum(
+            match_id=match_id,
+            team_id=team_id,
+            bucket_seconds=accumulator.bucket_seconds,
+            buckets=accumulator.buckets,
+            period_starts=accumulator.period_starts,
+            **{
+                name: pack_series(series[name], dtype)
+                for name, dtype in SERIES_DTYPES.items()
+            },
+        ))
+
+    MatchMomentum.objects.bulk_create(rows)
+
+    if rows:
+        cache.delete(empty_momentum_key(match_id))
+    else:
+        cache.set(empty_momentum_key(match_id), True, EMPTY_CACHE_TIMEOUT)
+    return len(rows)
+
+
+def empty_momentum_key(match_id: UUID) -> str:
+    return f"momentum:empty:{match_id}"
+
+
+def invalidate_match_momentum(match_id: UUID) -> None:
+    MatchMomentum = apps.get_model("events", "MatchMomentum")
+    MatchMomentum.objects.filter(match_id=match_id).delete()
+    cache.delete(empty_momentum_key(match_id))
+
+
+@query_budget(1)
+def load_match_momentum(match_id: UUID) -> Dict[UUID, Dict]:
+    """
+    Stored series per team (one query, no event scan), with the first
+    bucket of every period under "period_starts".
+    """
+
+    MatchMomentum = apps.get_model("events", "MatchMomentum")
+
+    return {
+        row["team_id"]: {
+            **{
+                name: np.frombuffer(row[name], dtype=dtype)
+                for name, dtype in SERIES_DTYPES.items()
+            },
+            # JSON object keys come back as strings
+            "period_starts": {
+                int(period): start
+                for period, start in row["period_starts"].items()
+            },
+        }
+        for row in MatchMomentum.objects
+        .filter(match_id=match_id)
+        .values("team_id", "period_starts", *SERIES_DTYPES)
+    }
+
+
+# ============================================================
+# APPLICATION (public API)
+# ============================================================
+
+def rebuild_match_momentum(match_id: UUID) -> int:
+    """
+    Recompute and store momentum series of a finished match.
+    """
+
+    use_primary()
+
+    return store_match_momentum(
+        match_id, accumulate_match_momentum(match_id)
+    )
+
+
+@query_budget(1)
+def match_momentum(
+    match_id: UUID,
+    window_minutes: int = DEFAULT_WINDOW_MINUTES,
+) -> Dict[UUID, Dict]:
+    """
+    Per-minute series per team, smoothed over a trailing window.
+
+    Periods follow one another in each series; "period_starts" gives the
+    index of every period's first minute. The window restarts at each
+    period.
+    """
+
+    series = load_match_momentum(match_id)
+    if not series and not cache.get(empty_momentum_key(match_id)):
+        with fill_budget(MOMENTUM_FILL_QUERIES, "rebuild_match_momentum"):
+            rebuild_match_momentum(match_id)
+            series = load_match_momentum(match_id)
+
+    window = max(1, window_minutes * 60 // BUCKET_SECONDS)
+
+    def smooth(arrays, name):
+        return rolling_sum_by_period(
+            arrays[name], window, arrays["period_starts"]
+        )
+
+    return {
+        team_id: {
+            "events": smooth(arrays, "events").astype(int).tolist(),
+            "final_third_entries": smooth(
+                arrays, "final_third_entries"
+            ).astype(int).tolist(),
+            "xt": np.round(smooth(arrays, "xt"), 3).tolist(),
+            "period_starts": arrays["period_starts"],
+        }
+        for team_id, arrays in series.items()
+    }
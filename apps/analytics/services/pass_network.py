@@ -0,0 +1,345 @@
+import heapq
+import random
+from dataclasses import dataclass
+from typing import Dict, Iterable, List
+from uuid import UUID
+
+import numpy as np
+from django.apps import apps
+from django.core.cache import cache
+
+from apps.analytics.services.event_columns import (
+    MatchEventColumns,
+    NO_PLAYER,
+    load_match_columns,
+    match_columns_version,
+)
+from apps.analytics.instrumentation import query_budget
+
+
+# ============================================================
+# CONSTANTS (Domain knowledge)
+# ============================================================
+
+# Networks above this size use sampled pivots for betweenness
+BETWEENNESS_EXACT_MAX_NODES = 30
+BETWEENNESS_SAMPLES = 16
+
+CACHE_TIMEOUT = 60 * 60 * 24
+
+
+# ============================================================
+# DOMAIN: pass network
+# ============================================================
+
+@dataclass
+class PassNetwork:
+    """
+    Weighted passer → receiver adjacency of one team.
+
+    adjacency[i, j] is the number of completed passes from players[i]
+    to players[j]. Location sums are kept (not averages) so networks of
+    several matches can simply be added together.
+    """
+
+    team_id: UUID
+    players: List[UUID]
+    adjacency: np.ndarray
+    x_sum: np.ndarray
+    y_sum: np.ndarray
+    located_passes: np.ndarray
+    matches_count: int = 1
+
+    @property
+    def average_positions(self) -> np.ndarray:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.stack([
+                self.x_sum / self.located_passes,
+                self.y_sum / self.located_passes,
+            ], axis=1)
+
+
+def empty_network(team_id: UUID) -> PassNetwork:
+    return PassNetwork(
+        team_id=team_id,
+        players=[],
+        adjacency=np.zeros((0, 0), dtype=np.int32),
+        x_sum=np.zeros(0),
+        y_sum=np.zeros(0),
+        located_passes=np.zeros(0, dtype=np.int32),
+        matches_count=0,
+    )
+
+
+def build_match_pass_network(
+    columns: MatchEventColumns,
+    team_id: UUID,
+) -> PassNetwork:
+    """
+    One vectorized pass over the match columns.
+    """
+
+    Event = apps.get_model("events", "Event")
+
+    mask = (
+        columns.type_mask([Event.Type.PASS])
+        & columns.team_mask(team_id)
+        & (columns.player != NO_PLAYER)
+        & (columns.receiver != NO_PLAYER)
+        & (columns.outcome != Event.OUTCOME_CODES[Event.Outcome.FAIL])
+    )
+
+    passers = np.asarray(columns.player[mask], dtype=np.int64)
+    receivers = np.asarray(columns.receiver[mask], dtype=np.int64)
+
+    # Compact match-wide player indexes to this team's nodes
+    nodes, local = np.unique(
+        np.concatenate([passers, receivers]), return_inverse=True
+    )
+    n = len(nodes)
+    local_passers = local[:len(passers)]
+    local_receivers = local[len(passers):]
+
+    adjacency = np.bincount(
+        local_passers * n + local_receivers, minlength=n * n
+    ).reshape(n, n).astype(np.int32)
+
+    x = np.asarray(columns.x[mask], dtype=np.float64)
+    y = np.asarray(columns.y[mask], dtype=np.float64)
+    located = ~(np.isnan(x) | np.isnan(y))
+
+    return PassNetwork(
+        team_id=team_id,
+        players=[columns.players[i] for i in nodes],
+        adjacency=adjacency,
+        x_sum=np.bincount(
+            local_passers[located], weights=x[located], minlength=n
+        ),
+        y_sum=np.bincount(
+            local_passers[located], weights=y[located], minlength=n
+        ),
+        located_passes=np.bincount(
+            local_passers[located], minlength=n
+        ).astype(np.int32),
+    )
+
+
+def combine_networks(
+    team_id: UUID,
+    networks: Iterable[PassNetwork],
+) -> PassNetwork:
+    """
+    Sum per-match networks over the union of their players.
+    """
+
+    networks = list(networks)
+    if not networks:
+        return empty_network(team_id)
+
+    index: Dict[UUID, int] = {}
+    for network in networks:
+        for player_id in network.players:
+            index.setdefault(player_id, len(index))
+
+    n = len(index)
+    combined = PassNetwork(
+        team_id=team_id,
+        players=list(index),
+        adjacency=np.zeros((n, n), dtype=np.int32),
+        x_sum=np.zeros(n),
+        y_sum=np.zeros(n),
+        located_passes=np.zeros(n, dtype=np.int32),
+        matches_count=0,
+    )
+
+    for network in networks:
+        ids = np.array([index[p] for p in network.players], dtype=np.int64)
+        combined.adjacency[np.ix_(ids, ids)] += network.adjacency
+        combined.x_sum[ids] += network.x_sum
+        combined.y_sum[ids] += network.y_sum
+        combined.located_passes[ids] += network.located_passes
+        combined.matches_count += network.matches_count
+
+    return combined
+
+
+# ============================================================
+# DOMAIN: network metrics (pure)
+# ============================================================
+
+def pass_triangles(adjacency: np.ndarray) -> np.ndarray:
+    """
+    Triangles each player belongs to (passes in either direction).
+    """
+
+    linked = ((adjacency + adjacency.T) > 0).astype(np.int64)
+    np.fill_diagonal(linked, 0)
+    return np.diag(linked @ linked @ linked) // 2
+
+
+def approximate_betweenness(
+    adjacency: np.ndarray,
+    seed: int = 0,
+) -> np.ndarray:
+    """
+    Weighted betweenness centrality (Brandes), normalized to 0-1.
+
+    Edge length is 1 / passes, so frequent links are "short". Small
+    networks are exact; larger ones are estimated from sampled sources.
+    """
+
+    n = len(adjacency)
+    if n < 3:
+        return np.zeros(n)
+
+    neighbours = [
+        [(j, 1.0 / adjacency[i, j]) for j in np.flatnonzero(adjacency[i])
+         if j != i]
+        for i in range(n)
+    ]
+
+    sources = list(range(n))
+    if n > BETWEENNESS_EXACT_MAX_NODES:
+        sources = random.Random(seed).sample(sources, BETWEENNESS_SAMPLES)
+
+    centrality = np.zeros(n)
+
+    for s in sources:
+        order: List[int] = []
+        preds: List[List[int]] = [[] for _ in range(n)]
+        sigma = np.zeros(n)
+        sigma[s] = 1
+        dist = np.full(n, np.inf)
+        dist[s] = 0.0
+        heap = [(0.0, s)]
+        done = np.zeros(n, dtype=bool)
+
+        while heap:
+            d, v = heapq.heappop(heap)
+            if done[v]:
+                continue
+            done[v] = True
+            order.append(v)
+
+            for w, length in neighbours[v]:
+                alt = d + length
+                if alt < dist[w] - 1e-12:
+                    dist[w] = alt
+                    sigma[w] = sigma[v]
+                    preds[w] = [v]
+                    heapq.heappush(heap, (alt, w))
+                elif abs(alt - dist[w]) <= 1e-12:
+                    sigma[w] += sigma[v]
+                    preds[w].append(v)
+
+        delta = np.zeros(n)
+        for w in reversed(order):
+            for v in preds[w]:
+                delta[v] += sigma[v] / sigma[w] * (1 + delta[w])
+            if w != s:
+                centrality[w] += delta[w]
+
+    centrality *= n / len(sources)
+    return centrality / ((n - 1) * (n - 2))
+
+
+def calculate_network_metrics(network: PassNetwork) -> Dict:
+    adjacency = network.adjacency
+    n = len(network.players)
+
+    triangles = pass_triangles(adjacency)
+    betweenness = approximate_betweenness(adjacency)
+    positions = network.average_positions
+    linked = (adjacency + adjacency.T) > 0
+    np.fill_diagonal(linked, False)
+
+    players = [
+        {
+            "player_id": str(player_id),
+            "passes_made": int(adjacency[i].sum()),
+            "passes_received": int(adjacency[:, i].sum()),
+            "degree": int(linked[i].sum()),
+            "betweenness": round(float(betweenness[i]), 3),
+            "triangles": int(triangles[i]),
+            "avg_x": (
+                round(float(positions[i, 0]), 1)
+                if network.located_passes[i] else None
+            ),
+            "avg_y": (
+                round(float(positions[i, 1]), 1)
+                if network.located_passes[i] else None
+            ),
+        }
+        for i, player_id in enumerate(network.players)
+    ]
+
+    return {
+        "players": players,
+        "total_passes": int(adjacency.sum()),
+        "triangles": int(triangles.sum() // 3),
+        "density": (
+            round(float(linked.sum()) / (n * (n - 1)), 3) if n > 1 else 0.0
+        ),
+    }
+
+
+# ============================================================
+# INFRASTRUCTURE (cache)
+# ============================================================
+
+@query_budget(0)
+def load_match_pass_network(match_id: UUID, team_id: UUID) -> PassNetwork:
+    """
+    Per-match network, cached until the match's columns change.
+    """
+
+    columns = load_match_columns(match_id)
+
+    version = match_columns_version(match_id)
+    key = f"pass_network:{match_id}:{team_id}:{version}" if version else None
+
+    network = cache.get(key) if key else None
+    if network is None:
+        network = build_match_pass_network(columns, team_id)
+        if key:
+            cache.set(key, network, CACHE_TIMEOUT)
+
+    return network
+
+
+# ============================================================
+# APPLICATION (public API)
+# ============================================================
+
+@query_budget(0)
+def build_pass_network(
+    team_id: UUID,
+    match_ids: Iterable[UUID],
+    min_passes: int = 1,
+) -> Dict:
+    """
+    Pass network of a team over one or several matches.
+    """
+
+    network = combine_networks(
+        team_id,
+        (load_match_pass_network(match_id, team_id) for match_id in match_ids),
+    )
+
+    metrics = calculate_network_metrics(network)
+
+    sources, targets = np.nonzero(network.adjacency >= max(min_passes, 1))
+
+    return {
+        "team_id": str(team_id),
+        "matches_count": network.matches_count,
+        **metrics,
+        "edges": [
+            {
+                "from": str(network.players[i]),
+                "to": str(network.players[j]),
+                "passes": int(network.adjacency[i, j]),
+            }
+            for i, j in zip(sources, targets)
+        ],
+    }
@@ -2,8 +2,16 @@ from typing import Dict, List, Any
 from uuid import UUID
 
 from django.apps import apps
+from django.db.models import Count, Q
 from django.shortcuts import get_object_or_404
 
+from apps.analytics.services.expected_goals import load_player_xg
+from apps.analytics.services.expected_threat import (
+    load_player_xt,
+    load_team_xt,
+)
+from apps.analytics.instrumentation import query_budget, traced
+
 
 # ============================================================
 # CONSTANTS (Domain knowledge)
@@ -87,6 +95,18 @@ PHASE_EVENT_COUNTERS = {
     },
 }
 
+# Event types counted in a player's match summary, by summary key
+SUMMARY_EVENT_TYPES = {
+    "goals": "goal",
+    "assists": "assist",
+    "passes": "pass",
+    "shots": "shot",
+    "tackles": "tackle",
+    "interceptions": "interception",
+    "yellow_cards": "yellow_card",
+    "red_cards": "red_card",
+}
+
 
 # ============================================================
 # DOMAIN FUNCTIONS (pure logic)
@@ -262,11 +282,15 @@ def position_metrics(position: str, events: Dict[str, int]) -> List[Dict[str, An
 # INFRASTRUCTURE (Django ORM)
 # ============================================================
 
+@traced
+@query_budget(1)
 def load_appearance(match, player):
     Appearance = apps.get_model("players", "Appearance")
     return get_object_or_404(Appearance, match=match, player=player)
 
 
+@traced
+@query_budget(1)
 def load_player_events(match, player) -> List[Dict[str, Any]]:
     Event = apps.get_model("events", "Event")
 
@@ -281,20 +305,33 @@ def load_player_events(match, player) -> List[Dict[str, Any]]:
     )
 
 
+@traced
+@query_budget(1)
 def load_events_summary(match, player) -> Dict[str, int]:
     Event = apps.get_model("events", "Event")
 
-    qs = Event.objects.filter(match=match, player=player)
+    return Event.objects.filter(match=match, player=player).aggregate(**{
+        key: Count("id", filter=Q(event_type=event_type))
+        for key, event_type in SUMMARY_EVENT_TYPES.items()
+    })
+
+
+@traced
+@query_budget(2)
+def load_expected_threat(match, player, team_id) -> Dict[str, Any]:
+    """
+    Stored xT of the player and of the player's team.
+    """
+
+    player_xt = load_player_xt(match.id, player.id)
+    team_xt = load_team_xt(match.id).get(team_id, 0.0)
 
     return {
-        "goals": qs.filter(event_type="goal").count(),
-        "assists": qs.filter(event_type="assist").count(),
-        "passes": qs.filter(event_type="pass").count(),
-        "shots": qs.filter(event_type="shot").count(),
-        "tackles": qs.filter(event_type="tackle").count(),
-        "interceptions": qs.filter(event_type="interception").count(),
-        "yellow_cards": qs.filter(event_type="yellow_card").count(),
-        "red_cards": qs.filter(event_type="red_card").count(),
+        "player_xt": player_xt,
+        "team_xt": team_xt,
+        "share_pct": (
+            round(player_xt / team_xt * 100, 1) if team_xt > 0 else None
+        ),
     }
 
 
@@ -308,6 +345,8 @@ class PlayerMatchProfileService:
         self.player = player
         self.appearance = load_appearance(match, player)
 
+    @traced
+    @query_budget(5)
     def build(self) -> Dict[str, Any]:
         events_summary = load_events_summary(self.match, self.player)
         raw_events = load_player_events(self.match, self.player)
@@ -326,6 +365,12 @@ class PlayerMatchProfileService:
                 self.player.primary_position,
                 events_summary,
             ),
+            "expected_threat": load_expected_threat(
+                self.match,
+                self.player,
+                self.appearance.team_id,
+            ),
+            "shot_quality": load_player_xg(self.match.id, self.player.id),
             "timeline": timeline,
             "phase_metrics": phase_metrics,
             "insights": generate_insights(
@@ -3,6 +3,9 @@ from uuid import UUID
 
 from django.apps import apps
 
+from apps.analytics.services.event_columns import load_match_columns
+from apps.analytics.instrumentation import query_budget
+
 
 # ============================================================
 # Domain logic (pure, reusable, testable)
@@ -30,18 +33,18 @@ def calculate_events_per_90(
 
 
 # ============================================================
-# Infrastructure layer (Django ORM, data access)
+# Infrastructure layer (Django ORM + columnar event store)
 # ============================================================
 
+@query_budget(1)
 def load_match_player_events(
     match_id: UUID,
 ) -> Tuple[Dict[UUID, int], Dict[UUID, int]]:
     """
-    Loads minutes played and event counts per player from DB.
-    Django-specific infrastructure code.
+    Loads minutes played (DB) and event counts per player
+    (columnar event store).
     """
 
-    Event = apps.get_model("events", "Event")
     Appearance = apps.get_model("players", "Appearance")
 
     appearances = Appearance.objects.filter(
@@ -57,15 +60,14 @@ def load_match_player_events(
     if not minutes_by_player:
         return {}, {}
 
-    events = Event.objects.filter(
-        match_id=match_id,
-        player_id__in=minutes_by_player.keys(),
-    )
+    columns = load_match_columns(match_id)
+    counted = columns.counted_mask()
 
-    event_counts: Dict[UUID, int] = {}
-
-    for event in events:
-        event_counts[event.player_id] = event_counts.get(event.player_id, 0) + 1
+    event_counts: Dict[UUID, int] = {
+        player_id: count
+        for player_id, count in columns.counts_by_player(counted).items()
+        if player_id in minutes_by_player
+    }
 
     return minutes_by_player, event_counts
 
@@ -74,6 +76,7 @@ def load_match_player_events(
 # Application / Use-case layer
 # ============================================================
 
+@query_budget(1)
 def player_events_per_90(match_id: UUID) -> Dict[UUID, float]:
     """
     Application-level use case.
@@ -0,0 +1,246 @@
+from datetime import date
+from typing import Dict, Iterable, List
+from uuid import UUID
+
+import numpy as np
+from django.apps import apps
+from django.db import transaction
+from django.db.models import Sum
+from django.utils import timezone
+
+from apps.analytics.services.event_columns import NO_PLAYER, load_match_columns
+from apps.analytics.instrumentation import query_budget
+
+
+# ============================================================
+# CONSTANTS (Domain knowledge)
+# ============================================================
+
+# Stored PlayerMatchMetric columns exposed as trends
+TREND_METRICS = {
+    "events": {"label": "Действия с мячом"},
+    "passes": {"label": "Передачи"},
+    "shots": {"label": "Удары"},
+    "goals": {"label": "Голы"},
+    "assists": {"label": "Голевые передачи"},
+    "tackles": {"label": "Отборы"},
+    "interceptions": {"label": "Перехваты"},
+    "xg": {"label": "Ожидаемые голы", "unit": " xG"},
+    "xt": {"label": "Ожидаемая угроза", "unit": " xT"},
+}
+
+DEFAULT_TREND_METRICS = ["events", "passes", "xt"]
+
+# Event-count columns filled from the columnar event store
+COUNTED_EVENT_TYPES = {
+    "passes": ["pass"],
+    "shots": ["shot", "goal"],
+    "goals": ["goal"],
+    "assists": ["assist"],
+    "tackles": ["tackle"],
+    "interceptions": ["interception"],
+}
+
+DEFAULT_MAX_POINTS = 50
+MAX_SMALLINT = 32767
+
+
+# ============================================================
+# DOMAIN: downsampling (pure)
+# ============================================================
+
+def downsample_points(
+    points: List[Dict],
+    max_points: int,
+) -> List[Dict]:
+    """
+    Merge consecutive matches into at most `max_points` buckets.
+
+    A bucket reports the mean value, total minutes, and the last match
+    it covers (so the series still ends on the latest match).
+    """
+
+    n = len(points)
+    if n <= max_points:
+        return points
+
+    starts = np.linspace(0, n, max_points, endpoint=False).astype(np.int64)
+    ends = np.append(starts[1:], n)
+
+    values = np.array([p["value"] for p in points], dtype=np.float64)
+    minutes = np.array([p["minutes_played"] for p in points], dtype=np.int64)
+
+    means = np.add.reduceat(values, starts) / (ends - starts)
+    minute_totals = np.add.reduceat(minutes, starts)
+
+    return [
+        {
+            "match_id": points[end - 1]["match_id"],
+            "match_date": points[end - 1]["match_date"],
+            "value": round(float(mean), 3),
+            "minutes_played": int(total),
+            "matches": int(end - start),
+        }
+        for start, end, mean, total in zip(starts, ends, means, minute_totals)
+    ]
+
+
+# ============================================================
+# INFRASTRUCTURE (Django ORM)
+# ============================================================
+
+@query_budget(3)
+def build_player_match_metrics(match_id: UUID) -> List:
+    """
+    One PlayerMatchMetric per player who appeared or acted in a match.
+    """
+
+    Match = apps.get_model("competitions", "Match")
+    Appearance = apps.get_model("players", "Appearance")
+    Event = apps.get_model("events", "Event")
+    PlayerMatchMetric = apps.get_model("players", "PlayerMatchMetric")
+
+    match = Match.objects.only("kickoff_time").get(id=match_id)
+    match_date = timezone.localdate(match.kickoff_time)
+
+    columns = load_match_columns(match_id)
+    acted = columns.player != NO_PLAYER
+
+    counts = {
+        name: columns.counts_by_player(columns.type_mask(types))
+        for name, types in COUNTED_EVENT_TYPES.items()
+    }
+    counts["events"] = columns.counts_by_player(
+        acted & columns.counted_mask()
+    )
+
+    # Team of each acting player: the team of their first event
+    first = {}
+    for index, team in zip(columns.player[acted], columns.team[acted]):
+        first.setdefault(int(index), int(team))
+    teams = {
+        columns.players[index]: columns.teams[team]
+        for index, team in first.items()
+    }
+
+    minutes: Dict[UUID, int] = {}
+    for player_id, team_id, played in (
+        Appearance.objects
+        .filter(match_id=match_id)
+        .values_list("player_id", "team_id", "minutes_played")
+    ):
+        minutes[player_id] = played
+        teams.setdefault(player_id, team_id)
+
+    values = {
+        row["player_id"]: row
+        for row in Event.objects
+        .filter(match_id=match_id, player__isnull=False)
+        .values("player_id")
+        .annotate(xg=Sum("xg"), xt=Sum("xt_delta"))
+    }
+
+    return [
+        PlayerMatchMetric(
+            player_id=player_id,
+            match_id=match_id,
+            team_id=team_id,
+            match_date=match_date,
+            minutes_played=minutes.get(player_id, 0),
+            **{
+                name: min(counts[name].get(player_id, 0), MAX_SMALLINT)
+                for name in counts
+            },
+            xg=round(values.get(player_id, {}).get("xg") or 0.0, 4),
+            xt=round(values.get(player_id, {}).get("xt") or 0.0, 4),
+        )
+        for player_id, team_id in teams.items()
+    ]
+
+
+@transaction.atomic
+def refresh_player_match_metrics(match_id: UUID) -> int:
+    """
+    Replace the per-match metric rows of a match.
+    """
+
+    PlayerMatchMetric = apps.get_model("players", "PlayerMatchMetric")
+
+    rows = build_player_match_metrics(match_id)
+
+    PlayerMatchMetric.objects.filter(match_id=match_id).delete()
+    PlayerMatchMetric.objects.bulk_create(rows, batch_size=500)
+    return len(rows)
+
+
+@query_budget(1)
+def load_player_metric_rows(
+    player_id: UUID,
+    metrics: Iterable[str],
+    date_from: date | None = None,
+    date_to: date | None = None,
+) -> List[Dict]:
+    """
+    Per-match rows of a player in date order (one indexed range query,
+    no join: match_date is denormalized).
+
+    Rows exist for matches rebuilt since PlayerMatchMetric was added;
+    `manage.py rebuild_derived_data` backfills older ones.
+    """
+
+    PlayerMatchMetric = apps.get_model("players", "PlayerMatchMetric")
+
+    qs = PlayerMatchMetric.objects.filter(player_id=player_id)
+    if date_from is not None:
+        qs = qs.filter(match_date__gte=date_from)
+    if date_to is not None:
+        qs = qs.filter(match_date__lte=date_to)
+
+    return list(
+        qs.order_by("match_date", "match_id")
+        .values("match_id", "match_date", "minutes_played", *metrics)
+    )
+
+
+# ============================================================
+# APPLICATION (public API)
+# ============================================================
+
+@query_budget(1)
+def build_player_trends(
+    player_id: UUID,
+    metrics: Iterable[str] | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    max_points: int = DEFAULT_MAX_POINTS,
+) -> List[Dict]:
+    """
+    MetricTrend list (see frontend/types/trends.ts) for one player.
+    """
+
+    metrics = list(metrics or DEFAULT_TREND_METRICS)
+    rows = load_player_metric_rows(player_id, metrics, date_from, date_to)
+
+    trends = []
+    for key in metrics:
+        points = [
+            {
+                "match_id": str(row["match_id"]),
+                "match_date": row["match_date"].isoformat(),
+                "value": row[key],
+                "minutes_played": row["minutes_played"],
+            }
+            for row in rows
+        ]
+
+        trend = {
+            "key": key,
+            "label": TREND_METRICS[key]["label"],
+            "points": downsample_points(points, max_points),
+        }
+        if "unit" in TREND_METRICS[key]:
+            trend["unit"] = TREND_METRICS[key]["unit"]
+
+        trends.append(trend)
+
+    return trends
@@ -0,0 +1,410 @@
+import math
+from dataclasses import dataclass
+from typing import Dict, List
+from uuid import UUID
+
+from django.apps import apps
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import (
+    Avg,
+    Count,
+    Exists,
+    ExpressionWrapper,
+    F,
+    OuterRef,
+    Q,
+    Sum,
+)
+
+from apps.events.zones import zone_for
+
+from apps.analytics.services.event_columns import (
+    MatchEventColumns,
+    load_match_columns,
+)
+from apps.analytics.instrumentation import fill_budget, query_budget
+from config.db_router import use_primary
+
+
+# ============================================================
+# CONSTANTS (Domain knowledge)
+# ============================================================
+
+# Events that mean the acting team has the ball
+POSSESSION_EVENTS = {
+    "pass",
+    "carry",
+    "shot",
+    "goal",
+    "assist",
+    "recovery",
+    "interception",
+    "corner",
+    "free_kick",
+    "penalty",
+}
+
+# Events where the acting team gives the ball away
+LOSS_EVENTS = {"turnover"}
+
+# A match segmented into no chains stores no rows: remembered in the
+# cache so reads do not segment it again every time
+EMPTY_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Bulk INSERTs storing the chains of a long match (SQLite takes 76
+# chains per INSERT: 999 variables, 13 columns)
+MAX_CHAIN_INSERTS = 10
+
+# Segmenting a match: status check, transaction (2), delete, inserts
+CHAINS_FILL_QUERIES = 4 + MAX_CHAIN_INSERTS
+
+
+# ============================================================
+# DOMAIN: single-pass segmentation (pure)
+# ============================================================
+
+@dataclass
+class Chain:
+    team_id: UUID
+    period: int
+    start_ms: int
+    end_ms: int
+    sequence: int = 0
+    events_count: int = 0
+    passes_count: int = 0
+    start_x: float | None = None
+    end_x: float | None = None
+    last_y: float | None = None
+    distance: float = 0.0
+    zones_mask: int = 0
+    shots: int = 0
+    goals: int = 0
+    outcome: str = "ongoing"
+
+
+class PossessionSegmenter:
+    """
+    Segments events into possession chains in one forward pass.
+
+    Events must be fed in (period, timestamp_ms) order. The segmenter
+    is incremental, so live ingestion can keep feeding new events and
+    collect chains as they close.
+    """
+
+    def __init__(self, next_sequence: int = 0):
+        self.current: Chain | None = None
+        self.next_sequence = next_sequence
+
+    def feed(
+        self,
+        team_id: UUID,
+        event_type: str,
+        period: int,
+        timestamp_ms: int,
+        x: float | None,
+        y: float | None,
+    ) -> List[Chain]:
+        """
+        Consume one event; returns chains closed by it.
+        """
+
+        closed: List[Chain] = []
+        chain = self.current
+
+        if chain is not None and period != chain.period:
+            closed.append(self._close("period_end", chain.end_ms))
+            chain = None
+
+        if event_type in POSSESSION_EVENTS and (
+            chain is None or team_id != chain.team_id
+        ):
+            if chain is not None:
+                closed.append(self._close("turnover", timestamp_ms))
+            chain = self._open(team_id, period, timestamp_ms)
+
+        if chain is None:
+            # Off-ball action before anyone had the ball
+            return closed
+
+        chain.events_count += 1
+        chain.end_ms = max(chain.end_ms, timestamp_ms)
+
+        if team_id == chain.team_id:
+            self._track_ball(chain, event_type, x, y)
+
+            if event_type in LOSS_EVENTS:
+                closed.append(self._close("turnover", chain.end_ms))
+
+        return closed
+
+    def finish(self) -> List[Chain]:
+        """
+        Close the open chain at the end of a finished match.
+        """
+
+        if self.current is None:
+            return []
+        return [self._close("period_end", self.current.end_ms)]
+
+    def _open(self, team_id: UUID, period: int, timestamp_ms: int) -> Chain:
+        self.current = Chain(
+            team_id=team_id,
+            period=period,
+            start_ms=timestamp_ms,
+            end_ms=timestamp_ms,
+            sequence=self.next_sequence,
+        )
+        self.next_sequence += 1
+        return self.current
+
+    def _close(self, reason: str, end_ms: int) -> Chain:
+        chain = self.current
+        self.current = None
+
+        chain.end_ms = max(chain.end_ms, end_ms)
+        if chain.goals:
+            chain.outcome = "goal"
+        elif chain.shots:
+            chain.outcome = "shot"
+        else:
+            chain.outcome = reason
+        return chain
+
+    @staticmethod
+    def _track_ball(
+        chain: Chain,
+        event_type: str,
+        x: float | None,
+        y: float | None,
+    ) -> None:
+        if event_type == "pass":
+            chain.passes_count += 1
+        elif event_type == "shot":
+            chain.shots += 1
+        elif event_type == "goal":
+            chain.goals += 1
+
+        if x is None or y is None or math.isnan(x) or math.isnan(y):
+            return
+
+        if chain.start_x is None:
+            chain.start_x = x
+        else:
+            chain.distance += math.hypot(x - chain.end_x, y - chain.last_y)
+
+        chain.end_x = x
+        chain.last_y = y
+        chain.zones_mask |= 1 << zone_for(x, y)
+
+
+def segment_match(
+    columns: MatchEventColumns,
+    finished: bool = True,
+) -> List[Chain]:
+    """
+    Possession chains of a match from its columnar events.
+
+    For a match in progress the open chain is left out: the live
+    segmenter closes it later under the same sequence number.
+    """
+
+    Event = apps.get_model("events", "Event")
+
+    type_names = {code: str(value) for value, code in Event.TYPE_CODES.items()}
+    segmenter = PossessionSegmenter()
+    chains: List[Chain] = []
+
+    for team, type_code, period, ts, x, y in zip(
+        columns.team.tolist(),
+        columns.event_type.tolist(),
+        columns.period.tolist(),
+        columns.timestamp_ms.tolist(),
+        columns.x.tolist(),
+        columns.y.tolist(),
+    ):
+        chains += segmenter.feed(
+            columns.teams[team],
+            type_names.get(type_code, ""),
+            period,
+            ts,
+            x,
+            y,
+        )
+
+    if finished:
+        chains += segmenter.finish()
+    return chains
+
+
+# ============================================================
+# INFRASTRUCTURE (Django ORM)
+# ============================================================
+
+def chain_to_row(match_id: UUID, chain: Chain):
+    PossessionChain = apps.get_model("events", "PossessionChain")
+
+    return PossessionChain(
+        match_id=match_id,
+        team_id=chain.team_id,
+        sequence=chain.sequence,
+        period=chain.period,
+        start_ms=chain.start_ms,
+        end_ms=chain.end_ms,
+        events_count=min(chain.events_count, 32767),
+        passes_count=min(chain.passes_count, 32767),
+        start_x=chain.start_x,
+        end_x=chain.end_x,
+        distance=round(chain.distance, 2),
+        zones_mask=chain.zones_mask,
+        outcome=chain.outcome,
+    )
+
+
+@transaction.atomic
+def store_possession_chains(match_id: UUID, chains: List[Chain]) -> int:
+    PossessionChain = apps.get_model("events", "PossessionChain")
+
+    PossessionChain.objects.filter(match_id=match_id).delete()
+    PossessionChain.objects.bulk_create(
+        [chain_to_row(match_id, chain) for chain in chains],
+        batch_size=1000,
+    )
+
+    if chains:
+        cache.delete(empty_chains_key(match_id))
+    else:
+        cache.set(empty_chains_key(match_id), True, EMPTY_CACHE_TIMEOUT)
+    return len(chains)
+
+
+def empty_chains_key(match_id: UUID) -> str:
+    return f"possession_chains:empty:{match_id}"
+
+
+def invalidate_possession_chains(match_id: UUID) -> None:
+    PossessionChain = apps.get_model("events", "PossessionChain")
+    PossessionChain.objects.filter(match_id=match_id).delete()
+    cache.delete(empty_chains_key(match_id))
+
+
+@query_budget(1)
+def load_team_possession_time(match_id: UUID) -> Dict[UUID, int]:
+    """
+    Milliseconds in possession per team (one grouped query).
+    """
+
+    PossessionChain = apps.get_model("events", "PossessionChain")
+
+    return {
+        row["team_id"]: row["time_ms"] or 0
+        for row in PossessionChain.objects
+        .filter(match_id=match_id)
+        .values("team_id")
+        .annotate(time_ms=Sum(F("end_ms") - F("start_ms")))
+    }
+
+
+# ============================================================
+# APPLICATION (public API)
+# ============================================================
+
+def rebuild_possession_chains(match_id: UUID) -> int:
+    """
+    Re-segment a match and replace its stored chains.
+    """
+
+    Match = apps.get_model("competitions", "Match")
+
+    use_primary()
+
+    in_progress = Match.objects.filter(
+        id=match_id, status=Match.Status.IN_PROGRESS
+    ).exists()
+
+    chains = segment_match(
+        load_match_columns(match_id), finished=not in_progress
+    )
+    return store_possession_chains(match_id, chains)
+
+
+@query_budget(1)
+def ensure_possession_chains(match_id: UUID) -> None:
+    """
+    Build chains lazily for matches imported before segmentation.
+
+    Matches in progress are skipped: live ingestion stores their chains.
+    Matches already segmented into no chains are not segmented again.
+    """
+
+    if cache.get(empty_chains_key(match_id)):
+        return
+
+    Match = apps.get_model("competitions", "Match")
+    PossessionChain = apps.get_model("events", "PossessionChain")
+
+    missing = (
+        Match.objects
+        .filter(id=match_id)
+        .exclude(status=Match.Status.IN_PROGRESS)
+        .exclude(Exists(
+            PossessionChain.objects.filter(match_id=OuterRef("pk"))
+        ))
+        .exists()
+    )
+    if missing:
+        with fill_budget(CHAINS_FILL_QUERIES, "rebuild_possession_chains"):
+            rebuild_possession_chains(match_id)
+
+
+@query_budget(2)
+def possession_summary(match_id: UUID) -> Dict[UUID, Dict]:
+    """
+    Possession %, sequence length, directness and chain outcomes per team.
+    """
+
+    PossessionChain = apps.get_model("events", "PossessionChain")
+
+    ensure_possession_chains(match_id)
+
+    # Forward progress per unit of ball travel (PossessionChain.directness)
+    directness = ExpressionWrapper(
+        (F("end_x") - F("start_x")) / F("distance"),
+        output_field=models.FloatField(),
+    )
+
+    rows = (
+        PossessionChain.objects
+        .filter(match_id=match_id)
+        .values("team_id")
+        .annotate(
+            chains=Count("id"),
+            time_ms=Sum(F("end_ms") - F("start_ms")),
+            avg_events=Avg("events_count"),
+            avg_passes=Avg("passes_count"),
+            avg_directness=Avg(directness, filter=Q(distance__gt=0)),
+            turnovers=Count("id", filter=Q(outcome="turnover")),
+            shots=Count("id", filter=Q(outcome__in=["shot", "goal"])),
+        )
+    )
+
+    total_ms = sum(row["time_ms"] or 0 for row in rows)
+
+    return {
+        row["team_id"]: {
+            "possession_pct": (
+                round((row["time_ms"] or 0) / total_ms * 100, 1)
+                if total_ms else 0.0
+            ),
+            "chains": row["chains"],
+            "avg_sequence_events": round(row["avg_events"] or 0, 2),
+            "avg_sequence_passes": round(row["avg_passes"] or 0, 2),
+            "avg_directness": (
+                round(row["avg_directness"], 2)
+                if row["avg_directness"] is not None else None
+            ),
+            "turnover_endings": row["turnovers"],
+            "shot_endings": row["shots"],
+        }
+        for row in rows
+    }
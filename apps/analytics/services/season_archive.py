@@ -0,0 +1,283 @@
+from pathlib import Path
+from typing import Dict, Iterable, List
+from uuid import UUID
+
+import numpy as np
+from django.apps import apps
+from django.conf import settings
+
+from apps.analytics.services.event_columns import (
+    MatchEventColumns,
+    NO_PLAYER,
+    load_match_columns,
+)
+from apps.analytics.instrumentation import query_budget
+from apps.analytics.services.versioned_dirs import (
+    new_version_dir,
+    publish_version_dir,
+    remove_version_dir,
+    resolve_version_dir,
+)
+
+
+# ============================================================
+# CONSTANTS (storage layout)
+# ============================================================
+
+ARCHIVES_DIR = "season_archives"
+
+SEASON_EVENT_DTYPE = np.dtype([
+    ("match", np.uint16),
+    ("team", np.int32),
+    ("player", np.int32),
+    ("receiver", np.int32),
+    ("event_type", np.uint8),
+    ("outcome", np.uint8),
+    ("period", np.uint8),
+    ("timestamp_ms", np.uint32),
+    ("x", np.float32),
+    ("y", np.float32),
+    ("end_x", np.float32),
+    ("end_y", np.float32),
+])
+
+
+# ============================================================
+# DOMAIN: read-only season archive
+# ============================================================
+
+class SeasonArchive:
+    """
+    All events of a season as one contiguous structured array.
+
+    Events are grouped by match (kickoff order); `offsets[i]:offsets[i+1]`
+    is the slice of `matches[i]`. The array is a read-only memory map, so
+    every worker process that opens the same archive shares its pages.
+    """
+
+    def __init__(
+        self,
+        season_id: UUID,
+        events: np.ndarray,
+        matches: List[UUID],
+        offsets: np.ndarray,
+        teams: List[UUID],
+        players: List[UUID],
+    ):
+        self.season_id = season_id
+        self.events = events
+        self.matches = matches
+        self.offsets = offsets
+        self.teams = teams
+        self.players = players
+        self._match_index = {m: i for i, m in enumerate(matches)}
+        self._team_index = {t: i for i, t in enumerate(teams)}
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def __contains__(self, match_id: UUID) -> bool:
+        return match_id in self._match_index
+
+    def match_slice(self, match_id: UUID) -> np.ndarray:
+        """
+        Zero-copy view of one match's events.
+        """
+
+        i = self._match_index[match_id]
+        return self.events[self.offsets[i]:self.offsets[i + 1]]
+
+    def matches_mask(self, match_ids: Iterable[UUID]) -> np.ndarray:
+        """
+        Boolean mask over the archive selecting the given matches.
+        """
+
+        mask = np.zeros(len(self.events), dtype=bool)
+        for match_id in match_ids:
+            i = self._match_index.get(match_id)
+            if i is not None:
+                mask[self.offsets[i]:self.offsets[i + 1]] = True
+        return mask
+
+    def team_mask(self, team_id: UUID) -> np.ndarray:
+        i = self._team_index.get(team_id)
+        if i is None:
+            return np.zeros(len(self.events), dtype=bool)
+        return self.events["team"] == i
+
+    def type_mask(self, event_types: Iterable[str]) -> np.ndarray:
+        Event = apps.get_model("events", "Event")
+
+        codes = [
+            Event.TYPE_CODES[t]
+            for t in event_types
+            if t in Event.TYPE_CODES
+        ]
+        return np.isin(self.events["event_type"], codes)
+
+    def match_columns(self, match_id: UUID) -> MatchEventColumns:
+        """
+        One match as MatchEventColumns backed by views into the archive.
+
+        Team and player indexes refer to the season-wide tables.
+        """
+
+        rows = self.match_slice(match_id)
+
+        return MatchEventColumns(
+            match_id=match_id,
+            teams=self.teams,
+            players=self.players,
+            event_type=rows["event_type"],
+            team=rows["team"],
+            player=rows["player"],
+            receiver=rows["receiver"],
+            timestamp_ms=rows["timestamp_ms"],
+            period=rows["period"],
+            x=rows["x"],
+            y=rows["y"],
+            end_x=rows["end_x"],
+            end_y=rows["end_y"],
+            outcome=rows["outcome"],
+        )
+
+
+# ============================================================
+# INFRASTRUCTURE (files under MEDIA_ROOT)
+# ============================================================
+
+def season_archive_path(season_id: UUID) -> Path:
+    return Path(settings.MEDIA_ROOT) / ARCHIVES_DIR / str(season_id)
+
+
+@query_budget(1)
+def load_season_match_ids(season_id: UUID) -> List[UUID]:
+    Match = apps.get_model("competitions", "Match")
+
+    return list(
+        Match.objects
+        .filter(season_id=season_id)
+        .order_by("kickoff_time", "id")
+        .values_list("id", flat=True)
+    )
+
+
+@query_budget(1)
+def build_season_archive(season_id: UUID) -> Path:
+    """
+    Write the season archive from the per-match columnar store.
+
+    Rows are written straight into a memory-mapped output file, so the
+    season never has to fit in memory twice. The archive is built in a
+    new version directory and published with an atomic link swap.
+    """
+
+    match_ids = load_season_match_ids(season_id)
+    if len(match_ids) > np.iinfo(np.uint16).max:
+        raise ValueError(f"Season {season_id} has too many matches")
+
+    columns = [load_match_columns(match_id) for match_id in match_ids]
+
+    offsets = np.zeros(len(columns) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(c) for c in columns])
+
+    teams: Dict[UUID, int] = {}
+    players: Dict[UUID, int] = {}
+
+    path = season_archive_path(season_id)
+    tmp_path = new_version_dir(path)
+
+    events = np.lib.format.open_memmap(
+        tmp_path / "events.npy",
+        mode="w+",
+        dtype=SEASON_EVENT_DTYPE,
+        shape=(int(offsets[-1]),),
+    )
+
+    for i, match_columns in enumerate(columns):
+        rows = events[offsets[i]:offsets[i + 1]]
+
+        # Match-local indexes → season-wide indexes
+        team_map = np.array(
+            [teams.setdefault(t, len(teams)) for t in match_columns.teams],
+            dtype=np.int32,
+        )
+        player_map = np.array(
+            [
+                players.setdefault(p, len(players))
+                for p in match_columns.players
+            ] + [NO_PLAYER],
+            dtype=np.int32,
+        )
+
+        rows["match"] = i
+        rows["team"] = team_map[match_columns.team]
+        # NO_PLAYER (-1) picks the trailing NO_PLAYER entry of player_map
+        rows["player"] = player_map[match_columns.player]
+        rows["receiver"] = player_map[match_columns.receiver]
+        for name in (
+            "event_type", "outcome", "period", "timestamp_ms",
+            "x", "y", "end_x", "end_y",
+        ):
+            rows[name] = getattr(match_columns, name)
+
+    events.flush()
+    del events
+
+    np.save(tmp_path / "offsets.npy", offsets)
+    np.save(tmp_path / "matches.npy", np.array([m.hex for m in match_ids]))
+    np.save(tmp_path / "teams.npy", np.array([t.hex for t in teams]))
+    np.save(tmp_path / "players.npy", np.array([p.hex for p in players]))
+
+    publish_version_dir(path, tmp_path)
+
+    _open_archives.pop(season_id, None)
+
+    return path
+
+
+def invalidate_season_archive(season_id: UUID) -> None:
+    _open_archives.pop(season_id, None)
+    remove_version_dir(season_archive_path(season_id))
+
+
+# Archives opened by this process: {season_id: (version dir, archive)}
+_open_archives: Dict[UUID, tuple] = {}
+
+
+def open_season_archive(season_id: UUID) -> SeasonArchive | None:
+    """
+    Open a season archive read-only (None if it has not been built).
+
+    The archive is kept open per process and reopened when rebuilt.
+    """
+
+    # Every file comes from the one version the link points at; a
+    # rebuild publishes a new version directory
+    path = resolve_version_dir(season_archive_path(season_id))
+    if path is None:
+        _open_archives.pop(season_id, None)
+        return None
+
+    cached = _open_archives.get(season_id)
+    if cached and cached[0] == path:
+        return cached[1]
+
+    try:
+        archive = SeasonArchive(
+            season_id=season_id,
+            events=np.load(path / "events.npy", mmap_mode="r"),
+            matches=[UUID(m) for m in np.load(path / "matches.npy")],
+            offsets=np.load(path / "offsets.npy"),
+            teams=[UUID(t) for t in np.load(path / "teams.npy")],
+            players=[UUID(p) for p in np.load(path / "players.npy")],
+        )
+    except (FileNotFoundError, ValueError):
+        return None
+
+    if archive.events.dtype != SEASON_EVENT_DTYPE:
+        # Written by an older layout: ignored until rebuilt
+        return None
+
+    _open_archives[season_id] = (path, archive)
+    return archive
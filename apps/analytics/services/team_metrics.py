@@ -3,25 +3,32 @@ from uuid import UUID
 
 from django.apps import apps
 
+from apps.analytics.services.event_columns import load_match_columns
+from apps.analytics.services.possession_chains import (
+    ensure_possession_chains,
+    load_team_possession_time,
+)
+from apps.analytics.instrumentation import query_budget
+
 
 # ============================================================
 # Domain logic (pure functions, no Django dependencies)
 # ============================================================
 
 def calculate_team_possession(
-    team_event_counts: Dict[UUID, int],
-    total_events: int,
+    team_possession_ms: Dict[UUID, int],
+    total_ms: int,
 ) -> Dict[UUID, float]:
     """
     Calculate possession percentage per team.
     """
 
-    if total_events == 0:
+    if total_ms == 0:
         return {}
 
     return {
-        team_id: round((count / total_events) * 100, 1)
-        for team_id, count in team_event_counts.items()
+        team_id: round((ms / total_ms) * 100, 1)
+        for team_id, ms in team_possession_ms.items()
     }
 
 
@@ -50,48 +57,30 @@ def calculate_team_turnovers(
 
 
 # ============================================================
-# Infrastructure layer (Django ORM, data loading)
+# Infrastructure layer (columnar event store, possession chains)
 # ============================================================
 
-def load_team_ball_control_events(
-    match_id: UUID,
-) -> Tuple[Dict[UUID, int], int]:
+@query_budget(2)
+def load_team_possession(match_id: UUID) -> Dict[UUID, int]:
     """
-    Load ball-control events (passes + shots) per team.
+    Load time in possession (ms) per team from possession chains.
     """
 
-    Event = apps.get_model("events", "Event")
-
-    BALL_CONTROL_EVENTS = {
-        Event.Type.PASS,
-        Event.Type.SHOT,
-    }
-
-    events = Event.objects.filter(
-        match_id=match_id,
-        event_type__in=BALL_CONTROL_EVENTS,
-    )
-
-    team_event_counts: Dict[UUID, int] = {}
+    ensure_possession_chains(match_id)
 
-    for event in events:
-        team_event_counts[event.team_id] = (
-            team_event_counts.get(event.team_id, 0) + 1
-        )
-
-    return team_event_counts, events.count()
+    return load_team_possession_time(match_id)
 
 
+@query_budget(0)
 def load_total_events_count(match_id: UUID) -> int:
     """
-    Load total number of events in a match.
+    Load total number of counted events in a match (carries excluded).
     """
 
-    Event = apps.get_model("events", "Event")
-
-    return Event.objects.filter(match_id=match_id).count()
+    return int(load_match_columns(match_id).counted_mask().sum())
 
 
+@query_budget(0)
 def load_team_turnovers(match_id: UUID) -> Dict[UUID, int]:
     """
     Load turnovers per team.
@@ -99,36 +88,32 @@ def load_team_turnovers(match_id: UUID) -> Dict[UUID, int]:
 
     Event = apps.get_model("events", "Event")
 
-    events = Event.objects.filter(
-        match_id=match_id,
-        event_type=Event.Type.TURNOVER,
-    )
-
-    turnovers: Dict[UUID, int] = {}
-
-    for event in events:
-        turnovers[event.team_id] = turnovers.get(event.team_id, 0) + 1
+    columns = load_match_columns(match_id)
 
-    return turnovers
+    return columns.counts_by_team(
+        columns.type_mask([Event.Type.TURNOVER])
+    )
 
 
 # ============================================================
 # Application / Use-case layer (public API)
 # ============================================================
 
+@query_budget(2)
 def team_possession(match_id: UUID) -> Dict[UUID, float]:
     """
-    Application use-case: team possession (%).
+    Application use-case: team possession (%) by time on the ball.
     """
 
-    team_event_counts, total_events = load_team_ball_control_events(match_id)
+    possession_ms = load_team_possession(match_id)
 
     return calculate_team_possession(
-        team_event_counts=team_event_counts,
-        total_events=total_events,
+        team_possession_ms=possession_ms,
+        total_ms=sum(possession_ms.values()),
     )
 
 
+@query_budget(0)
 def event_tempo(match_id: UUID) -> float:
     """
     Application use-case: match tempo (events per minute).
@@ -143,6 +128,7 @@ def event_tempo(match_id: UUID) -> float:
     )
 
 
+@query_budget(0)
 def team_turnovers(match_id: UUID) -> Dict[UUID, int]:
     """
     Application use-case: turnovers per team.
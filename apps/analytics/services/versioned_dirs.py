@@ -0,0 +1,75 @@
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+
+# ============================================================
+# INFRASTRUCTURE (atomically published directories)
+# ============================================================
+#
+# A published directory `path` is a symlink to a sibling version
+# directory `<name>.<random>`. Builders write a fresh version directory
+# and swap the link with os.replace(), which is atomic: readers resolve
+# the link once and see either the old or the new build, never a mix or
+# a missing directory, and concurrent builders never collide.
+
+def new_version_dir(path: Path) -> Path:
+    """
+    Empty, uniquely named directory to build the next version of `path`.
+    """
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return Path(tempfile.mkdtemp(dir=path.parent, prefix=f"{path.name}."))
+
+
+def resolve_version_dir(path: Path) -> Path | None:
+    """
+    The version directory currently published at `path` (None if none).
+    """
+
+    try:
+        target = os.readlink(path)
+    except FileNotFoundError:
+        return None
+    except OSError:
+        # Plain directory written before versioned publishing
+        return path if path.is_dir() else None
+    return path.parent / target
+
+
+def publish_version_dir(path: Path, version_dir: Path) -> None:
+    """
+    Atomically point `path` at `version_dir` and drop the old version.
+    """
+
+    previous = resolve_version_dir(path)
+
+    if previous == path:
+        # Plain directory: move it aside, the link cannot replace it
+        aside = Path(tempfile.mkdtemp(dir=path.parent, prefix=f"{path.name}."))
+        os.replace(path, aside / "old")
+        previous = aside
+
+    link = version_dir.with_name(f"{version_dir.name}.link")
+    os.symlink(version_dir.name, link)
+    os.replace(link, path)
+
+    if previous is not None and previous != version_dir:
+        # Readers with open memory maps keep their (unlinked) files
+        shutil.rmtree(previous, ignore_errors=True)
+
+
+def remove_version_dir(path: Path) -> None:
+    version_dir = resolve_version_dir(path)
+
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        return
+    except (IsADirectoryError, PermissionError):
+        # Plain directory written before versioned publishing
+        pass
+
+    if version_dir is not None:
+        shutil.rmtree(version_dir, ignore_errors=True)
@@ -0,0 +1,453 @@
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, TextIO
+from uuid import UUID
+
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.jobs.queue import enqueue_on_commit
+
+from apps.analytics.services.derived_data import invalidate_match_derived_data
+from apps.analytics.services.event_dedup import EventDeduplicator
+
+
+# ============================================================
+# CONSTANTS
+# ============================================================
+
+# Characters read from the detector output per chunk
+READ_CHUNK_SIZE = 1 << 20
+
+# Events inserted per bulk_create
+INSERT_CHUNK_SIZE = 2000
+
+# Keys of the detection list when the output is a JSON object
+DETECTION_LIST_KEYS = {"detections", "events"}
+
+JSON_WHITESPACE = " \t\r\n"
+
+
+# ============================================================
+# DOMAIN: streaming JSON parse (pure)
+# ============================================================
+
+class JSONStreamReader:
+    """
+    Incremental JSON tokenizer over a text stream.
+
+    Values are decoded one at a time with JSONDecoder.raw_decode from a
+    buffer refilled chunk by chunk, so memory stays bounded by the chunk
+    size plus the largest single value, however long the file is.
+    """
+
+    def __init__(self, stream: TextIO, chunk_size: int = READ_CHUNK_SIZE):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """
+        Next non-whitespace character ("" at end of input).
+        """
+
+        while True:
+            while (
+                self.pos < len(self.buffer)
+                and self.buffer[self.pos] in JSON_WHITESPACE
+            ):
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(
+                f"Invalid detections JSON: expected {char!r}, "
+                f"found {found or 'end of file'!r}"
+            )
+        self.pos += 1
+
+    def value(self):
+        """
+        Decode the next complete JSON value.
+        """
+
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number may continue in the next chunk
+            if end == len(self.buffer) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def array_items(self) -> Iterator:
+        """
+        Yield the items of the JSON array starting at the cursor.
+        """
+
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+
+        while True:
+            yield self.value()
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self.expect("]")
+            return
+
+
+def iter_detections(
+    stream: TextIO,
+    chunk_size: int = READ_CHUNK_SIZE,
+) -> Iterator[Dict]:
+    """
+    Stream detections from a detector output file.
+
+    Accepts a top-level array, or an object carrying the array under
+    "detections" / "events" (other keys are skipped).
+    """
+
+    reader = JSONStreamReader(stream, chunk_size)
+
+    if reader.peek() == "[":
+        yield from reader.array_items()
+        return
+
+    reader.expect("{")
+    while reader.peek() != "}":
+        key = reader.value()
+        reader.expect(":")
+        if key in DETECTION_LIST_KEYS and reader.peek() == "[":
+            yield from reader.array_items()
+        else:
+            reader.value()
+        if reader.peek() == ",":
+            reader.pos += 1
+
+
+# ============================================================
+# DOMAIN: detection -> event mapping (pure)
+# ============================================================
+
+@dataclass
+class DetectionMapper:
+    """
+    Maps raw detections of one upload to Event field dicts.
+
+    Detection fields: type, timestamp_ms (or time / timestamp in video
+    seconds), team ("home" / "away" or a team id), optional player_id,
+    x / y / end_x / end_y (0-100), outcome, confidence, period.
+    """
+
+    offset_ms: int
+    period: int | None
+    team_ids: Dict[str, UUID]
+    player_ids: set
+    event_types: set
+    outcomes: set
+    skipped: Dict[str, int] = field(default_factory=dict)
+
+    def _skip(self, reason: str) -> None:
+        self.skipped[reason] = self.skipped.get(reason, 0) + 1
+
+    def map(self, detection: Dict) -> Dict | None:
+        if not isinstance(detection, dict):
+            self._skip("not_an_object")
+            return None
+
+        event_type = str(
+            detection.get("type") or detection.get("event_type") or ""
+        ).lower()
+        if event_type not in self.event_types:
+            self._skip("unknown_type")
+            return None
+
+        team_id = self.team_ids.get(
+            str(detection.get("team") or detection.get("team_id") or "")
+            .lower()
+        )
+        if team_id is None:
+            self._skip("unknown_team")
+            return None
+
+        video_ms = detection_time_ms(detection)
+        if video_ms is None:
+            self._skip("no_timestamp")
+            return None
+
+        player_id = parse_uuid(detection.get("player_id"))
+        outcome = detection.get("outcome")
+
+        return {
+            "team_id": team_id,
+            "player_id": player_id if player_id in self.player_ids else None,
+            "event_type": event_type,
+            "outcome": outcome if outcome in self.outcomes else "unknown",
+            "period": int(detection.get("period") or self.period or 1),
+            "timestamp_ms": self.offset_ms + video_ms,
+            "x": pitch_coordinate(detection.get("x")),
+            "y": pitch_coordinate(detection.get("y")),
+            "end_x": pitch_coordinate(detection.get("end_x")),
+            "end_y": pitch_coordinate(detection.get("end_y")),
+            "confidence": confidence_score(detection.get("confidence")),
+        }
+
+
+def detection_time_ms(detection: Dict) -> int | None:
+    """
+    Video-relative time of a detection in milliseconds.
+    """
+
+    try:
+        if detection.get("timestamp_ms") is not None:
+            value = float(detection["timestamp_ms"])
+        elif detection.get("time") is not None:
+            value = float(detection["time"]) * 1000
+        elif detection.get("timestamp") is not None:
+            value = float(detection["timestamp"]) * 1000
+        else:
+            return None
+    except (TypeError, ValueError):
+        return None
+
+    return max(0, round(value))
+
+
+def pitch_coordinate(value) -> float | None:
+    try:
+        return min(max(float(value), 0.0), 100.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def confidence_score(value) -> float | None:
+    try:
+        return round(min(max(float(value), 0.0), 1.0), 4)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_uuid(value) -> UUID | None:
+    try:
+        return UUID(str(value))
+    except ValueError:
+        return None
+
+
+# ============================================================
+# INFRASTRUCTURE (Django ORM, file system)
+# ============================================================
+
+def detections_path(upload) -> Path:
+    """
+    Detector output of an upload (relative paths live under MEDIA_ROOT).
+    """
+
+    return Path(settings.MEDIA_ROOT) / upload.json_output_path
+
+
+def build_detection_mapper(upload) -> DetectionMapper:
+    Event = apps.get_model("events", "Event")
+    MatchTeam = apps.get_model("competitions", "MatchTeam")
+    Appearance = apps.get_model("players", "Appearance")
+
+    team_ids: Dict[str, UUID] = {}
+    for team_id, side in (
+        MatchTeam.objects
+        .filter(match_id=upload.match_id)
+        .values_list("team_id", "side")
+    ):
+        team_ids[side] = team_id
+        team_ids[str(team_id)] = team_id
+
+    return DetectionMapper(
+        offset_ms=upload.video_start_offset_ms,
+        period=upload.period,
+        team_ids=team_ids,
+        player_ids=set(
+            Appearance.objects
+            .filter(match_id=upload.match_id)
+            .values_list("player_id", flat=True)
+        ),
+        event_types=set(Event.Type.values),
+        outcomes=set(Event.Outcome.values),
+    )
+
+
+def delete_detected_events(upload) -> int:
+    """
+    Drop the events of a previous ingestion in set-based statements.
+
+    QuerySet.delete() would load every row to send post_delete signals;
+    the caller invalidates the match's derived data instead.
+    """
+
+    Event = apps.get_model("events", "Event")
+    VideoClip = apps.get_model("analytics", "VideoClip")
+
+    events = Event.objects.filter(video_upload_id=upload.id)
+
+    VideoClip.objects.filter(event__in=events).update(event=None)
+    Event.objects.filter(related_event__in=events).update(related_event=None)
+    return events.bulk_delete()
+
+
+def insert_detected_events(upload, rows: List[Dict]) -> None:
+    Event = apps.get_model("events", "Event")
+
+    Event.objects.bulk_load(
+        (
+            Event(match_id=upload.match_id, video_upload_id=upload.id, **row)
+            for row in rows
+        ),
+        batch_size=500,
+    )
+
+
+# ============================================================
+# APPLICATION (public API)
+# ============================================================
+
+def ingest_video_detections(
+    upload_id: UUID,
+    chunk_size: int = INSERT_CHUNK_SIZE,
+) -> Dict:
+    """
+    Load the detector output of an upload as Event rows.
+
+    The file is parsed as a stream, repeated detections of one action
+    are merged (see event_dedup), and the survivors are inserted chunk
+    by chunk in one transaction, together with events_count and the
+    final status.
+    Events of a previous ingestion of the same upload are replaced.
+    """
+
+    from apps.analytics.jobs import (
+        GENERATE_VIDEO_CLIPS,
+        REBUILD_MATCH_DERIVED,
+    )
+
+    VideoUpload = apps.get_model("analytics", "VideoUpload")
+
+    upload = VideoUpload.objects.get(id=upload_id)
+    if upload.match_id is None:
+        raise ValueError(f"Video {upload_id} is not linked to a match")
+    if not upload.json_output_path:
+        raise ValueError(f"Video {upload_id} has no detections file")
+
+    VideoUpload.objects.filter(id=upload.id).update(
+        status=VideoUpload.Status.PROCESSING,
+        processing_error=None,
+    )
+
+    mapper = build_detection_mapper(upload)
+    dedup = EventDeduplicator()
+    inserted = 0
+
+    try:
+        with (
+            transaction.atomic(),
+            detections_path(upload).open(encoding="utf-8") as stream,
+        ):
+            delete_detected_events(upload)
+
+            rows: List[Dict] = []
+            for detection in iter_detections(stream):
+                row = mapper.map(detection)
+                if row is None:
+                    continue
+                rows.extend(dedup.feed(row))
+                if len(rows) >= chunk_size:
+                    insert_detected_events(upload, rows)
+                    inserted += len(rows)
+                    rows = []
+
+            rows.extend(dedup.flush())
+            insert_detected_events(upload, rows)
+            inserted += len(rows)
+
+            VideoUpload.objects.filter(id=upload.id).update(
+                status=VideoUpload.Status.COMPLETED,
+                events_count=inserted,
+                processed_at=timezone.now(),
+            )
+
+            # Bulk deletes / inserts bypass the Event signals: drop the
+            # stale caches now, the queued rebuild refills them
+            transaction.on_commit(
+                lambda: invalidate_match_derived_data(
+                    upload.match_id, upload.match.season_id
+                )
+            )
+            enqueue_on_commit(
+                REBUILD_MATCH_DERIVED, upload.match_id, priority=10
+            )
+            enqueue_on_commit(GENERATE_VIDEO_CLIPS, upload.match_id)
+    except Exception as exc:
+        VideoUpload.objects.filter(id=upload.id).update(
+            status=VideoUpload.Status.FAILED,
+            processing_error=str(exc),
+        )
+        raise
+
+    return {
+        "video_id": str(upload.id),
+        "match_id": str(upload.match_id),
+        "events_count": inserted,
+        "skipped": mapper.skipped,
+        "merged": dedup.merged,
+    }
+
+
+def ingest_match_video_detections(match_id: UUID) -> List[Dict]:
+    """
+    Ingest every upload of a match whose detections are not loaded yet.
+    """
+
+    VideoUpload = apps.get_model("analytics", "VideoUpload")
+
+    pending = (
+        VideoUpload.objects
+        .filter(
+            match_id=match_id,
+            json_output_path__isnull=False,
+            status__in=[
+                VideoUpload.Status.UPLOADED,
+                VideoUpload.Status.PROCESSING,
+            ],
+        )
+        .exclude(json_output_path="")
+        .values_list("id", flat=True)
+    )
+
+    return [ingest_video_detections(upload_id) for upload_id in pending]
@@ -0,0 +1,125 @@
+import threading
+from typing import Set
+from uuid import UUID
+
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.analytics.models import VideoClip
+from apps.competitions.models import Match
+from apps.events.models import Event
+from apps.jobs.queue import enqueue_job
+
+from apps.analytics.jobs import REBUILD_MATCH_DERIVED
+
+from apps.analytics.services.clip_index import touch_video_upload
+from apps.analytics.services.derived_data import invalidate_match_derived_data
+from apps.analytics.services.live_match import finish_live_match
+from apps.analytics.services.season_archive import invalidate_season_archive
+
+
+# Edits arriving in a burst collapse into one queued rebuild
+REBUILD_DELAY_SECONDS = 5
+
+
+# Matches whose events changed in the open transaction, per thread and
+# connection alias
+_changed_matches = threading.local()
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def invalidate_event_caches(sender, instance: Event, **kwargs):
+    """
+    Drop derived per-match caches when a single event changes and queue
+    their rebuild.
+
+    Changes are collected per transaction: on commit every touched match
+    is invalidated and queued once, with one season lookup for all.
+    Bulk imports bypass model signals and invalidate / enqueue the
+    rebuild explicitly.
+    """
+
+    using = instance._state.db or DEFAULT_DB_ALIAS
+    changed_matches(using).add(instance.match_id)
+
+    # No query here: callbacks after the first find the set drained. One
+    # per change survives a savepoint rollback of the others.
+    transaction.on_commit(
+        lambda: invalidate_changed_matches(using), using=using
+    )
+
+
+def changed_matches(using: str) -> Set[UUID]:
+    if not hasattr(_changed_matches, "by_alias"):
+        _changed_matches.by_alias = {}
+    return _changed_matches.by_alias.setdefault(using, set())
+
+
+def invalidate_changed_matches(using: str) -> None:
+    match_ids = set(changed_matches(using))
+    changed_matches(using).clear()
+    if not match_ids:
+        return
+
+    seasons = dict(
+        Match.objects
+        .filter(id__in=match_ids)
+        .values_list("id", "season_id")
+    )
+    for match_id in match_ids:
+        invalidate_match_derived_data(match_id, seasons.get(match_id))
+        if match_id in seasons:
+            # A deleted match has nothing left to rebuild
+            enqueue_job(
+                REBUILD_MATCH_DERIVED, match_id,
+                delay_seconds=REBUILD_DELAY_SECONDS,
+            )
+
+
+@receiver(post_delete, sender=Match)
+def invalidate_deleted_match(sender, instance: Match, **kwargs):
+    """
+    Drop the season archive of a deleted match: the changes of its
+    cascaded events can no longer look the season up.
+    """
+
+    season_id = instance.season_id
+    transaction.on_commit(lambda: invalidate_season_archive(season_id))
+
+
+@receiver(post_save, sender=VideoClip)
+@receiver(post_delete, sender=VideoClip)
+def invalidate_clip_index(sender, instance: VideoClip, **kwargs):
+    """
+    Bump the upload's updated_at, which versions the match clip index.
+    """
+
+    upload_id = instance.video_upload_id
+    transaction.on_commit(lambda: touch_video_upload(upload_id))
+
+
+@receiver(pre_save, sender=Match)
+def remember_match_status(sender, instance: Match, **kwargs):
+    instance._stored_status = (
+        None if instance._state.adding else
+        Match.objects
+        .filter(id=instance.id)
+        .values_list("status", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=Match)
+def finish_live_matches(sender, instance: Match, **kwargs):
+    """
+    A match leaving IN_PROGRESS for FINISHED goes to the batch pipeline.
+    """
+
+    if (
+        getattr(instance, "_stored_status", None) == Match.Status.IN_PROGRESS
+        and instance.status == Match.Status.FINISHED
+    ):
+        match_id = instance.id
+        transaction.on_commit(lambda: finish_live_match(match_id))
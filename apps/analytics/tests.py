@@ -1,3 +1,926 @@
-from django.test import TestCase
+import io
+import random
+import shutil
+import tempfile
+import threading
+import uuid
+from pathlib import Path
 
-# Create your tests here.
+import numpy as np
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+
+from apps.analytics.api.file_responses import (
+    RangeNotSatisfiable,
+    parse_byte_range,
+)
+from apps.analytics.api.pass_network import TeamPassNetworkAPIView
+from apps.analytics.coach_summary.service import get_coach_summary
+from apps.analytics.coach_summary.snapshot import load_match_goal_counts
+from apps.analytics.instrumentation import (
+    QueryBudgetExceeded,
+    fill_budget,
+    query_budget,
+)
+from apps.analytics.models import VideoClip, VideoUpload
+from apps.analytics.sandbox.synthetic_league import generate_league
+from apps.analytics.services.clip_generation import (
+    HIGHLIGHT_CLIP_TYPES,
+    ClipSpec,
+    FFmpegClipEncoder,
+    HighlightWindow,
+    StubClipEncoder,
+    clips_directory,
+    encode_clips,
+    generate_video_clips,
+    merge_windows,
+)
+from apps.analytics.services.event_columns import (
+    COLUMN_DTYPES,
+    MatchEventColumns,
+    invalidate_match_columns,
+    match_columns_path,
+    read_match_columns,
+    save_match_columns,
+)
+from apps.analytics.services.clip_index import (
+    MatchClipIndex,
+    get_match_clip_index,
+)
+from apps.analytics.services.event_dedup import EventDeduplicator
+from apps.analytics.services.expected_goals import load_player_xg
+from apps.analytics.services.expected_threat import load_player_xt
+from apps.analytics.services.heatmaps import build_heatmap
+from apps.analytics.services.model_artifacts import (
+    LEGACY_ARTIFACTS_DIR,
+    load_artifact,
+    save_artifact,
+)
+from apps.analytics.services.live_match import (
+    current_live_overview,
+    drop_live_state,
+)
+from apps.analytics.services.match_dashboard import get_match_overview
+from apps.analytics.services.momentum import (
+    MomentumAccumulator,
+    match_momentum,
+    rolling_sum_by_period,
+)
+from apps.analytics.services.pass_network import build_pass_network
+from apps.analytics.services.player_match_profile import (
+    PlayerMatchProfileService,
+)
+from apps.analytics.services.player_trends import build_player_trends
+from apps.analytics.services.possession_chains import (
+    ensure_possession_chains,
+    possession_summary,
+)
+from apps.analytics.services.season_archive import (
+    build_season_archive,
+    invalidate_season_archive,
+    open_season_archive,
+    season_archive_path,
+)
+from apps.analytics.services.video_detections import (
+    JSONStreamReader,
+    iter_detections,
+)
+from apps.competitions.models import Match, MatchTeam
+from apps.events.models import Event
+from apps.jobs.models import Job
+from apps.players.models import Appearance
+
+
+# ============================================================
+# Clip generation
+# ============================================================
+
+def window(start, end, clip_type="shot", confidence=None):
+    return HighlightWindow(
+        start=start,
+        end=end,
+        clip_type=clip_type,
+        timestamp_ms=int(start * 1000),
+        confidence=confidence,
+        event_ids=[f"{clip_type}@{start}"],
+    )
+
+
+class MergeWindowsTests(TestCase):
+    def test_overlapping_and_adjacent_windows_merge(self):
+        merged = merge_windows(
+            [window(10, 16), window(0, 6), window(5, 11), window(17.5, 20)],
+            gap=1.0,
+        )
+
+        self.assertEqual(
+            [(w.start, w.end) for w in merged], [(0, 16), (17.5, 20)]
+        )
+        self.assertEqual(len(merged[0].event_ids), 3)
+
+    def test_merged_window_takes_most_important_event(self):
+        merged = merge_windows([
+            window(0, 6, "tackle", confidence=0.9),
+            window(2, 8, "goal", confidence=0.6),
+            window(3, 9, "goal", confidence=0.8),
+        ])
+
+        self.assertEqual(len(merged), 1)
+        self.assertEqual(merged[0].clip_type, "goal")
+        self.assertEqual(merged[0].confidence, 0.8)
+        self.assertEqual(merged[0].timestamp_ms, 3000)
+
+    def test_merging_stops_at_max_length(self):
+        merged = merge_windows(
+            [window(i * 5, i * 5 + 6) for i in range(10)],
+            max_length=20,
+        )
+
+        self.assertGreater(len(merged), 1)
+        self.assertTrue(all(w.end - w.start <= 20 for w in merged))
+
+    def test_input_windows_are_not_modified(self):
+        windows = [window(0, 6), window(4, 10)]
+        merge_windows(windows)
+
+        self.assertEqual((windows[0].start, windows[0].end), (0, 6))
+
+
+class RecordingEncoder(FFmpegClipEncoder):
+    """
+    FFmpegClipEncoder that records its batches instead of running ffmpeg.
+    """
+
+    def __init__(self, batch_size):
+        super().__init__(ffmpeg_path="ffmpeg", batch_size=batch_size)
+        self.batches = []
+
+    def _encode_batch(self, source, clips):
+        self.batches.append([clip.start for clip in clips])
+
+
+class ClipEncodingTests(TestCase):
+    def setUp(self):
+        self.directory = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def specs(self, count):
+        return [
+            ClipSpec(
+                index=i,
+                start=float(i * 10),
+                end=float(i * 10 + 6),
+                thumbnail_at=float(i * 10 + 2),
+                output_path=str(self.directory / f"clip_{i}.mp4"),
+                thumbnail_path=str(self.directory / f"clip_{i}_thumb.jpg"),
+            )
+            for i in range(count)
+        ]
+
+    def test_clips_are_cut_in_sorted_batches(self):
+        specs = self.specs(95)
+        random.Random(3).shuffle(specs)
+
+        encoder = RecordingEncoder(batch_size=40)
+        encoder.encode("source.mp4", specs)
+
+        self.assertEqual([len(b) for b in encoder.batches], [40, 40, 15])
+        starts = [start for batch in encoder.batches for start in batch]
+        self.assertEqual(starts, sorted(starts))
+
+    def test_encoding_resumes_from_files_on_disk(self):
+        specs = self.specs(5)
+
+        first = encode_clips(StubClipEncoder(), "source.mp4", specs)
+        self.assertEqual((first["encoded"], first["resumed"]), (5, 0))
+
+        Path(specs[2].thumbnail_path).unlink()
+        Path(specs[4].output_path).write_text("")
+
+        second = encode_clips(StubClipEncoder(), "source.mp4", specs)
+        self.assertEqual((second["encoded"], second["resumed"]), (2, 3))
+        self.assertEqual(set(second["sizes"]), {spec.index for spec in specs})
+        self.assertGreaterEqual(second["encode_seconds"], 0)
+
+
+class GenerateVideoClipsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        league = generate_league(seed=42, teams=2, events_per_match=600)
+        cls.match_id = league["match_ids"][0]
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        self.enterContext(override_settings(MEDIA_ROOT=media_root))
+
+        self.upload = VideoUpload.objects.create(
+            match_id=self.match_id,
+            file_name="match.mp4",
+            file_path="videos/match.mp4",
+            file_size=1024,
+            period=1,
+            status=VideoUpload.Status.COMPLETED,
+        )
+
+    def generate(self):
+        results = generate_video_clips(
+            [self.upload.id], encoder=StubClipEncoder(), workers=1
+        )
+        self.assertEqual(len(results), 1)
+        return results[0]
+
+    def assert_clip_files_match_clips(self):
+        clips = list(VideoClip.objects.filter(video_upload=self.upload))
+        self.assertTrue(clips)
+
+        for clip in clips:
+            # StubClipEncoder writes "<source> <start>-<end>"
+            self.assertTrue(
+                Path(clip.file_path).read_text().endswith(
+                    f" {clip.start_time_seconds:.3f}"
+                    f"-{clip.end_time_seconds:.3f}"
+                )
+            )
+
+        files = list(clips_directory(self.upload.id).iterdir())
+        self.assertEqual(len(files), 2 * len(clips))
+
+    def test_result_reports_stage_timings(self):
+        result = self.generate()
+
+        self.assertGreater(result["clips"], 0)
+        self.assertEqual(result["encoded"], result["clips"])
+        for stage in ("plan_seconds", "encode_seconds", "store_seconds"):
+            self.assertGreaterEqual(result[stage], 0)
+        self.assertEqual(
+            VideoClip.objects.filter(video_upload=self.upload).count(),
+            result["clips"],
+        )
+
+    def test_second_run_resumes_every_clip(self):
+        first = self.generate()
+        second = self.generate()
+
+        self.assertEqual(second["encoded"], 0)
+        self.assertEqual(second["resumed"], first["clips"])
+        self.assert_clip_files_match_clips()
+
+    def test_replanned_windows_never_reuse_other_files(self):
+        self.generate()
+
+        # Re-ingested detections: a highlight at kick-off shifts every
+        # window's position, another one widens the first window
+        first = (
+            Event.objects
+            .filter(
+                match_id=self.match_id,
+                period=1,
+                event_type__in=list(HIGHLIGHT_CLIP_TYPES),
+            )
+            .order_by("timestamp_ms")
+            .first()
+        )
+        for timestamp_ms in (0, max(0, first.timestamp_ms - 1500)):
+            Event.objects.create(
+                match_id=self.match_id,
+                team_id=first.team_id,
+                event_type=Event.Type.GOAL,
+                period=1,
+                timestamp_ms=timestamp_ms,
+                x=90,
+                y=50,
+            )
+
+        result = self.generate()
+
+        self.assertGreater(result["encoded"], 0)
+        self.assertGreater(result["pruned"], 0)
+        self.assert_clip_files_match_clips()
+
+
+# ============================================================
+# Query budgets
+# ============================================================
+
+class QueryBudgetTests(TestCase):
+    """
+    Public services stay within their @query_budget on a seeded league.
+
+    The test runner makes overruns raise; each service is also called a
+    second time with warm caches and its queries counted directly, since
+    cold cache fills are charged to their own fill budget instead.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        league = generate_league(seed=7, teams=4, events_per_match=600)
+        cls.match_ids = league["match_ids"]
+        cls.match = Match.objects.get(id=cls.match_ids[0])
+        cls.team_id = (
+            MatchTeam.objects
+            .filter(match=cls.match, side=MatchTeam.Side.HOME)
+            .values_list("team_id", flat=True)
+            .get()
+        )
+        cls.appearance = (
+            Appearance.objects
+            .filter(match=cls.match, team_id=cls.team_id)
+            .select_related("player")
+            .first()
+        )
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        self.enterContext(override_settings(MEDIA_ROOT=media_root))
+
+        cache.clear()
+        self.addCleanup(drop_live_state, self.match.id)
+
+    def assert_within_budget(self, fn, *args, **kwargs):
+        fn(*args, **kwargs)
+
+        with CaptureQueriesContext(connection) as queries:
+            fn(*args, **kwargs)
+
+        self.assertLessEqual(
+            len(queries), fn.query_budget,
+            f"{fn.__qualname__} ran {len(queries)} queries "
+            f"(budget {fn.query_budget})",
+        )
+
+    def test_overrun_raises_under_test_runner(self):
+        @query_budget(1)
+        def two_queries():
+            Match.objects.count()
+            Event.objects.count()
+
+        with self.assertRaises(QueryBudgetExceeded):
+            two_queries()
+
+    def test_cache_fills_have_a_budget_of_their_own(self):
+        @query_budget(0)
+        def cold_read(fill_queries):
+            with fill_budget(1, "fill"):
+                for _ in range(fill_queries):
+                    Match.objects.count()
+
+        cold_read(1)
+        with self.assertRaisesMessage(QueryBudgetExceeded, "fill ran 2"):
+            cold_read(2)
+
+    def test_match_services(self):
+        match_id = self.match.id
+
+        self.assert_within_budget(get_match_overview, match_id)
+        self.assert_within_budget(match_momentum, match_id)
+        self.assert_within_budget(possession_summary, match_id)
+        self.assert_within_budget(build_heatmap, [match_id])
+        self.assert_within_budget(
+            build_pass_network, self.team_id, [match_id]
+        )
+        self.assert_within_budget(get_match_clip_index, match_id)
+        self.assert_within_budget(current_live_overview, match_id)
+
+    def test_player_services(self):
+        player = self.appearance.player
+
+        self.assert_within_budget(
+            PlayerMatchProfileService(self.match, player).build
+        )
+        self.assert_within_budget(load_player_xg, self.match.id, player.id)
+        self.assert_within_budget(load_player_xt, self.match.id, player.id)
+        self.assert_within_budget(build_player_trends, player.id)
+
+    def test_season_services(self):
+        self.assert_within_budget(build_season_archive, self.match.season_id)
+        self.assert_within_budget(
+            build_heatmap, self.match_ids, team_id=self.team_id
+        )
+
+    def test_coach_summary(self):
+        self.assert_within_budget(
+            get_coach_summary, self.team_id, self.match_ids
+        )
+
+    def test_goal_counts_use_one_grouped_query(self):
+        matches = Match.objects.filter(
+            id__in=self.match_ids, participants__team_id=self.team_id
+        )
+        self.assertGreater(matches.count(), 1)
+
+        self.assert_within_budget(load_match_goal_counts, self.team_id, matches)
+
+        results = load_match_goal_counts(self.team_id, matches)
+        self.assertEqual(len(results), matches.count())
+        for row in results:
+            goals = Event.objects.filter(
+                match_id=row["match_id"], event_type=Event.Type.GOAL
+            )
+            self.assertEqual(
+                row["goals_for"], goals.filter(team_id=self.team_id).count()
+            )
+            self.assertEqual(
+                row["goals_against"],
+                goals.exclude(team_id=self.team_id).count(),
+            )
+
+
+# ============================================================
+# Pass network API
+# ============================================================
+
+class TeamPassNetworkAPITests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        league = generate_league(seed=11, teams=2, events_per_match=300)
+        cls.match_id = league["match_ids"][0]
+        cls.team_id = (
+            MatchTeam.objects
+            .filter(match_id=cls.match_id)
+            .values_list("team_id", flat=True)
+            .first()
+        )
+
+    def setUp(self):
+        self.media_root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.media_root)
+        self.enterContext(override_settings(MEDIA_ROOT=str(self.media_root)))
+
+    def get(self, team_id, *match_ids):
+        request = APIRequestFactory().get(
+            f"/api/analytics/teams/{team_id}/pass-network/",
+            {"match_ids": [str(mid) for mid in match_ids]},
+        )
+        return TeamPassNetworkAPIView.as_view()(request, team_id=team_id)
+
+    def test_known_match_builds_network(self):
+        response = self.get(self.team_id, self.match_id)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data["players"])
+
+    def test_unknown_match_creates_no_files(self):
+        response = self.get(self.team_id, self.match_id, uuid.uuid4())
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(list(self.media_root.rglob("*")), [])
+
+    def test_team_must_have_played_the_matches(self):
+        response = self.get(uuid.uuid4(), self.match_id)
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(list(self.media_root.rglob("*")), [])
+
+
+# ============================================================
+# Clip index
+# ============================================================
+
+def clip_row(period, start_ms, end_ms, clip_type="shot"):
+    return {
+        "id": uuid.uuid4(),
+        "video_upload_id": uuid.uuid4(),
+        "event_id": None,
+        "clip_type": clip_type,
+        "period": period,
+        "start_ms": start_ms,
+        "end_ms": end_ms,
+    }
+
+
+class MatchClipIndexTests(TestCase):
+    def test_clips_are_found_by_period_and_time(self):
+        first, second = clip_row(1, 0, 6000), clip_row(2, 0, 6000)
+        index = MatchClipIndex(uuid.uuid4(), [first, second])
+
+        self.assertEqual(index.covering(1, 3000), [first])
+        self.assertEqual(index.covering(2, 3000), [second])
+        self.assertEqual(index.covering(1, 7000), [])
+
+    def test_full_match_clips_cover_every_period(self):
+        # Upload without a period: match-absolute times
+        clip = clip_row(None, 3000000, 3006000)
+        index = MatchClipIndex(uuid.uuid4(), [clip])
+        event_id = uuid.uuid4()
+
+        self.assertEqual(
+            index.clips_for_events([(event_id, 2, 3003000)]),
+            {event_id: [clip["id"]]},
+        )
+        self.assertEqual(index.find(period=2), [clip])
+        self.assertEqual(index.covering(1, 3003000), [clip])
+        self.assertEqual(index.covering(2, 3010000), [])
+
+    def test_period_and_full_match_clips_combine(self):
+        period_clip = clip_row(2, 3000000, 3004000)
+        match_clip = clip_row(None, 3002000, 3008000)
+        index = MatchClipIndex(uuid.uuid4(), [match_clip, period_clip])
+        event_id = uuid.uuid4()
+
+        self.assertEqual(
+            set(index.clips_for_events([(event_id, 2, 3003000)])[event_id]),
+            {period_clip["id"], match_clip["id"]},
+        )
+        self.assertEqual(
+            index.find(period=2, from_ms=3003000, to_ms=3003000),
+            [period_clip, match_clip],
+        )
+
+
+# ============================================================
+# Column store
+# ============================================================
+
+def synthetic_columns(match_id, rows):
+    return MatchEventColumns(
+        match_id=match_id,
+        teams=[uuid.uuid4()],
+        players=[],
+        **{
+            name: np.zeros(rows, dtype=dtype)
+            for name, dtype in COLUMN_DTYPES.items()
+        },
+    )
+
+
+class ColumnStoreTests(TestCase):
+    def setUp(self):
+        self.media_root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.media_root)
+        self.enterContext(override_settings(MEDIA_ROOT=str(self.media_root)))
+        self.match_id = uuid.uuid4()
+
+    def stored_entries(self):
+        return sorted(match_columns_path(self.match_id).parent.iterdir())
+
+    def test_rebuild_replaces_the_published_version(self):
+        save_match_columns(synthetic_columns(self.match_id, 3))
+        save_match_columns(synthetic_columns(self.match_id, 5))
+
+        self.assertEqual(len(read_match_columns(self.match_id)), 5)
+        # The link and the one version it points at
+        self.assertEqual(len(self.stored_entries()), 2)
+
+        invalidate_match_columns(self.match_id)
+        self.assertIsNone(read_match_columns(self.match_id))
+        self.assertEqual(self.stored_entries(), [])
+
+    def test_concurrent_builds_and_reads_stay_consistent(self):
+        errors = []
+
+        def build(rows):
+            try:
+                for _ in range(20):
+                    save_match_columns(synthetic_columns(self.match_id, rows))
+            except Exception as exc:
+                errors.append(exc)
+
+        def read():
+            for _ in range(200):
+                columns = read_match_columns(self.match_id)
+                if columns is not None and len(
+                    {len(getattr(columns, name)) for name in COLUMN_DTYPES}
+                ) != 1:
+                    errors.append(AssertionError("mixed column lengths"))
+
+        threads = [
+            threading.Thread(target=build, args=(rows,)) for rows in (3, 7)
+        ] + [threading.Thread(target=read) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertIn(len(read_match_columns(self.match_id)), (3, 7))
+
+
+class SeasonArchiveStoreTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        league = generate_league(seed=5, teams=2, events_per_match=200)
+        cls.season_id = Match.objects.get(id=league["match_ids"][0]).season_id
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        self.enterContext(override_settings(MEDIA_ROOT=media_root))
+
+    def test_rebuild_publishes_a_new_version(self):
+        build_season_archive(self.season_id)
+        first = open_season_archive(self.season_id)
+
+        build_season_archive(self.season_id)
+        second = open_season_archive(self.season_id)
+
+        self.assertIsNot(first, second)
+        self.assertEqual(len(second.events), len(first.events))
+        # First version stays readable through its open memory map
+        self.assertEqual(
+            int(first.events["match"].max()), len(first.matches) - 1
+        )
+        self.assertEqual(
+            len(list(season_archive_path(self.season_id).parent.iterdir())),
+            2,
+        )
+
+        invalidate_season_archive(self.season_id)
+        self.assertIsNone(open_season_archive(self.season_id))
+        self.assertEqual(
+            list(season_archive_path(self.season_id).parent.iterdir()), []
+        )
+
+
+# ============================================================
+# Momentum
+# ============================================================
+
+class MomentumTests(TestCase):
+    def test_stoppage_time_keeps_its_own_buckets(self):
+        team_id = uuid.uuid4()
+        accumulator = MomentumAccumulator(bucket_seconds=60)
+
+        # Match-clock timestamps: first-half stoppage runs past 45'
+        for period, minute in [(1, 0), (1, 46), (2, 45), (2, 46)]:
+            accumulator.feed(
+                team_id, "pass", period, minute * 60000, 50.0, None
+            )
+
+        events = accumulator.arrays()[team_id]["events"]
+        self.assertEqual(accumulator.period_starts, {1: 0, 2: 47})
+        self.assertEqual(events[46], 1)
+        self.assertEqual(events[47], 1)
+        self.assertEqual(events[48], 1)
+
+    def test_smoothing_restarts_every_period(self):
+        values = np.ones(6)
+
+        smoothed = rolling_sum_by_period(values, 3, {1: 0, 2: 4})
+
+        self.assertEqual(smoothed.tolist(), [1, 2, 3, 3, 1, 2])
+
+    def test_match_without_events_is_not_rebuilt_on_every_read(self):
+        league = generate_league(seed=3, teams=2, events_per_match=50)
+        match_id = league["match_ids"][0]
+        Event.objects.filter(match_id=match_id).delete()
+        cache.clear()
+
+        self.assertEqual(match_momentum(match_id), {})
+        with self.assertNumQueries(1):
+            self.assertEqual(match_momentum(match_id), {})
+
+
+# ============================================================
+# Possession chains
+# ============================================================
+
+class PossessionChainTests(TestCase):
+    def test_match_without_chains_is_segmented_once(self):
+        league = generate_league(seed=4, teams=2, events_per_match=50)
+        match_id = league["match_ids"][0]
+        Event.objects.filter(match_id=match_id).delete()
+        cache.clear()
+
+        ensure_possession_chains(match_id)
+        with self.assertNumQueries(0):
+            ensure_possession_chains(match_id)
+
+
+# ============================================================
+# Video detections
+# ============================================================
+
+def detection(timestamp_ms, x=50.0, y=50.0, confidence=0.5, **fields):
+    return {
+        "event_type": "shot",
+        "team_id": "home",
+        "period": 1,
+        "timestamp_ms": timestamp_ms,
+        "x": x,
+        "y": y,
+        "confidence": confidence,
+        **fields,
+    }
+
+
+def deduplicate(dedup, rows):
+    survivors = []
+    for row in rows:
+        survivors += dedup.feed(row)
+    return survivors + list(dedup.flush())
+
+
+class EventDeduplicatorTests(TestCase):
+    def test_detections_within_window_and_radius_merge(self):
+        dedup = EventDeduplicator(window_ms=800, max_distance=5.0)
+
+        survivors = deduplicate(dedup, [
+            detection(1000, confidence=0.5),
+            detection(1500, x=53.0, confidence=0.8),
+        ])
+
+        self.assertEqual(len(survivors), 1)
+        self.assertEqual(survivors[0]["x"], 53.0)
+        self.assertEqual(survivors[0]["confidence"], 0.9)
+        self.assertEqual(dedup.merged, 1)
+
+    def test_far_apart_detections_stay_separate(self):
+        dedup = EventDeduplicator(window_ms=800, max_distance=5.0)
+
+        survivors = deduplicate(dedup, [
+            detection(1000),
+            detection(1200, x=70.0),
+            detection(2000),
+        ])
+
+        self.assertEqual(len(survivors), 3)
+        self.assertEqual(dedup.merged, 0)
+
+    def test_different_keys_never_merge(self):
+        dedup = EventDeduplicator(window_ms=800, max_distance=5.0)
+
+        survivors = deduplicate(dedup, [
+            detection(1000),
+            detection(1000, team_id="away"),
+            detection(1000, event_type="pass"),
+            detection(1000, period=2),
+        ])
+
+        self.assertEqual(len(survivors), 4)
+
+    def test_watermark_flushes_closed_windows(self):
+        dedup = EventDeduplicator(
+            window_ms=800, max_distance=5.0, max_lag_ms=1000
+        )
+
+        # Out of order within the lag: still merged
+        self.assertEqual(list(dedup.feed(detection(1500))), [])
+        self.assertEqual(list(dedup.feed(detection(1000))), [])
+
+        # The watermark passes both rows, then closes their cluster
+        self.assertEqual(list(dedup.feed(detection(3000))), [])
+        survivors = list(dedup.feed(detection(5000)))
+
+        self.assertEqual(len(survivors), 1)
+        self.assertEqual(survivors[0]["timestamp_ms"], 1000)
+        self.assertEqual(len(list(dedup.flush())), 2)
+
+
+class JSONStreamReaderTests(TestCase):
+    DOCUMENT = (
+        '{"meta": {"fps": 25.0, "note": "a \\"quoted\\" value"},'
+        ' "detections": [{"t": 12345, "ok": true, "label": "shot"},'
+        ' {"t": -6.5e2, "ok": false, "label": null}]}'
+    )
+
+    def test_tokens_split_across_chunks(self):
+        for chunk_size in (1, 2, 3, 7, 4096):
+            with self.subTest(chunk_size=chunk_size):
+                detections = list(iter_detections(
+                    io.StringIO(self.DOCUMENT), chunk_size=chunk_size
+                ))
+
+                self.assertEqual(detections, [
+                    {"t": 12345, "ok": True, "label": "shot"},
+                    {"t": -650.0, "ok": False, "label": None},
+                ])
+
+    def test_top_level_array(self):
+        reader = JSONStreamReader(io.StringIO(" [ 1, 23 ,456 ] "), 2)
+
+        self.assertEqual(list(reader.array_items()), [1, 23, 456])
+
+    def test_truncated_input_raises(self):
+        reader = JSONStreamReader(io.StringIO('[{"t": 1}, {"t"'), 3)
+
+        with self.assertRaises(ValueError):
+            list(reader.array_items())
+
+
+# ============================================================
+# Media byte ranges
+# ============================================================
+
+class ParseByteRangeTests(TestCase):
+    def test_missing_or_unsupported_header_serves_whole_file(self):
+        self.assertIsNone(parse_byte_range(None, 100))
+        self.assertIsNone(parse_byte_range("bytes=-", 100))
+        self.assertIsNone(parse_byte_range("bytes=0-1,5-6", 100))
+        self.assertIsNone(parse_byte_range("items=0-1", 100))
+
+    def test_first_after_last_is_ignored(self):
+        self.assertIsNone(parse_byte_range("bytes=10-5", 100))
+        self.assertIsNone(parse_byte_range("bytes=500-5", 100))
+
+    def test_closed_and_open_ended_ranges(self):
+        self.assertEqual(parse_byte_range("bytes=0-9", 100), (0, 9))
+        self.assertEqual(parse_byte_range("bytes=90-", 100), (90, 99))
+        self.assertEqual(parse_byte_range("bytes=90-500", 100), (90, 99))
+
+    def test_suffix_ranges(self):
+        self.assertEqual(parse_byte_range("bytes=-10", 100), (90, 99))
+        self.assertEqual(parse_byte_range("bytes=-500", 100), (0, 99))
+
+    def test_unsatisfiable_ranges(self):
+        for header in ("bytes=100-", "bytes=100-200", "bytes=-0"):
+            with self.subTest(header=header):
+                with self.assertRaises(RangeNotSatisfiable):
+                    parse_byte_range(header, 100)
+
+    def test_empty_file_has_no_satisfiable_range(self):
+        for header in ("bytes=0-", "bytes=0-0", "bytes=-10"):
+            with self.subTest(header=header):
+                with self.assertRaises(RangeNotSatisfiable):
+                    parse_byte_range(header, 0)
+
+        self.assertIsNone(parse_byte_range(None, 0))
+
+
+# ============================================================
+# Event change signals
+# ============================================================
+
+class EventChangeSignalTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        league = generate_league(seed=6, teams=2, events_per_match=20)
+        cls.match_ids = league["match_ids"][:2]
+
+    def test_changes_are_coalesced_per_transaction(self):
+        events = [
+            event
+            for match_id in self.match_ids
+            for event in Event.objects.filter(match_id=match_id)[:3]
+        ]
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            with CaptureQueriesContext(connection) as saves:
+                for event in events:
+                    event.outcome = "success"
+                    event.save()
+
+        self.assertEqual(len(saves), len(events))
+
+        with CaptureQueriesContext(connection) as commit:
+            for callback in callbacks:
+                callback()
+
+        season_lookups = [
+            q for q in commit.captured_queries
+            if q["sql"].startswith("SELECT") and '"matches"' in q["sql"]
+        ]
+        self.assertEqual(len(season_lookups), 1)
+        self.assertEqual(
+            set(Job.objects.values_list("match_id", flat=True)),
+            set(self.match_ids),
+        )
+
+
+# ============================================================
+# Fitted models
+# ============================================================
+
+class ModelArtifactTests(TestCase):
+    def setUp(self):
+        self.media_root = Path(tempfile.mkdtemp())
+        self.artifacts_root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.media_root)
+        self.addCleanup(shutil.rmtree, self.artifacts_root)
+        self.enterContext(override_settings(
+            MEDIA_ROOT=str(self.media_root),
+            MODEL_ARTIFACTS_ROOT=str(self.artifacts_root),
+        ))
+
+    def test_artifacts_are_kept_out_of_media_root(self):
+        save_artifact("test_model", {"w": np.ones(3)}, {})
+
+        self.assertTrue((self.artifacts_root / "test_model" / "v1").is_dir())
+        self.assertEqual(list(self.media_root.iterdir()), [])
+
+    def test_legacy_artifacts_are_moved_out_of_media_root(self):
+        legacy = self.media_root / LEGACY_ARTIFACTS_DIR
+        with override_settings(MODEL_ARTIFACTS_ROOT=str(legacy)):
+            save_artifact("legacy_model", {"w": np.ones(3)}, {})
+
+        artifact = load_artifact("legacy_model")
+
+        self.assertEqual(artifact.version, 1)
+        self.assertFalse((legacy / "legacy_model").exists())
+        self.assertTrue((self.artifacts_root / "legacy_model").is_dir())
+
+    def test_revalue_queues_rebuild_of_affected_matches(self):
+        league = generate_league(seed=8, teams=2, events_per_match=300)
+
+        call_command("fit_expected_threat", "--revalue", stdout=io.StringIO())
+
+        self.assertEqual(
+            set(Job.objects.values_list("match_id", flat=True)),
+            set(league["match_ids"]),
+        )
@@ -3,6 +3,11 @@ from django.urls import path
 from apps.analytics.api.match_list import MatchListAPIView
 from apps.analytics.api.match_overview import MatchOverviewAPIView
 from apps.analytics.api.player_profile import PlayerMatchProfileAPIView
+from apps.analytics.api.player_trends import PlayerTrendsAPIView
+from apps.analytics.api.live_events import LiveEventsAPIView
+from apps.analytics.api.live_stream import live_match_stream
+from apps.analytics.api.heatmaps import HeatmapAPIView, MatchHeatmapAPIView
+from apps.analytics.api.pass_network import TeamPassNetworkAPIView
 from apps.analytics.api.video_upload import (
     VideoUploadAPIView,
     VideoProcessAPIView,
@@ -17,6 +22,7 @@ from apps.analytics.api.video_clips import (
     VideoClipThumbnailAPIView,
     VideoClipsByTypeAPIView,
 )
+from apps.analytics.api.instrumentation import InstrumentationStatsAPIView
 from apps.analytics.views import CoachSummaryView
 
 urlpatterns = [
@@ -35,6 +41,36 @@ urlpatterns = [
         PlayerMatchProfileAPIView.as_view(),
         name="player-match-profile",
     ),
+    path(
+        "players/<uuid:player_id>/trends/",
+        PlayerTrendsAPIView.as_view(),
+        name="player-trends",
+    ),
+    path(
+        "matches/<uuid:match_id>/live/events/",
+        LiveEventsAPIView.as_view(),
+        name="live-events",
+    ),
+    path(
+        "matches/<uuid:match_id>/live/stream/",
+        live_match_stream,
+        name="live-stream",
+    ),
+    path(
+        "matches/<uuid:match_id>/heatmap/",
+        MatchHeatmapAPIView.as_view(),
+        name="match-heatmap",
+    ),
+    path(
+        "heatmaps/",
+        HeatmapAPIView.as_view(),
+        name="heatmaps",
+    ),
+    path(
+        "teams/<uuid:team_id>/pass-network/",
+        TeamPassNetworkAPIView.as_view(),
+        name="team-pass-network",
+    ),
     path(
         "coach-summary/",
         CoachSummaryView.as_view(),
@@ -82,6 +118,11 @@ urlpatterns = [
         VideoClipsListAPIView.as_view(),
         name="video-clips-list",
     ),
+    path(
+        "videos/<uuid:video_id>/clips/by-type/",
+        VideoClipsByTypeAPIView.as_view(),
+        name="video-clips-by-type",
+    ),
     path(
         "clips/<uuid:clip_id>/video/",
         VideoClipVideoAPIView.as_view(),
@@ -92,4 +133,9 @@ urlpatterns = [
         VideoClipThumbnailAPIView.as_view(),
         name="clip-thumbnail",
     ),
+    path(
+        "instrumentation/stats/",
+        InstrumentationStatsAPIView.as_view(),
+        name="instrumentation-stats",
+    ),
 ]
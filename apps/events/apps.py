@@ -1,4 +1,5 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
 
 
 class EventsConfig(AppConfig):
@@ -6,4 +7,9 @@ class EventsConfig(AppConfig):
     name = "apps.events"
     label = "events"
 
+    def ready(self):
+        from apps.events.sqlite_tuning import apply_sqlite_pragmas
 
+        connection_created.connect(
+            apply_sqlite_pragmas, dispatch_uid="events.sqlite_pragmas"
+        )
@@ -0,0 +1,93 @@
+from itertools import islice
+from typing import Iterable, Iterator, List
+
+from django.db import connections
+
+
+def supports_copy(using: str) -> bool:
+    """
+    COPY FROM STDIN needs the PostgreSQL backend on psycopg 3.
+    """
+
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return False
+
+    from django.db.backends.postgresql.psycopg_any import is_psycopg3
+
+    return is_psycopg3
+
+
+def copy_rows(model, objs: Iterable, using: str) -> Iterator[tuple]:
+    """
+    Column values of unsaved instances, prepared like an INSERT would.
+    """
+
+    connection = connections[using]
+    fields = model._meta.concrete_fields
+
+    for obj in objs:
+        yield tuple(
+            field.get_db_prep_save(field.pre_save(obj, True), connection)
+            for field in fields
+        )
+
+
+def copy_insert(model, objs: Iterable, using: str) -> int:
+    """
+    Stream instances into the model's table with COPY FROM STDIN.
+
+    Like bulk_create: no save() and no signals. Primary keys must be
+    set on the instances (UUID defaults are). Returns the row count.
+    """
+
+    connection = connections[using]
+    quote = connection.ops.quote_name
+
+    columns = ", ".join(
+        quote(field.column) for field in model._meta.concrete_fields
+    )
+    statement = (
+        f"COPY {quote(model._meta.db_table)} ({columns}) FROM STDIN"
+    )
+
+    count = 0
+    with connection.cursor() as cursor:
+        # The psycopg cursor under Django's wrapper
+        with cursor.cursor.copy(statement) as copy:
+            for row in copy_rows(model, objs, using):
+                copy.write_row(row)
+                count += 1
+
+    return count
+
+
+def delete_rows(queryset, using: str) -> int:
+    """
+    Delete the rows of a queryset in one DELETE ... WHERE pk IN (...).
+
+    Unlike QuerySet.delete(), rows are not loaded: no delete() and no
+    signals, and nothing cascades. Returns the row count.
+    """
+
+    model = queryset.model
+    connection = connections[using]
+    quote = connection.ops.quote_name
+
+    ids_sql, params = (
+        queryset.values("pk").query.get_compiler(using).as_sql()
+    )
+    statement = (
+        f"DELETE FROM {quote(model._meta.db_table)} "
+        f"WHERE {quote(model._meta.pk.column)} IN ({ids_sql})"
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(statement, params)
+        return cursor.rowcount
+
+
+def batched(objs: Iterable, size: int) -> Iterator[List]:
+    iterator = iter(objs)
+    while batch := list(islice(iterator, size)):
+        yield batch
@@ -0,0 +1,78 @@
+from typing import Any, Dict
+
+from django.db import models
+
+
+# Lookups on whole values, which map one-to-one onto codes. Text
+# lookups (contains, startswith, ...) and ordering comparisons would run
+# against the integer column and silently match the wrong rows.
+SUPPORTED_LOOKUPS = {"exact", "in", "isnull"}
+
+
+class CodedChoiceField(models.PositiveSmallIntegerField):
+    """
+    Stores TextChoices values as small-integer codes.
+
+    Python code keeps working with the string values ("pass", "success"),
+    including filters like `event_type__in=[...]`; only the column holds
+    the compact code. Other lookups than exact / in / isnull are
+    rejected with a FieldError.
+    """
+
+    def __init__(self, *args, codes: Dict[str, int] | None = None, **kwargs):
+        self.codes: Dict[str, int] = {
+            str(value): code for value, code in (codes or {}).items()
+        }
+        self.values_by_code: Dict[int, str] = {
+            code: value for value, code in self.codes.items()
+        }
+        super().__init__(*args, **kwargs)
+
+    @property
+    def validators(self):
+        # Range validators of IntegerField would compare against the
+        # string value; choices validation already covers the domain.
+        return [*self.default_validators, *self._validators]
+
+    def get_lookup(self, lookup_name):
+        if lookup_name not in SUPPORTED_LOOKUPS:
+            return None
+        return super().get_lookup(lookup_name)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs["codes"] = self.codes
+        return name, path, args, kwargs
+
+    def encode(self, value: Any) -> int | None:
+        """
+        Map a choice value (or an already encoded int) to its code.
+        """
+
+        if value is None or isinstance(value, int):
+            return value
+
+        try:
+            return self.codes[str(value)]
+        except KeyError:
+            raise ValueError(
+                f"Unknown value {value!r} for '{self.name}'"
+            ) from None
+
+    def decode(self, value: Any) -> Any:
+        if value is None or isinstance(value, str):
+            return value
+        return self.values_by_code.get(value, value)
+
+    def from_db_value(self, value, expression, connection):
+        return self.decode(value)
+
+    def to_python(self, value):
+        return self.decode(value)
+
+    def get_prep_value(self, value):
+        value = models.Field.get_prep_value(self, value)
+        return self.encode(value)
+
+    def value_to_string(self, obj):
+        return self.value_from_object(obj)
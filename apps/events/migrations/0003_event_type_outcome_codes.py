@@ -0,0 +1,161 @@
+# Converts event_type / outcome from strings to small-integer codes.
+
+import apps.events.fields
+from django.db import migrations, models
+
+
+# Frozen copy of Event.TYPE_CODES / Event.OUTCOME_CODES at this migration.
+TYPE_CODES = {
+    "pass": 1,
+    "shot": 2,
+    "turnover": 3,
+    "recovery": 4,
+    "goal": 5,
+    "assist": 6,
+    "interception": 7,
+    "tackle": 8,
+    "clearance": 9,
+    "pressure": 10,
+    "duel": 11,
+    "foul": 12,
+    "yellow_card": 13,
+    "red_card": 14,
+    "corner": 15,
+    "free_kick": 16,
+    "penalty": 17,
+}
+
+OUTCOME_CODES = {
+    "unknown": 0,
+    "success": 1,
+    "fail": 2,
+}
+
+TYPE_CHOICES = [
+    ("pass", "Pass"),
+    ("shot", "Shot"),
+    ("turnover", "Turnover"),
+    ("recovery", "Recovery"),
+    ("goal", "Goal"),
+    ("assist", "Assist"),
+    ("interception", "Interception"),
+    ("tackle", "Tackle"),
+    ("clearance", "Clearance"),
+    ("pressure", "Pressure"),
+    ("duel", "Duel"),
+    ("foul", "Foul"),
+    ("yellow_card", "Yellow card"),
+    ("red_card", "Red card"),
+    ("corner", "Corner"),
+    ("free_kick", "Free kick"),
+    ("penalty", "Penalty"),
+]
+
+
+def encode_events(apps, schema_editor):
+    Event = apps.get_model("events", "Event")
+
+    unknown_types = set(
+        Event.objects
+        .exclude(event_type__in=TYPE_CODES.keys())
+        .values_list("event_type", flat=True)
+        .distinct()
+    )
+    if unknown_types:
+        raise ValueError(
+            f"Cannot encode unknown event types: {sorted(unknown_types)}"
+        )
+
+    # One UPDATE per distinct value instead of touching rows in Python
+    for value, code in TYPE_CODES.items():
+        Event.objects.filter(event_type=value).update(event_type_code=code)
+
+    for value, code in OUTCOME_CODES.items():
+        Event.objects.filter(outcome=value).update(outcome_code=code)
+
+
+def decode_events(apps, schema_editor):
+    Event = apps.get_model("events", "Event")
+
+    for value, code in TYPE_CODES.items():
+        Event.objects.filter(event_type_code=code).update(event_type=value)
+
+    for value, code in OUTCOME_CODES.items():
+        Event.objects.filter(outcome_code=code).update(outcome=value)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0002_event_outcome_event_related_event_and_more"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="event",
+            name="events_match_i_a7f0e3_idx",
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="event_type_code",
+            field=models.PositiveSmallIntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="outcome_code",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.RunPython(encode_events, decode_events),
+        # Gives the string column a default so the migration can be
+        # reversed (the column is re-added before rows are decoded).
+        migrations.AlterField(
+            model_name="event",
+            name="event_type",
+            field=models.CharField(default="", max_length=20),
+        ),
+        migrations.RemoveField(
+            model_name="event",
+            name="event_type",
+        ),
+        migrations.RemoveField(
+            model_name="event",
+            name="outcome",
+        ),
+        migrations.RenameField(
+            model_name="event",
+            old_name="event_type_code",
+            new_name="event_type",
+        ),
+        migrations.RenameField(
+            model_name="event",
+            old_name="outcome_code",
+            new_name="outcome",
+        ),
+        migrations.AlterField(
+            model_name="event",
+            name="event_type",
+            field=apps.events.fields.CodedChoiceField(
+                choices=TYPE_CHOICES,
+                codes=TYPE_CODES,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="event",
+            name="outcome",
+            field=apps.events.fields.CodedChoiceField(
+                choices=[
+                    ("success", "Success"),
+                    ("fail", "Fail"),
+                    ("unknown", "Unknown"),
+                ],
+                codes=OUTCOME_CODES,
+                default="unknown",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["match", "event_type"], name="events_match_i_a7f0e3_idx"
+            ),
+        ),
+    ]
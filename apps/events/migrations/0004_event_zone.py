@@ -0,0 +1,58 @@
+# Generated by Django 6.0.1 on 2026-10-19 08:37
+
+from django.db import migrations, models
+
+
+# Frozen copy of the apps.events.zones grid at this migration.
+ZONE_COLUMNS = 6
+ZONE_CHANNELS = 3
+PITCH_MAX = 100.0
+
+
+def fill_zones(apps, schema_editor):
+    Event = apps.get_model("events", "Event")
+
+    # One UPDATE per zone; edge columns / channels are open-ended so
+    # out-of-range coordinates are clamped like zone_for() does.
+    for column in range(ZONE_COLUMNS):
+        for channel in range(ZONE_CHANNELS):
+            qs = Event.objects.filter(x__isnull=False, y__isnull=False)
+
+            if column > 0:
+                qs = qs.filter(x__gte=column * PITCH_MAX / ZONE_COLUMNS)
+            if column < ZONE_COLUMNS - 1:
+                qs = qs.filter(x__lt=(column + 1) * PITCH_MAX / ZONE_COLUMNS)
+            if channel > 0:
+                qs = qs.filter(y__gte=channel * PITCH_MAX / ZONE_CHANNELS)
+            if channel < ZONE_CHANNELS - 1:
+                qs = qs.filter(y__lt=(channel + 1) * PITCH_MAX / ZONE_CHANNELS)
+
+            qs.update(zone=column * ZONE_CHANNELS + channel)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0003_event_type_outcome_codes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="zone",
+            field=models.PositiveSmallIntegerField(
+                blank=True,
+                editable=False,
+                help_text="Pitch zone id (6 columns x 3 channels)",
+                null=True,
+            ),
+        ),
+        migrations.RunPython(fill_zones, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["match", "team", "zone", "event_type"],
+                name="events_match_i_160dcd_idx",
+            ),
+        ),
+    ]
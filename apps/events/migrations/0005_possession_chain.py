@@ -0,0 +1,111 @@
+# Generated by Django 6.0.1 on 2026-10-19 08:39
+
+import apps.events.fields
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("competitions", "0003_matchteam_team_alter_matchteam_unique_together"),
+        ("events", "0004_event_zone"),
+        ("teams", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PossessionChain",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "sequence",
+                    models.PositiveIntegerField(
+                        help_text="Chain number within the match (0-based)"
+                    ),
+                ),
+                ("period", models.PositiveSmallIntegerField()),
+                ("start_ms", models.PositiveIntegerField()),
+                (
+                    "end_ms",
+                    models.PositiveIntegerField(
+                        help_text="Start of the next chain in the period, else last event"
+                    ),
+                ),
+                ("events_count", models.PositiveSmallIntegerField()),
+                ("passes_count", models.PositiveSmallIntegerField()),
+                ("start_x", models.FloatField(blank=True, null=True)),
+                ("end_x", models.FloatField(blank=True, null=True)),
+                (
+                    "distance",
+                    models.FloatField(
+                        default=0.0,
+                        help_text="Ball path length between consecutive team events",
+                    ),
+                ),
+                (
+                    "zones_mask",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Bit i set when pitch zone i was reached"
+                    ),
+                ),
+                (
+                    "outcome",
+                    apps.events.fields.CodedChoiceField(
+                        choices=[
+                            ("goal", "Goal"),
+                            ("shot", "Shot"),
+                            ("turnover", "Turnover"),
+                            ("period_end", "Period end"),
+                            ("ongoing", "Ongoing"),
+                        ],
+                        codes={
+                            "goal": 1,
+                            "ongoing": 0,
+                            "period_end": 4,
+                            "shot": 2,
+                            "turnover": 3,
+                        },
+                    ),
+                ),
+                (
+                    "match",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="possession_chains",
+                        to="competitions.match",
+                    ),
+                ),
+                (
+                    "team",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="possession_chains",
+                        to="teams.team",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "possession_chains",
+                "ordering": ["match", "sequence"],
+                "indexes": [
+                    models.Index(
+                        fields=["match", "team", "outcome"],
+                        name="possession__match_i_fd0c98_idx",
+                    ),
+                    models.Index(
+                        fields=["team", "match"], name="possession__team_id_152339_idx"
+                    ),
+                ],
+                "unique_together": {("match", "sequence")},
+            },
+        ),
+    ]
@@ -0,0 +1,75 @@
+# Generated by Django 6.0.1 on 2026-10-19 08:40
+
+import apps.events.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0005_possession_chain"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="end_x",
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="end_y",
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="xt_delta",
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AlterField(
+            model_name="event",
+            name="event_type",
+            field=apps.events.fields.CodedChoiceField(
+                choices=[
+                    ("pass", "Pass"),
+                    ("shot", "Shot"),
+                    ("turnover", "Turnover"),
+                    ("recovery", "Recovery"),
+                    ("goal", "Goal"),
+                    ("assist", "Assist"),
+                    ("interception", "Interception"),
+                    ("tackle", "Tackle"),
+                    ("clearance", "Clearance"),
+                    ("pressure", "Pressure"),
+                    ("duel", "Duel"),
+                    ("foul", "Foul"),
+                    ("yellow_card", "Yellow card"),
+                    ("red_card", "Red card"),
+                    ("corner", "Corner"),
+                    ("free_kick", "Free kick"),
+                    ("penalty", "Penalty"),
+                    ("carry", "Carry"),
+                ],
+                codes={
+                    "assist": 6,
+                    "carry": 18,
+                    "clearance": 9,
+                    "corner": 15,
+                    "duel": 11,
+                    "foul": 12,
+                    "free_kick": 16,
+                    "goal": 5,
+                    "interception": 7,
+                    "pass": 1,
+                    "penalty": 17,
+                    "pressure": 10,
+                    "recovery": 4,
+                    "red_card": 14,
+                    "shot": 2,
+                    "tackle": 8,
+                    "turnover": 3,
+                    "yellow_card": 13,
+                },
+            ),
+        ),
+    ]
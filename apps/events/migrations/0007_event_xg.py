@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-19 09:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0006_event_end_location_xt"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="xg",
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+    ]
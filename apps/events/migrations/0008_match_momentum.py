@@ -0,0 +1,56 @@
+# Generated by Django 6.0.1 on 2026-10-19 09:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("competitions", "0003_matchteam_team_alter_matchteam_unique_together"),
+        ("events", "0007_event_xg"),
+        ("teams", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MatchMomentum",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("bucket_seconds", models.PositiveSmallIntegerField(default=60)),
+                ("buckets", models.PositiveSmallIntegerField(default=0)),
+                ("events", models.BinaryField()),
+                ("final_third_entries", models.BinaryField()),
+                ("xt", models.BinaryField()),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "match",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="momentum",
+                        to="competitions.match",
+                    ),
+                ),
+                (
+                    "team",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="momentum",
+                        to="teams.team",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "match_momentum",
+                "unique_together": {("match", "team")},
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0001_video_upload"),
+        ("events", "0008_match_momentum"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="video_upload",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="events",
+                to="analytics.videoupload",
+            ),
+        ),
+    ]
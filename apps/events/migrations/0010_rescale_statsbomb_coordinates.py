@@ -0,0 +1,119 @@
+"""
+Rescale events imported from StatsBomb before coordinates were
+normalized to the 0-100 pitch.
+
+Derived rows of the rescaled matches are dropped: possession chains and
+momentum are rebuilt on the next read, and the matches are left without
+player metrics. Run `manage.py rebuild_derived_data` after migrating:
+its default selection (matches without player metrics) rebuilds them
+all, including their columnar files and xT / xG values.
+"""
+
+from uuid import UUID
+
+from django.db import migrations
+from django.db.models import F
+
+
+# Frozen copies at this migration: the StatsBomb pitch and the
+# apps.events.zones grid.
+SB_PITCH_LENGTH = 120
+SB_PITCH_WIDTH = 80
+PITCH_MAX = 100.0
+ZONE_COLUMNS = 6
+ZONE_CHANNELS = 3
+
+
+def legacy_statsbomb_matches(Event):
+    """
+    Matches imported from StatsBomb before coordinates were normalized:
+    x beyond the 0-100 pitch but within 120x80, and only StatsBomb
+    (uuid5) players.
+    """
+
+    matches = []
+    candidates = (
+        Event.objects
+        .filter(x__gt=PITCH_MAX)
+        .values_list("match_id", flat=True)
+        .distinct()
+    )
+
+    for match_id in candidates:
+        events = Event.objects.filter(match_id=match_id)
+        if events.filter(x__gt=SB_PITCH_LENGTH).exists():
+            continue
+        if events.filter(y__gt=SB_PITCH_WIDTH).exists():
+            continue
+
+        player_ids = set(
+            events
+            .filter(player_id__isnull=False)
+            .values_list("player_id", flat=True)
+        )
+        if all(UUID(str(pid)).version == 5 for pid in player_ids):
+            matches.append(match_id)
+
+    return matches
+
+
+def fill_zones(Event, match_ids):
+    # Same per-zone UPDATEs as 0004_event_zone, limited to match_ids
+    for column in range(ZONE_COLUMNS):
+        for channel in range(ZONE_CHANNELS):
+            qs = Event.objects.filter(
+                match_id__in=match_ids, x__isnull=False, y__isnull=False
+            )
+
+            if column > 0:
+                qs = qs.filter(x__gte=column * PITCH_MAX / ZONE_COLUMNS)
+            if column < ZONE_COLUMNS - 1:
+                qs = qs.filter(x__lt=(column + 1) * PITCH_MAX / ZONE_COLUMNS)
+            if channel > 0:
+                qs = qs.filter(y__gte=channel * PITCH_MAX / ZONE_CHANNELS)
+            if channel < ZONE_CHANNELS - 1:
+                qs = qs.filter(y__lt=(channel + 1) * PITCH_MAX / ZONE_CHANNELS)
+
+            qs.update(zone=column * ZONE_CHANNELS + channel)
+
+
+def rescale_statsbomb_coordinates(apps, schema_editor):
+    Event = apps.get_model("events", "Event")
+    PossessionChain = apps.get_model("events", "PossessionChain")
+    MatchMomentum = apps.get_model("events", "MatchMomentum")
+    PlayerMatchMetric = apps.get_model("players", "PlayerMatchMetric")
+
+    match_ids = legacy_statsbomb_matches(Event)
+    if not match_ids:
+        return
+
+    Event.objects.filter(match_id__in=match_ids).update(
+        x=F("x") * PITCH_MAX / SB_PITCH_LENGTH,
+        y=F("y") * PITCH_MAX / SB_PITCH_WIDTH,
+        end_x=F("end_x") * PITCH_MAX / SB_PITCH_LENGTH,
+        end_y=F("end_y") * PITCH_MAX / SB_PITCH_WIDTH,
+    )
+    fill_zones(Event, match_ids)
+
+    # Chains, xT / xG values, momentum and player metrics were all
+    # derived from the old scale
+    Event.objects.filter(match_id__in=match_ids).update(
+        xt_delta=None, xg=None
+    )
+    PossessionChain.objects.filter(match_id__in=match_ids).delete()
+    MatchMomentum.objects.filter(match_id__in=match_ids).delete()
+    PlayerMatchMetric.objects.filter(match_id__in=match_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0009_event_video_upload"),
+        ("players", "0002_player_match_metric"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            rescale_statsbomb_coordinates, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:12
+
+from django.db import migrations, models
+
+
+def drop_stored_series(apps, schema_editor):
+    # Series stored before periods were laid out separately mix stoppage
+    # time into the next period: match_momentum() rebuilds them lazily
+    MatchMomentum = apps.get_model("events", "MatchMomentum")
+    MatchMomentum.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("events", "0010_rescale_statsbomb_coordinates"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="matchmomentum",
+            name="period_starts",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.RunPython(drop_stored_series, migrations.RunPython.noop),
+    ]
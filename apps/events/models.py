@@ -1,6 +1,77 @@
 import uuid
 
-from django.db import models
+from django.db import models, router
+from django.db.models import Q
+
+from apps.events.bulk_load import (
+    batched,
+    copy_insert,
+    delete_rows,
+    supports_copy,
+)
+from apps.events.fields import CodedChoiceField
+from apps.events.zones import first_zone_beyond, zone_for
+
+
+class EventQuerySet(models.QuerySet):
+    """
+    Keeps the precomputed pitch zone in sync on inserts.
+    """
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        for obj in objs:
+            obj.zone = zone_for(obj.x, obj.y)
+        return super().bulk_create(objs, *args, **kwargs)
+
+    def bulk_load(self, objs, batch_size: int = 2000) -> int:
+        """
+        Insert a large number of events; returns the row count.
+
+        On PostgreSQL with psycopg 3 all rows go through one COPY FROM
+        STDIN stream, about ten times the throughput of batched INSERTs.
+        Other backends (SQLite) fall back to bulk_create in batches.
+        """
+
+        # self.db is the read database (a replica) unless set by using()
+        using = self._db or router.db_for_write(self.model)
+
+        if not supports_copy(using):
+            count = 0
+            for batch in batched(objs, batch_size):
+                self.using(using).bulk_create(batch)
+                count += len(batch)
+            return count
+
+        def with_zone(objs):
+            for obj in objs:
+                obj.zone = zone_for(obj.x, obj.y)
+                yield obj
+
+        return copy_insert(self.model, with_zone(objs), using)
+
+    def bulk_delete(self) -> int:
+        """
+        Delete the matching events in one statement; returns the count.
+
+        Like bulk_load, bypasses model signals: the caller detaches rows
+        that reference the events and invalidates derived match data.
+        """
+
+        return delete_rows(self, self._db or router.db_for_write(self.model))
+
+    def beyond_x(self, min_x: float):
+        """
+        Events with x >= min_x; the zone bound lets the
+        (match, team, zone, event_type) index narrow the scan first.
+
+        Events with x but no y have no zone: they are kept by x alone.
+        """
+
+        return self.filter(
+            Q(zone__gte=first_zone_beyond(min_x)) | Q(zone__isnull=True),
+            x__gte=min_x,
+        )
 
 
 class Event(models.Model):
@@ -13,6 +84,46 @@ class Event(models.Model):
         SHOT = "shot", "Shot"
         TURNOVER = "turnover", "Turnover"
         RECOVERY = "recovery", "Recovery"
+        GOAL = "goal", "Goal"
+        ASSIST = "assist", "Assist"
+        INTERCEPTION = "interception", "Interception"
+        TACKLE = "tackle", "Tackle"
+        CLEARANCE = "clearance", "Clearance"
+        PRESSURE = "pressure", "Pressure"
+        DUEL = "duel", "Duel"
+        FOUL = "foul", "Foul"
+        YELLOW_CARD = "yellow_card", "Yellow card"
+        RED_CARD = "red_card", "Red card"
+        CORNER = "corner", "Corner"
+        FREE_KICK = "free_kick", "Free kick"
+        PENALTY = "penalty", "Penalty"
+        CARRY = "carry", "Carry"
+
+    # Storage codes (stable: never renumber, only append)
+    TYPE_CODES = {
+        Type.PASS: 1,
+        Type.SHOT: 2,
+        Type.TURNOVER: 3,
+        Type.RECOVERY: 4,
+        Type.GOAL: 5,
+        Type.ASSIST: 6,
+        Type.INTERCEPTION: 7,
+        Type.TACKLE: 8,
+        Type.CLEARANCE: 9,
+        Type.PRESSURE: 10,
+        Type.DUEL: 11,
+        Type.FOUL: 12,
+        Type.YELLOW_CARD: 13,
+        Type.RED_CARD: 14,
+        Type.CORNER: 15,
+        Type.FREE_KICK: 16,
+        Type.PENALTY: 17,
+        Type.CARRY: 18,
+    }
+
+    # Derived ball movements, left out of count-based metrics (tempo,
+    # events per 90, EPI) whose scales predate them
+    UNCOUNTED_TYPES = [Type.CARRY]
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
 
@@ -34,9 +145,9 @@ class Event(models.Model):
         related_name="events",
     )
 
-    event_type = models.CharField(
-        max_length=20,
+    event_type = CodedChoiceField(
         choices=Type.choices,
+        codes=TYPE_CODES,
     )
 
     # Time context
@@ -59,6 +170,24 @@ class Event(models.Model):
         help_text="Y coordinate on pitch (0-100)",
     )
 
+    # End location of moving actions (pass / carry), same scale
+    end_x = models.FloatField(null=True, blank=True)
+    end_y = models.FloatField(null=True, blank=True)
+
+    # 18-zone pitch grid id (see apps.events.zones), set on insert
+    zone = models.PositiveSmallIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Pitch zone id (6 columns x 3 channels)",
+    )
+
+    # Expected-threat gain of the action (see analytics expected_threat)
+    xt_delta = models.FloatField(null=True, blank=True, editable=False)
+
+    # Shot quality (see analytics expected_goals), set for shots / goals
+    xg = models.FloatField(null=True, blank=True, editable=False)
+
     # CV / data confidence
     confidence = models.FloatField(
         null=True,
@@ -66,19 +195,39 @@ class Event(models.Model):
         help_text="Event confidence score (0.0–1.0)",
     )
 
+    # Source upload of video-detected events (None for feed data)
+    video_upload = models.ForeignKey(
+        "analytics.VideoUpload",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="events",
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = EventQuerySet.as_manager()
+
     class Meta:
         db_table = "events"
         ordering = ["timestamp_ms"]
         indexes = [
             models.Index(fields=["match", "event_type"]),
             models.Index(fields=["player"]),
+            models.Index(fields=["match", "team", "zone", "event_type"]),
         ]
 
     def __str__(self) -> str:
         return f"{self.event_type} @ {self.timestamp_ms}ms"
 
+    def save(self, *args, **kwargs):
+        self.zone = zone_for(self.x, self.y)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"x", "y"} & set(update_fields):
+            kwargs["update_fields"] = {*update_fields, "zone"}
+        super().save(*args, **kwargs)
+
     # Optional secondary participant (e.g. pass receiver)
     secondary_player = models.ForeignKey(
         "players.Player",
@@ -102,8 +251,143 @@ class Event(models.Model):
         FAIL = "fail", "Fail"
         UNKNOWN = "unknown", "Unknown"
 
-    outcome = models.CharField(
-        max_length=10,
+    OUTCOME_CODES = {
+        Outcome.UNKNOWN: 0,
+        Outcome.SUCCESS: 1,
+        Outcome.FAIL: 2,
+    }
+
+    outcome = CodedChoiceField(
         choices=Outcome.choices,
+        codes=OUTCOME_CODES,
         default=Outcome.UNKNOWN,
     )
+
+
+class PossessionChain(models.Model):
+    """
+    One uninterrupted team possession, segmented from ordered events.
+
+    Derived data: rebuilt from Event rows, never edited by hand.
+    """
+
+    class Outcome(models.TextChoices):
+        GOAL = "goal", "Goal"
+        SHOT = "shot", "Shot"
+        TURNOVER = "turnover", "Turnover"
+        PERIOD_END = "period_end", "Period end"
+        ONGOING = "ongoing", "Ongoing"
+
+    OUTCOME_CODES = {
+        Outcome.ONGOING: 0,
+        Outcome.GOAL: 1,
+        Outcome.SHOT: 2,
+        Outcome.TURNOVER: 3,
+        Outcome.PERIOD_END: 4,
+    }
+
+    match = models.ForeignKey(
+        "competitions.Match",
+        on_delete=models.CASCADE,
+        related_name="possession_chains",
+    )
+    team = models.ForeignKey(
+        "teams.Team",
+        on_delete=models.CASCADE,
+        related_name="possession_chains",
+    )
+
+    sequence = models.PositiveIntegerField(
+        help_text="Chain number within the match (0-based)"
+    )
+    period = models.PositiveSmallIntegerField()
+    start_ms = models.PositiveIntegerField()
+    end_ms = models.PositiveIntegerField(
+        help_text="Start of the next chain in the period, else last event"
+    )
+
+    events_count = models.PositiveSmallIntegerField()
+    passes_count = models.PositiveSmallIntegerField()
+
+    # Spatial progression (normalized pitch units)
+    start_x = models.FloatField(null=True, blank=True)
+    end_x = models.FloatField(null=True, blank=True)
+    distance = models.FloatField(
+        default=0.0,
+        help_text="Ball path length between consecutive team events",
+    )
+    zones_mask = models.PositiveIntegerField(
+        default=0,
+        help_text="Bit i set when pitch zone i was reached",
+    )
+
+    outcome = CodedChoiceField(
+        choices=Outcome.choices,
+        codes=OUTCOME_CODES,
+    )
+
+    class Meta:
+        db_table = "possession_chains"
+        ordering = ["match", "sequence"]
+        unique_together = ("match", "sequence")
+        indexes = [
+            models.Index(fields=["match", "team", "outcome"]),
+            models.Index(fields=["team", "match"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"Chain {self.sequence} ({self.outcome}) @ {self.start_ms}ms"
+
+    @property
+    def duration_ms(self) -> int:
+        return self.end_ms - self.start_ms
+
+    @property
+    def directness(self) -> float | None:
+        """
+        Forward progress per unit of ball travel (-1..1).
+        """
+
+        if self.start_x is None or self.end_x is None or not self.distance:
+            return None
+        return (self.end_x - self.start_x) / self.distance
+
+
+class MatchMomentum(models.Model):
+    """
+    Time-bucketed momentum series of one team in a match.
+
+    Derived data: each series is a packed little-endian array with one
+    value per `bucket_seconds` of match time, so overview charts load one
+    row per team instead of scanning events. Periods are laid out one
+    after another; `period_starts` maps each period to its first bucket.
+    """
+
+    match = models.ForeignKey(
+        "competitions.Match",
+        on_delete=models.CASCADE,
+        related_name="momentum",
+    )
+    team = models.ForeignKey(
+        "teams.Team",
+        on_delete=models.CASCADE,
+        related_name="momentum",
+    )
+
+    bucket_seconds = models.PositiveSmallIntegerField(default=60)
+    buckets = models.PositiveSmallIntegerField(default=0)
+    period_starts = models.JSONField(default=dict, blank=True)
+
+    # uint16 event counts / final-third entries, float32 xT per bucket
+    events = models.BinaryField()
+    final_third_entries = models.BinaryField()
+    xt = models.BinaryField()
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "match_momentum"
+        unique_together = ("match", "team")
+
+    def __str__(self) -> str:
+        return f"Momentum {self.match_id} / {self.team_id}"
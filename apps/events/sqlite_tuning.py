@@ -0,0 +1,43 @@
+from typing import Dict
+
+from django.conf import settings
+
+
+# PRAGMAs applied to every new SQLite connection unless overridden by
+# settings.SQLITE_PRAGMAS ({} turns the tuning off). The benchmarks'
+# "tuned" profile is this same dict.
+DEFAULT_SQLITE_PRAGMAS = {
+    # Readers no longer block on the importer's writer (and vice versa)
+    "journal_mode": "WAL",
+    # Safe with WAL: fsync at checkpoints, not at every commit
+    "synchronous": "NORMAL",
+    # Page cache in KiB when negative (64 MB)
+    "cache_size": -64000,
+    # Read the file through a memory map (256 MB)
+    "mmap_size": 256 * 1024 * 1024,
+    # Wait for a lock instead of failing with "database is locked"
+    "busy_timeout": 5000,
+    "temp_store": "MEMORY",
+}
+
+
+def sqlite_pragmas() -> Dict:
+    return getattr(settings, "SQLITE_PRAGMAS", DEFAULT_SQLITE_PRAGMAS)
+
+
+def apply_sqlite_pragmas(sender, connection, **kwargs) -> None:
+    """
+    connection_created receiver: tune new SQLite connections.
+    """
+
+    if connection.vendor != "sqlite":
+        return
+
+    pragmas = sqlite_pragmas()
+    if not pragmas:
+        return
+
+    # On the raw sqlite3 connection: not a query of whatever request or
+    # service call happened to open it (query budgets, instrumentation)
+    for name, value in pragmas.items():
+        connection.connection.execute(f"PRAGMA {name} = {value}")
@@ -1,3 +1,44 @@
+from django.core.exceptions import FieldError
 from django.test import TestCase
 
-# Create your tests here.
+from apps.analytics.sandbox.synthetic_league import generate_league
+from apps.events.models import Event
+
+
+# ============================================================
+# Event queries
+# ============================================================
+
+class EventQuerySetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        league = generate_league(seed=9, teams=2, events_per_match=200)
+        cls.match_id = league["match_ids"][0]
+
+    def test_beyond_x_matches_filtering_on_x(self):
+        events = Event.objects.filter(match_id=self.match_id)
+
+        self.assertEqual(
+            set(events.beyond_x(70.0).values_list("id", flat=True)),
+            set(events.filter(x__gte=70.0).values_list("id", flat=True)),
+        )
+
+    def test_beyond_x_keeps_events_without_zone(self):
+        event = Event.objects.filter(match_id=self.match_id).first()
+        Event.objects.filter(id=event.id).update(x=90.0, y=None, zone=None)
+
+        beyond = Event.objects.filter(match_id=self.match_id).beyond_x(80.0)
+
+        self.assertTrue(beyond.filter(id=event.id).exists())
+
+    def test_coded_fields_reject_text_lookups(self):
+        events = Event.objects.filter(match_id=self.match_id)
+
+        self.assertEqual(
+            events.filter(event_type="pass").count(),
+            events.filter(event_type__in=["pass"]).count(),
+        )
+        for lookup in ("startswith", "icontains", "gt"):
+            with self.subTest(lookup=lookup):
+                with self.assertRaises(FieldError):
+                    events.filter(**{f"event_type__{lookup}": "pa"})
@@ -0,0 +1,76 @@
+"""
+Pitch zones for normalized coordinates (0-100 on both axes).
+
+The pitch is split into an 18-zone grid: 6 columns along the length
+(x, own goal → opponent goal) by 3 channels across the width (y).
+Zone ids are numbered column-major, `zone = column * 3 + channel`, so
+every thirds / halves / "x beyond" filter is a contiguous zone range.
+"""
+
+import math
+from typing import List
+
+PITCH_MAX = 100.0
+
+ZONE_COLUMNS = 6
+ZONE_CHANNELS = 3
+ZONE_COUNT = ZONE_COLUMNS * ZONE_CHANNELS
+
+# Channels across the pitch
+LEFT, CENTRE, RIGHT = range(ZONE_CHANNELS)
+
+# Thirds along the pitch (two zone columns each)
+DEFENSIVE_THIRD, MIDDLE_THIRD, FINAL_THIRD = range(3)
+
+
+def zone_for(x: float | None, y: float | None) -> int | None:
+    """
+    Zone id of a pitch location (None when coordinates are missing).
+    """
+
+    if x is None or y is None:
+        return None
+
+    # Scale before dividing: 50 * 6 / 100 is exactly 3.0
+    column = int(x * ZONE_COLUMNS // PITCH_MAX)
+    channel = int(y * ZONE_CHANNELS // PITCH_MAX)
+
+    column = min(max(column, 0), ZONE_COLUMNS - 1)
+    channel = min(max(channel, 0), ZONE_CHANNELS - 1)
+
+    return column * ZONE_CHANNELS + channel
+
+
+def zone_column(zone: int) -> int:
+    return zone // ZONE_CHANNELS
+
+
+def zone_channel(zone: int) -> int:
+    return zone % ZONE_CHANNELS
+
+
+def zone_third(zone: int) -> int:
+    return zone_column(zone) // 2
+
+
+def third_zones(third: int) -> List[int]:
+    first = third * 2 * ZONE_CHANNELS
+    return list(range(first, first + 2 * ZONE_CHANNELS))
+
+
+def channel_zones(channel: int) -> List[int]:
+    return list(range(channel, ZONE_COUNT, ZONE_CHANNELS))
+
+
+def first_zone_beyond(min_x: float) -> int:
+    """
+    Lowest zone id that can contain locations with x >= min_x.
+    """
+
+    column = math.floor(min_x * ZONE_COLUMNS / PITCH_MAX)
+    column = min(max(column, 0), ZONE_COLUMNS - 1)
+    return column * ZONE_CHANNELS
+
+
+OPPONENT_HALF_ZONES = list(range(ZONE_COUNT // 2, ZONE_COUNT))
+OWN_HALF_ZONES = list(range(0, ZONE_COUNT // 2))
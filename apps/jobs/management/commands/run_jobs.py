@@ -0,0 +1,95 @@
+import os
+import socket
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connection
+
+from apps.jobs.queue import claim_jobs, requeue_stale_jobs, run_job
+
+
+def run_in_thread(job) -> bool:
+    try:
+        return run_job(job)
+    finally:
+        # Each worker thread owns a DB connection
+        connection.close()
+
+
+class Command(BaseCommand):
+    help = "Run queued background jobs (precomputation off the request path)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=2,
+            help="Jobs executed at the same time.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit when no job is due instead of polling.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=2.0,
+            help="Seconds to sleep when the queue is empty.",
+        )
+        parser.add_argument(
+            "--types",
+            nargs="*",
+            help="Only run these job types.",
+        )
+        parser.add_argument(
+            "--stale-minutes",
+            type=int,
+            default=30,
+            help="Requeue jobs running longer than this (dead workers).",
+        )
+
+    def handle(self, *args, **options):
+        concurrency = max(1, options["concurrency"])
+        worker = f"{socket.gethostname()}:{os.getpid()}"
+
+        requeued = requeue_stale_jobs(
+            timedelta(minutes=options["stale_minutes"])
+        )
+        if requeued:
+            self.stdout.write(f"Requeued {requeued} stale jobs")
+
+        done = failed = 0
+        running = set()
+
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            while True:
+                close_old_connections()
+
+                free = concurrency - len(running)
+                jobs = (
+                    claim_jobs(worker, free, options["types"]) if free else []
+                )
+                for job in jobs:
+                    running.add(pool.submit(run_in_thread, job))
+
+                if not running:
+                    if options["once"]:
+                        break
+                    time.sleep(options["poll_interval"])
+                    continue
+
+                finished, running = wait(
+                    running,
+                    timeout=options["poll_interval"],
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in finished:
+                    if future.result():
+                        done += 1
+                    else:
+                        failed += 1
+
+        self.stdout.write(f"Jobs done: {done}, failed: {failed}")
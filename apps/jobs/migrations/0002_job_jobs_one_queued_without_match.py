@@ -0,0 +1,39 @@
+# Generated by Django 6.0.1 on 2026-10-19 11:05
+
+from django.db import migrations, models
+
+
+def merge_queued_jobs_without_match(apps, schema_editor):
+    # Keep the most urgent queued job of each type; the others are the
+    # same work
+    Job = apps.get_model("jobs", "Job")
+
+    queued = Job.objects.filter(status="queued", match__isnull=True)
+    seen = set()
+    for job in queued.order_by("-priority", "run_after", "id"):
+        if job.job_type in seen:
+            job.delete()
+        else:
+            seen.add(job.job_type)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("competitions", "0003_matchteam_team_alter_matchteam_unique_together"),
+        ("jobs", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            merge_queued_jobs_without_match, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name="job",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("match__isnull", True), ("status", "queued")),
+                fields=("job_type",),
+                name="jobs_one_queued_without_match",
+            ),
+        ),
+    ]
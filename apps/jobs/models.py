@@ -0,0 +1,74 @@
+from django.db import models
+from django.db.models import Q
+from django.utils import timezone
+
+
+class Job(models.Model):
+    """
+    Background precomputation task, executed by `manage.py run_jobs`.
+
+    At most one queued job exists per (job_type, match), and per
+    job_type for jobs without a match: enqueueing the same work again
+    only raises its priority / moves it earlier.
+    """
+
+    class Status(models.TextChoices):
+        QUEUED = "queued", "Queued"
+        RUNNING = "running", "Running"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"
+
+    job_type = models.CharField(max_length=50)
+    match = models.ForeignKey(
+        "competitions.Match",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="jobs",
+    )
+    payload = models.JSONField(default=dict, blank=True)
+
+    priority = models.SmallIntegerField(
+        default=0,
+        help_text="Higher runs first",
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.QUEUED,
+    )
+
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=3)
+    run_after = models.DateTimeField(default=timezone.now)
+
+    locked_by = models.CharField(max_length=100, blank=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "jobs"
+        ordering = ["-priority", "run_after", "id"]
+        indexes = [
+            models.Index(fields=["status", "run_after", "priority"]),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["job_type", "match"],
+                condition=Q(status="queued"),
+                name="jobs_one_queued_per_match",
+            ),
+            # NULL matches never collide in the constraint above
+            models.UniqueConstraint(
+                fields=["job_type"],
+                condition=Q(status="queued", match__isnull=True),
+                name="jobs_one_queued_without_match",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.job_type} [{self.status}] {self.match_id or ''}"
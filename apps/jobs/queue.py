@@ -0,0 +1,223 @@
+import logging
+import traceback
+from datetime import timedelta
+from typing import Iterable, List
+from uuid import UUID
+
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Exists, F, OuterRef, Q
+from django.db.models.functions import Greatest, Least
+from django.db.models.lookups import IsNull
+from django.utils import timezone
+
+from apps.jobs.models import Job
+from apps.jobs.registry import get_job_handler
+
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================
+# CONSTANTS
+# ============================================================
+
+# Retry backoff: RETRY_BASE_SECONDS * 2 ** (attempts - 1)
+RETRY_BASE_SECONDS = 30
+
+
+# ============================================================
+# ENQUEUE
+# ============================================================
+
+def enqueue_job(
+    job_type: str,
+    match_id: UUID | None = None,
+    priority: int = 0,
+    delay_seconds: float = 0,
+    payload: dict | None = None,
+) -> Job:
+    """
+    Queue a job, merging with an already queued one for the same
+    (job_type, match): the merged job keeps the higher priority and the
+    earlier start.
+    """
+
+    run_after = timezone.now() + timedelta(seconds=delay_seconds)
+    queued = Job.objects.filter(
+        job_type=job_type, match_id=match_id, status=Job.Status.QUEUED
+    )
+
+    for _ in range(2):
+        if queued.update(
+            priority=Greatest(F("priority"), priority),
+            run_after=Least(F("run_after"), run_after),
+        ):
+            return queued.get()
+
+        try:
+            with transaction.atomic():
+                return Job.objects.create(
+                    job_type=job_type,
+                    match_id=match_id,
+                    priority=priority,
+                    run_after=run_after,
+                    payload=payload or {},
+                )
+        except IntegrityError:
+            # Queued concurrently by another process: merge into it
+            continue
+
+    return queued.get()
+
+
+def enqueue_on_commit(job_type: str, match_id: UUID | None = None, **kwargs):
+    """
+    Enqueue once the surrounding transaction commits.
+    """
+
+    transaction.on_commit(
+        lambda: enqueue_job(job_type, match_id, **kwargs)
+    )
+
+
+# ============================================================
+# CLAIM / COMPLETE
+# ============================================================
+
+def running_same_work():
+    """
+    Subquery: a running job of the outer job's (job_type, match).
+    """
+
+    return Exists(Job.objects.filter(
+        Q(match_id=OuterRef("match_id"))
+        | Q(match__isnull=True) & IsNull(OuterRef("match_id"), True),
+        job_type=OuterRef("job_type"),
+        status=Job.Status.RUNNING,
+    ))
+
+
+def claim_jobs(
+    worker: str,
+    limit: int,
+    job_types: Iterable[str] | None = None,
+) -> List[Job]:
+    """
+    Atomically move up to `limit` due jobs from queued to running.
+
+    A job whose (job_type, match) is still running elsewhere stays
+    queued: per-match handlers replace derived data and must not race.
+    """
+
+    now = timezone.now()
+    candidates = Job.objects.filter(
+        status=Job.Status.QUEUED, run_after__lte=now
+    ).exclude(running_same_work())
+    if job_types:
+        candidates = candidates.filter(job_type__in=list(job_types))
+
+    with transaction.atomic():
+        if connection.features.has_select_for_update_skip_locked:
+            candidates = candidates.select_for_update(skip_locked=True)
+
+        ids = list(
+            candidates
+            .order_by("-priority", "run_after", "id")
+            .values_list("id", flat=True)[:limit]
+        )
+
+        claimed = []
+        for job_id in ids:
+            # Conditional update: only one worker wins a job
+            if Job.objects.filter(
+                id=job_id, status=Job.Status.QUEUED
+            ).exclude(running_same_work()).update(
+                status=Job.Status.RUNNING,
+                locked_by=worker,
+                started_at=now,
+                attempts=F("attempts") + 1,
+            ):
+                claimed.append(job_id)
+
+    return list(Job.objects.filter(id__in=claimed).order_by("-priority", "id"))
+
+
+def complete_job(job: Job) -> None:
+    Job.objects.filter(id=job.id).update(
+        status=Job.Status.DONE,
+        finished_at=timezone.now(),
+        last_error="",
+    )
+
+
+def fail_job(job: Job, error: str) -> None:
+    """
+    Requeue with exponential backoff, or mark failed after max_attempts.
+    """
+
+    now = timezone.now()
+
+    if job.attempts < job.max_attempts:
+        delay = RETRY_BASE_SECONDS * 2 ** max(job.attempts - 1, 0)
+        try:
+            with transaction.atomic():
+                Job.objects.filter(id=job.id).update(
+                    status=Job.Status.QUEUED,
+                    run_after=now + timedelta(seconds=delay),
+                    last_error=error,
+                )
+            return
+        except IntegrityError:
+            # Same work was queued again meanwhile: that job will retry
+            pass
+
+    Job.objects.filter(id=job.id).update(
+        status=Job.Status.FAILED,
+        finished_at=now,
+        last_error=error,
+    )
+
+
+def run_job(job: Job) -> bool:
+    """
+    Execute one claimed job; returns True on success.
+    """
+
+    try:
+        handler = get_job_handler(job.job_type)
+        handler(job.match_id, **job.payload)
+    except Exception:
+        logger.exception("Job %s (%s) failed", job.id, job.job_type)
+        fail_job(job, traceback.format_exc(limit=20))
+        return False
+
+    complete_job(job)
+    return True
+
+
+def requeue_stale_jobs(older_than: timedelta) -> int:
+    """
+    Put back jobs left running by a worker that died.
+    """
+
+    stale = Job.objects.filter(
+        status=Job.Status.RUNNING,
+        started_at__lt=timezone.now() - older_than,
+    )
+
+    requeued = 0
+    for job_id in stale.values_list("id", flat=True):
+        try:
+            with transaction.atomic():
+                requeued += Job.objects.filter(id=job_id).update(
+                    status=Job.Status.QUEUED, locked_by=""
+                )
+        except IntegrityError:
+            # The same work is already queued again
+            Job.objects.filter(id=job_id).update(
+                status=Job.Status.FAILED,
+                finished_at=timezone.now(),
+                last_error="Superseded by a newer queued job",
+            )
+
+    return requeued
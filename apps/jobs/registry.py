@@ -0,0 +1,29 @@
+from typing import Callable, Dict
+
+
+# Handlers by job type: handler(match_id, **payload)
+JOB_HANDLERS: Dict[str, Callable] = {}
+
+
+def job_handler(job_type: str):
+    """
+    Register a function as the handler of a job type.
+
+    Apps register their handlers from AppConfig.ready(), so the worker
+    knows every type once Django is set up.
+    """
+
+    def register(func: Callable) -> Callable:
+        if job_type in JOB_HANDLERS and JOB_HANDLERS[job_type] is not func:
+            raise ValueError(f"Duplicate handler for job type {job_type}")
+        JOB_HANDLERS[job_type] = func
+        return func
+
+    return register
+
+
+def get_job_handler(job_type: str) -> Callable:
+    try:
+        return JOB_HANDLERS[job_type]
+    except KeyError:
+        raise LookupError(f"No handler registered for job type {job_type}")
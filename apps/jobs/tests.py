@@ -0,0 +1,77 @@
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.analytics.sandbox.synthetic_league import generate_league
+from apps.jobs.models import Job
+from apps.jobs.queue import claim_jobs, enqueue_job
+
+
+# ============================================================
+# Enqueue / claim
+# ============================================================
+
+class JobQueueTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        league = generate_league(seed=5, teams=2, events_per_match=10)
+        cls.match_id = league["match_ids"][0]
+        cls.other_match_id = league["match_ids"][1]
+
+    def test_enqueueing_same_work_merges_jobs(self):
+        first = enqueue_job("rebuild", self.match_id, delay_seconds=60)
+        second = enqueue_job("rebuild", self.match_id, priority=5)
+
+        self.assertEqual(first.id, second.id)
+        self.assertEqual(second.priority, 5)
+        self.assertLessEqual(second.run_after, timezone.now())
+        self.assertEqual(Job.objects.count(), 1)
+
+    def test_other_match_or_type_is_separate_work(self):
+        enqueue_job("rebuild", self.match_id)
+        enqueue_job("rebuild", self.other_match_id)
+        enqueue_job("fit", self.match_id)
+
+        self.assertEqual(Job.objects.count(), 3)
+
+    def test_claim_skips_work_running_elsewhere(self):
+        running = enqueue_job("rebuild", self.match_id)
+        self.assertEqual(claim_jobs("worker-1", limit=10), [running])
+
+        # Queued again while the first run is still going
+        queued = enqueue_job("rebuild", self.match_id)
+        other = enqueue_job("rebuild", self.other_match_id)
+
+        self.assertNotEqual(queued.id, running.id)
+        self.assertEqual(claim_jobs("worker-2", limit=10), [other])
+
+        Job.objects.filter(id=running.id).update(status=Job.Status.DONE)
+        self.assertEqual(claim_jobs("worker-2", limit=10), [queued])
+
+    def test_claim_takes_due_jobs_by_priority(self):
+        low = enqueue_job("rebuild", self.match_id)
+        high = enqueue_job("rebuild", self.other_match_id, priority=10)
+        enqueue_job("fit", self.match_id, delay_seconds=3600)
+
+        claimed = claim_jobs("worker-1", limit=10)
+
+        self.assertEqual(claimed, [high, low])
+        self.assertEqual(
+            {job.locked_by for job in claimed}, {"worker-1"}
+        )
+        self.assertEqual(
+            Job.objects.filter(status=Job.Status.QUEUED).count(), 1
+        )
+
+    def test_jobs_without_match_are_deduplicated(self):
+        first = enqueue_job("fit", delay_seconds=60)
+        second = enqueue_job("fit", priority=3)
+
+        self.assertEqual(first.id, second.id)
+        self.assertEqual(Job.objects.count(), 1)
+
+        self.assertEqual(claim_jobs("worker-1", limit=10), [second])
+        queued = enqueue_job("fit")
+        self.assertEqual(claim_jobs("worker-2", limit=10), [])
+
+        Job.objects.filter(id=second.id).update(status=Job.Status.DONE)
+        self.assertEqual(claim_jobs("worker-2", limit=10), [queued])
@@ -1,5 +1,6 @@
 from django.contrib import admin
-from .models import Player, Appearance
+from .models import Player, Appearance, PlayerMatchMetric
 
 admin.site.register(Player)
 admin.site.register(Appearance)
+admin.site.register(PlayerMatchMetric)
@@ -0,0 +1,76 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("competitions", "0003_matchteam_team_alter_matchteam_unique_together"),
+        ("players", "0001_initial"),
+        ("teams", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PlayerMatchMetric",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("match_date", models.DateField()),
+                ("minutes_played", models.PositiveSmallIntegerField(default=0)),
+                ("events", models.PositiveSmallIntegerField(default=0)),
+                ("passes", models.PositiveSmallIntegerField(default=0)),
+                ("shots", models.PositiveSmallIntegerField(default=0)),
+                ("goals", models.PositiveSmallIntegerField(default=0)),
+                ("assists", models.PositiveSmallIntegerField(default=0)),
+                ("tackles", models.PositiveSmallIntegerField(default=0)),
+                ("interceptions", models.PositiveSmallIntegerField(default=0)),
+                ("xg", models.FloatField(default=0.0)),
+                ("xt", models.FloatField(default=0.0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "match",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="player_metrics",
+                        to="competitions.match",
+                    ),
+                ),
+                (
+                    "player",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="match_metrics",
+                        to="players.player",
+                    ),
+                ),
+                (
+                    "team",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="player_metrics",
+                        to="teams.team",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "player_match_metrics",
+                "indexes": [
+                    models.Index(
+                        fields=["player", "match_date"],
+                        name="player_matc_player__8eb4af_idx",
+                    )
+                ],
+                "unique_together": {("player", "match")},
+            },
+        ),
+    ]
@@ -65,3 +65,53 @@ class Appearance(models.Model):
     class Meta:
         db_table = "appearances"
         unique_together = ("player", "match")
+
+
+class PlayerMatchMetric(models.Model):
+    """
+    Pre-aggregated metrics of a player in one match (trend source).
+
+    Derived data: refreshed from events whenever a match is imported.
+    """
+
+    player = models.ForeignKey(
+        "players.Player",
+        on_delete=models.CASCADE,
+        related_name="match_metrics",
+    )
+    match = models.ForeignKey(
+        "competitions.Match",
+        on_delete=models.CASCADE,
+        related_name="player_metrics",
+    )
+    team = models.ForeignKey(
+        "teams.Team",
+        on_delete=models.CASCADE,
+        related_name="player_metrics",
+    )
+
+    # Denormalized kickoff date: trends are range scans on (player, date)
+    match_date = models.DateField()
+    minutes_played = models.PositiveSmallIntegerField(default=0)
+
+    events = models.PositiveSmallIntegerField(default=0)
+    passes = models.PositiveSmallIntegerField(default=0)
+    shots = models.PositiveSmallIntegerField(default=0)
+    goals = models.PositiveSmallIntegerField(default=0)
+    assists = models.PositiveSmallIntegerField(default=0)
+    tackles = models.PositiveSmallIntegerField(default=0)
+    interceptions = models.PositiveSmallIntegerField(default=0)
+    xg = models.FloatField(default=0.0)
+    xt = models.FloatField(default=0.0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "player_match_metrics"
+        unique_together = ("player", "match")
+        indexes = [
+            models.Index(fields=["player", "match_date"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.player_id} @ {self.match_date}"
@@ -13,4 +13,6 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
 
+# Served by an ASGI server (e.g. uvicorn config.asgi:application) so the
+# live match stream can hold connections open without a thread each.
 application = get_asgi_application()
@@ -0,0 +1,197 @@
+# config/db_router.py
+
+"""
+Primary / read-replica routing for analytics reads.
+
+settings.DATABASE_REPLICAS lists DATABASES aliases that replicate
+"default". Reads made inside replica_reads() (analytics GET requests
+via ReplicaReadMiddleware) go to one of them; everything else, and
+every write, uses the primary.
+
+Read-your-writes stickiness:
+- once a context writes, its later reads stay on the primary; code
+  that reads in order to write (lazy rebuilds of derived data) calls
+  use_primary() before reading, so it never stores replica lag;
+- after any write (imports, jobs, POSTs) all replica reads go to the
+  primary for REPLICA_STICKY_SECONDS, the tolerated replication lag.
+  The mark lives in the default cache, so use a shared cache when
+  writers and web workers are separate processes.
+"""
+
+import contextlib
+import contextvars
+import random
+import time
+from dataclasses import dataclass
+from typing import Iterator, List
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+# ============================================================
+# CONSTANTS (defaults, overridable in settings)
+# ============================================================
+
+DEFAULT_REPLICA_STICKY_SECONDS = 10
+DEFAULT_REPLICA_READ_PATHS = ["/api/analytics/"]
+
+LAST_WRITE_CACHE_KEY = "db_router:last_write"
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+def replica_aliases() -> List[str]:
+    return list(getattr(settings, "DATABASE_REPLICAS", []))
+
+
+def sticky_seconds() -> int:
+    return getattr(
+        settings, "REPLICA_STICKY_SECONDS", DEFAULT_REPLICA_STICKY_SECONDS
+    )
+
+
+# ============================================================
+# DOMAIN: routing state of one request / job
+# ============================================================
+
+@dataclass
+class ReadRouting:
+    # Replica serving this context's reads (None: primary)
+    replica: str | None = None
+    # Wall-clock time of the last write mark published to the cache
+    marked_at: float = 0.0
+
+
+_routing: contextvars.ContextVar[ReadRouting | None] = contextvars.ContextVar(
+    "db_read_routing", default=None
+)
+
+# Write marks of code running outside any routing context (jobs, commands)
+_unrouted = ReadRouting()
+
+
+# ============================================================
+# INFRASTRUCTURE (write marks)
+# ============================================================
+
+def recently_written() -> bool:
+    last_write = cache.get(LAST_WRITE_CACHE_KEY)
+    return last_write is not None and (
+        time.time() - last_write < sticky_seconds()
+    )
+
+
+def mark_write(routing: ReadRouting) -> None:
+    """
+    Publish "the primary just changed" for the sticky window.
+
+    Re-published at most twice per window, not on every write.
+    """
+
+    now = time.time()
+    if now - routing.marked_at < sticky_seconds() / 2:
+        return
+
+    # Before the cache write: a database cache backend routes it here too
+    routing.marked_at = now
+    cache.set(LAST_WRITE_CACHE_KEY, now, timeout=sticky_seconds())
+
+
+# ============================================================
+# APPLICATION (context, router, middleware)
+# ============================================================
+
+@contextlib.contextmanager
+def replica_reads() -> Iterator[ReadRouting]:
+    """
+    Send the enclosed block's reads to a replica, when one is configured
+    and the primary has not been written within the sticky window.
+    """
+
+    replicas = replica_aliases()
+    replica = None
+    if replicas and not recently_written():
+        replica = random.choice(replicas)
+
+    token = _routing.set(ReadRouting(replica=replica))
+    try:
+        yield _routing.get()
+    finally:
+        _routing.reset(token)
+
+
+def use_primary() -> None:
+    """
+    Send the current context's remaining reads to the primary.
+    """
+
+    routing = _routing.get()
+    if routing is not None:
+        routing.replica = None
+
+
+@contextlib.contextmanager
+def primary_reads() -> Iterator[None]:
+    """
+    Pin the enclosed block's reads to the primary.
+    """
+
+    token = _routing.set(ReadRouting())
+    try:
+        yield
+    finally:
+        _routing.reset(token)
+
+
+class PrimaryReplicaRouter:
+    """
+    settings.DATABASE_ROUTERS entry; see the module docstring.
+    """
+
+    def db_for_read(self, model, **hints):
+        routing = _routing.get()
+        if routing is None:
+            return None
+        return routing.replica
+
+    def db_for_write(self, model, **hints):
+        # Read-your-writes for the rest of this context
+        use_primary()
+        routing = _routing.get()
+        if replica_aliases():
+            mark_write(routing if routing is not None else _unrouted)
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {"default", *replica_aliases()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas receive the schema through replication
+        if db in replica_aliases():
+            return False
+        return None
+
+
+class ReplicaReadMiddleware:
+    """
+    Safe-method requests under REPLICA_READ_PATHS read from a replica.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.path_prefixes = tuple(
+            getattr(settings, "REPLICA_READ_PATHS", DEFAULT_REPLICA_READ_PATHS)
+        )
+
+    def __call__(self, request):
+        if request.method not in SAFE_METHODS or not request.path.startswith(
+            self.path_prefixes
+        ):
+            return self.get_response(request)
+
+        with replica_reads():
+            return self.get_response(request)
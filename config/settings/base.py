@@ -43,6 +43,7 @@ INSTALLED_APPS = [
     "apps.players.apps.PlayersConfig",
     "apps.events.apps.EventsConfig",
     "apps.analytics.apps.AnalyticsConfig",
+    "apps.jobs.apps.JobsConfig",
     "corsheaders",
 
 ]
@@ -50,6 +51,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
+    "apps.analytics.instrumentation.QueryInstrumentationMiddleware",
+    "config.db_router.ReplicaReadMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -90,6 +93,20 @@ DATABASES = {
     }
 }
 
+# Read replicas: DATABASES aliases replicating "default" (give each
+# "TEST": {"MIRROR": "default"}). Analytics GET requests read from one of
+# them; writes, and reads within REPLICA_STICKY_SECONDS of any write,
+# use the primary. See config/db_router.py and settings/replicas.py.
+DATABASE_ROUTERS = ["config.db_router.PrimaryReplicaRouter"]
+DATABASE_REPLICAS = []
+REPLICA_STICKY_SECONDS = 10
+
+# Single-node SQLite tuning, applied to every new connection: WAL lets
+# API readers run while an import writes. Unset: the PRAGMAs of
+# apps.events.sqlite_tuning.DEFAULT_SQLITE_PRAGMAS; {} keeps SQLite's
+# defaults.
+# SQLITE_PRAGMAS = {}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -135,6 +152,39 @@ STATIC_URL = "static/"
 MEDIA_ROOT = BASE_DIR / "media"
 MEDIA_URL = "/media/"
 
+# Fitted analytics models (xT grid, xG coefficients). Kept out of
+# MEDIA_ROOT, which is served.
+MODEL_ARTIFACTS_ROOT = BASE_DIR / "model_artifacts"
+
+# Merging of repeated CV detections (see analytics event_dedup)
+VIDEO_EVENT_DEDUP = {
+    "WINDOW_MS": 800,  # same action: within this span of the first one
+    "MAX_DISTANCE": 5.0,  # ... and this close (normalized pitch units)
+    "MAX_LAG_MS": 5000,  # tolerated out-of-order detector output
+}
+
+# Per-request query / timing profiling of the analytics API: Server-Timing
+# headers and GET /api/analytics/instrumentation/stats/. Off: no overhead.
+ANALYTICS_INSTRUMENTATION = {
+    "ENABLED": False,
+    "SLOW_QUERIES": 5,  # slowest queries kept per request
+    "WINDOW": 500,  # requests kept per route for the stats endpoint
+}
+
+# @query_budget overruns in analytics services: "raise", "log" or "off".
+# Unset: raise in DEBUG, log otherwise. Tests always raise (TEST_RUNNER).
+ANALYTICS_QUERY_BUDGETS = {
+    # "MODE": "log",
+}
+
+TEST_RUNNER = "config.test_runner.QueryBudgetTestRunner"
+
+# Clip / thumbnail files handed to the front server (zero-copy, ranges).
+# nginx: {"HEADER": "X-Accel-Redirect", "URL_PREFIX": "/protected-media/"}
+# with an internal location aliased to MEDIA_ROOT; Apache: X-Sendfile.
+# Unset: Django streams the files itself.
+# MEDIA_SENDFILE = {"HEADER": "X-Accel-Redirect", "URL_PREFIX": "/protected-media/"}
+
 # FFmpeg path (optional - defaults to 'ffmpeg' in PATH)
 # Uncomment and set if ffmpeg is not in PATH
 # FFMPEG_PATH = "/Users/valijonrakhmatullaev/PyCharmMiscProject/ffmpeg_bin/ffmpeg"
@@ -0,0 +1,69 @@
+"""
+Production profile: PostgreSQL (see infra/docker/docker-compose.yml).
+
+DJANGO_SETTINGS_MODULE=config.settings.prod; connection and secrets
+come from the environment.
+"""
+
+import os
+
+from django.core.exceptions import ImproperlyConfigured
+
+from .base import *
+
+DEBUG = os.environ.get("DJANGO_DEBUG") == "1"
+
+# Never fall back to the insecure development key of base.py
+SECRET_KEY = os.environ.get("DJANGO_SECRET_KEY")
+if not SECRET_KEY:
+    raise ImproperlyConfigured("DJANGO_SECRET_KEY must be set in production")
+
+ALLOWED_HOSTS = [
+    host
+    for host in os.environ.get("DJANGO_ALLOWED_HOSTS", "localhost").split(",")
+    if host
+]
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": os.environ.get("POSTGRES_DB", "football_analytics"),
+        "USER": os.environ.get("POSTGRES_USER", "fa_user"),
+        "PASSWORD": os.environ.get("POSTGRES_PASSWORD", "fa_password"),
+        "HOST": os.environ.get("POSTGRES_HOST", "localhost"),
+        "PORT": os.environ.get("POSTGRES_PORT", "5432"),
+        # Persistent connections: reused across requests for this many
+        # seconds instead of one connect per request
+        "CONN_MAX_AGE": int(os.environ.get("DB_CONN_MAX_AGE", "60")),
+        # Drop a reused connection the server closed meanwhile
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {
+            "connect_timeout": 5,
+        },
+    }
+}
+
+# Alternative: a psycopg_pool connection pool per process (threaded
+# servers). The pool owns connection lifetime, so CONN_MAX_AGE must be 0.
+if os.environ.get("DB_POOL") == "1":
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"]["pool"] = {
+        "min_size": int(os.environ.get("DB_POOL_MIN_SIZE", "2")),
+        "max_size": int(os.environ.get("DB_POOL_MAX_SIZE", "10")),
+        "timeout": 10,
+    }
+
+# Read replicas: POSTGRES_REPLICA_HOSTS=replica1,replica2 (same database,
+# user and port as the primary)
+DATABASE_REPLICAS = []
+for number, host in enumerate(
+    filter(None, os.environ.get("POSTGRES_REPLICA_HOSTS", "").split(",")),
+    start=1,
+):
+    alias = f"replica_{number}"
+    DATABASES[alias] = {
+        **DATABASES["default"],
+        "HOST": host,
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(alias)
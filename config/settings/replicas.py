@@ -0,0 +1,17 @@
+"""
+Local read-replica profile: a second SQLite file plays the replica.
+
+DJANGO_SETTINGS_MODULE=config.settings.replicas
+manage.py migrate                 # primary only
+manage.py sync_sqlite_replicas    # "replication": copy primary -> replica
+"""
+
+from .dev import *
+
+DATABASES["replica"] = {
+    "ENGINE": "django.db.backends.sqlite3",
+    "NAME": BASE_DIR / "db.replica.sqlite3",
+    "TEST": {"MIRROR": "default"},
+}
+
+DATABASE_REPLICAS = ["replica"]
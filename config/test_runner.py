@@ -0,0 +1,29 @@
+# config/test_runner.py
+
+"""
+Test runner of the project (settings.TEST_RUNNER).
+
+Runs every test with ANALYTICS_QUERY_BUDGETS["MODE"] = "raise", so a
+service that runs more queries than its @query_budget fails the test
+whatever the settings module says.
+"""
+
+from django.conf import settings
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+
+class QueryBudgetTestRunner(DiscoverRunner):
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._query_budgets = override_settings(
+            ANALYTICS_QUERY_BUDGETS={
+                **getattr(settings, "ANALYTICS_QUERY_BUDGETS", {}),
+                "MODE": "raise",
+            }
+        )
+        self._query_budgets.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self._query_budgets.disable()
+        super().teardown_test_environment(**kwargs)
@@ -1,8 +1,10 @@
 export interface TrendPoint {
-  match_id: number;
+  match_id: string;
   match_date: string;
   value: number;
   minutes_played: number;
+  // Downsampled points: matches merged into this one
+  matches?: number;
 }
 
 export interface MetricTrend {